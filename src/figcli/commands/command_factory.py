@@ -25,6 +25,12 @@ from figgy.models.run_env import RunEnv
 from figcli.commands.figgy_context import FiggyContext
 from figcli.svcs.kms import KmsService
 from figcli.svcs.config import ConfigService
+from figcli.svcs.cache.config_cache_scanner import ConfigCacheScanner
+from figcli.svcs.cache.lazy_client import LazyClient
+from figcli.svcs.cache.replication_scanner import ReplicationScanner
+from figcli.svcs.config_deleter import ConfigDeleter
+from figcli.svcs.parameter_describer import ParameterDescriber
+from figcli.svcs.cache.storage import SqliteStorage
 from figcli.svcs.cache_manager import CacheManager
 from figcli.svcs.auth.provider.provider_factory import SessionProviderFactory
 from figcli.svcs.auth.provider.session_provider import SessionProvider
@@ -151,6 +157,31 @@ class CommandFactory(Factory):
         """
         return ConfigDao(self.__env_session().resource('dynamodb'))
 
+    def __config_cache_scanner(self) -> ConfigCacheScanner:
+        """
+        Returns a scanner for full refreshes of the remote config cache in the selected environment.
+        """
+        return ConfigCacheScanner(LazyClient(lambda: self.__env_session().client('dynamodb')))
+
+    def __replication_scanner(self) -> ReplicationScanner:
+        """
+        Returns a scanner for loading all replication configs in the selected environment.
+        """
+        return ReplicationScanner(LazyClient(lambda: self.__env_session().client('dynamodb')))
+
+    def __parameter_describer(self) -> ParameterDescriber:
+        """
+        Returns a describer of parameters by name in the selected environment.
+        """
+        return ParameterDescriber(LazyClient(lambda: self.__env_session().client('ssm')))
+
+    def __config_deleter(self) -> ConfigDeleter:
+        """
+        Returns a batch parameter deleter for the selected environment.
+        """
+        return ConfigDeleter(LazyClient(lambda: self.__env_session().client('ssm')), self.__repl(),
+                             self.__config_service())
+
     def __s3_resource(self):
         """
         Returns a hydrated boto3 S3 Resource for the mgmt account.
@@ -186,7 +217,8 @@ class CommandFactory(Factory):
     def __cache_mgr(self) -> CacheManager:
         """Builds a cache manager service for the specified resource."""
         if not self._cache_mgr:
-            self._cache_mgr: CacheManager = CacheManager(self._context.resource)
+            self._cache_mgr: CacheManager = CacheManager(self._context.resource,
+                                                         storage=SqliteStorage.for_cache(self._context.resource.name))
 
         return self._cache_mgr
 
@@ -194,7 +226,10 @@ class CommandFactory(Factory):
         """Returns a hydrated ConfigService."""
         if not self._config_svc:
             self._config_svc = ConfigService(self.__config(), self.__ssm(), self.__repl(),
-                                             self.__cache_mgr(), self.__kms(), self._context.run_env)
+                                             self.__cache_mgr(), self.__kms(), self._context.run_env,
+                                             cache_scanner=self.__config_cache_scanner(),
+                                             repl_scanner=self.__replication_scanner(),
+                                             describer=self.__parameter_describer())
 
         return self._config_svc
 
@@ -257,7 +292,8 @@ class CommandFactory(Factory):
 
             factory = ConfigFactory(self._context.command, context, self.__ssm(), self.__config_service(),
                                     self.__config(), self.__kms(), self.__s3_resource(), self._context.colors_enabled,
-                                    self.__rbac_config_view(), self.__audit(), self.__repl(), self.__session_manager())
+                                    self.__rbac_config_view(), self.__audit(), self.__repl(), self.__session_manager(),
+                                    self.__config_deleter())
 
         elif self._context.command in iam_commands and self._context.resource == iam:
             self.__init_sessions()
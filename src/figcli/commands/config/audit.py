@@ -1,5 +1,5 @@
 from figgy.data.dao.audit import AuditDao
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.config.commands import audit
 from figcli.commands.config_context import ConfigContext
@@ -16,7 +16,7 @@ class Audit(ConfigCommand):
     """
     Returns audit history for a queried PS Name
     """
-    def __init__(self, ssm_init: SsmDao, audit_init: AuditDao, config_completer_init: WordCompleter,
+    def __init__(self, ssm_init: SsmDao, audit_init: AuditDao, config_completer_init: ConfigNameCompleter,
                  colors_enabled: bool, config_context: ConfigContext):
         super().__init__(audit, colors_enabled, config_context)
         self._ssm = ssm_init
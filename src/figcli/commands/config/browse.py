@@ -1,6 +1,6 @@
 import curses
-from collections import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable
 
 import npyscreen
 from botocore.exceptions import ClientError
@@ -34,60 +34,31 @@ class Browse(ConfigCommand, npyscreen.NPSApp):
         self._config_view = config_view
         self.selected_ps_paths = []
         self.deleted_ps_paths = []
-        self.dirs = set()
         self._utils = Utils(colors_enabled)
         self._delete = delete_command
         self.prefix = context.prefix
 
-    def add_children(self, prefix: str, td_node: NPSTreeData, all_children: set = None,
-                     first_children: set = None):
+    def add_children(self, prefix: str, td_node: NPSTreeData):
         """
-        Looks up all children at `prefix` and recursively adds them to the TreeData node.
-        Adds all children to the TreeData node passed in, and recurses down the tree of children.
-
-        Once the original total lookup of all PS nodes is done, all_children and first_children are progressively
-        filtered and passed down with smaller data sets as the tree is built.
+        Adds the children one level below `prefix` to the TreeData node. Child directories are added collapsed, and
+        their own children are only looked up from the name index once they are first expanded.
         Args:
-            prefix: Prefix to query and built a tree from. I.E. /app
-            td_node: The node to append found first children too
-            all_children: List of ALL children of the passed in prefix's node.
-            first_children:  List of the FIRST children of the passed in prefix's node.
-                            (Immediate children, not grandchildren)
+            prefix: Full path of the node to add children to. I.E. /app
+            td_node: The node to append found children to
         """
-        with ThreadPoolExecutor(max_workers=10) as pool:
-            first_res = None
-            all_res = None
-            if first_children is None:
-                first_res = pool.submit(self._config_view.get_config_names, prefix=prefix, one_level=True)
-
-            if all_children is None:
-                all_res = pool.submit(self._config_view.get_config_names, prefix=prefix)
-
-            if first_res is not None:
-                first_children = set(first_res.result())
-
-            if all_res is not None:
-                all_children = set(all_res.result())
+        index = self._cfg_svc.get_name_index()
+        children = index.child_nodes(prefix)
+        child_dirs = sorted(child for child, nested in children.items() if nested)
 
-        diff_children = all_children.difference(first_children)
-        child_dirs = set(list(map(lambda x: f"{prefix}/{x.replace(f'{prefix}/', '', 1).split('/')[0]}", diff_children)))
-        self.dirs = self.dirs | child_dirs
+        for child in sorted(child for child in children if child in index):
+            td_node.newChild(content=child[len(prefix):], selectable=True, expanded=False)
 
-        for child in sorted(first_children):
-            child_name = child.replace(prefix, '', 1)
-            if child_name != '/':
-                td_node.newChild(content=child_name, selectable=True, expanded=False)
+        for child_dir in child_dirs:
+            td_node.newChild(content=child_dir[len(prefix):], selectable=False, expanded=False,
+                             load_children=partial(self.add_children, child_dir))
 
-        for child_dir in sorted(child_dirs):
-            child_name = child_dir.replace(prefix, '', 1)
-            if child_name != '/':
-                grand_children = set(list(filter(lambda x: x.startswith(f'{prefix}{child_name}/'), all_children)))
-                calculated_first_children = set(list(filter(
-                    lambda x: len(x.split('/')) == len(prefix.split('/')) + 2, grand_children)))
-
-                dir_node = td_node.newChild(content=child_dir.replace(prefix, '', 1), selectable=False, expanded=False)
-                self.add_children(child_dir, dir_node, all_children=grand_children,
-                                  first_children=calculated_first_children)
+    def is_dir(self, path: str) -> bool:
+        return self._cfg_svc.get_name_index().has_descendants(path)
 
     @AnonymousUsageTracker.track_command_usage
     def _browse(self):
@@ -108,42 +79,43 @@ class Browse(ConfigCommand, npyscreen.NPSApp):
             if e.response['Error']['Code'] == 'ParameterNotFound':
                 return
 
+        self._cfg_svc.invalidate([ps_name], deleted=True)
         print(f"{self.c.fg_gr}Deleted: {ps_name}{self.c.rs}")
 
     def _perform_deletions(self) -> None:
-        deleted = []  # type: List[str]
+        to_delete = []  # type: List[str]
         for path in self.deleted_ps_paths:
-            if path in self.dirs:
+            if self.is_dir(path):
                 all_children = set(list(map(lambda x: x['Name'],
                                             self._ssm.get_all_parameters([path], option='Recursive'))))
                 delete_children = Input.y_n_input(f"You have selected a DIRECTORY to delete: {path}. "
                                                   f"Do you want to delete ALL children of: {path}?", default_yes=False)
 
                 if delete_children:
-                    for child in all_children:
-                        if self._delete.delete_param(child):
-                            deleted.append(child)
-            else:
-                if path not in deleted:
-                    delete_it = Input.y_n_input(f"Delete {path}? ", default_yes=True)
+                    to_delete.extend(all_children)
+            elif path not in to_delete:
+                delete_it = Input.y_n_input(f"Delete {path}? ", default_yes=True)
 
-                    if delete_it:
-                        if self._delete.delete_param(path):
-                            deleted.append(path)
+                if delete_it:
+                    to_delete.append(path)
+
+        if to_delete:
+            self._delete.delete_params(to_delete)
 
     def _print_values(self) -> None:
         for path in self.selected_ps_paths:
-            if path in self.dirs:
+            if self.is_dir(path):
                 notify, selection = False, ''
                 print(f"\r\nIt appears you selected a directory: {path}.")
                 while not self._utils.is_valid_selection(selection, notify):
                     selection = input(f"Would you like to print values for all children of {path}? (Y/n): ")
                     selection = selection if selection != '' else 'y'
                 if selection.lower() == 'y':
-                    all_children = set(list(map(lambda x: x['Name'],
-                                                self._ssm.get_all_parameters([path], option='Recursive'))))
-                    for child in all_children:
-                        val, desc = self._get.get_val_and_desc(child)
+                    children = self._cfg_svc.get_parameters_with_descriptions_by_path(path)
+                    for child, (val, desc) in children.items():
+                        if val is None:
+                            # Unreadable, look it up alone so the user is told why.
+                            val, desc = self._get.get_val_and_desc(child)
                         self._print_val(child, val, desc)
             else:
                 val, desc = self._get.get_val_and_desc(path)
@@ -165,14 +137,29 @@ class SelectedValueBox(BoxTitle):
 class DeletableNPSTreeData(NPSTreeData):
     """
     Extends NPSTreeData class to add deleted property so we may mark individual nodes as deleted.
+
+    Also supports lazily loaded children. If `load_children` is set, the node is shown as having children, and
+    `load_children(node)` is called to add them the first time they are needed while the node is expanded.
     """
 
     def __init__(self, content=None, parent=None, selected=False, selectable=True,
-                 highlight=False, expanded=True, ignoreRoot=True, sort_function=None, deleted=False):
+                 highlight=False, expanded=True, ignoreRoot=True, sort_function=None, deleted=False,
+                 load_children: Callable[["DeletableNPSTreeData"], None] = None):
         super().__init__(content=content, parent=parent, selected=selected, selectable=selectable,
                          highlight=highlight, expanded=expanded, ignoreRoot=ignoreRoot,
                          sort_function=sort_function)
         self.deleted = deleted
+        self._load_children = load_children
+
+    def hasChildren(self):
+        return self._load_children is not None or super().hasChildren()
+
+    def getChildren(self):
+        if self._load_children is not None and self.expanded:
+            load_children, self._load_children = self._load_children, None
+            load_children(self)
+
+        return super().getChildren()
 
 
 class BrowseApp(NPSApp):
@@ -228,27 +215,19 @@ class BrowseApp(NPSApp):
         start = Utils.millis_since_epoch()
         children = []
         if self._browse.prefix:
-            prefix_child = td.newChild(content=self._browse.prefix, selectable=False, expanded=False)
+            # Validates the prefix is in an authorized namespace
+            self._config_view.get_config_names(prefix=self._browse.prefix, one_level=True)
+            prefix_child = td.newChild(content=self._browse.prefix, selectable=False, expanded=False,
+                                       load_children=partial(self._browse.add_children, self._browse.prefix))
             children = [prefix_child]
         else:
             log.info(f"--{prefix.name} missing, defaulting to normal browse tree.")
 
             for namespace in self._config_view.get_authorized_namespaces():
-                child = td.newChild(content=namespace, selectable=False, expanded=False)
+                child = td.newChild(content=namespace, selectable=False, expanded=False,
+                                    load_children=partial(self._browse.add_children, namespace))
                 children.append(child)
 
-        for child in children:
-            self._browse.dirs.add(child.getContent())
-
-        futures = []
-
-        with ThreadPoolExecutor(max_workers=10) as pool:
-            for child in children:
-                futures.append(pool.submit(self._browse.add_children, child.getContent(), child))
-
-        for future in as_completed(futures):
-            pass
-
         tree.values = td
         self._browse_box.edit()
         selection_objs = tree.get_selected_objects(return_node=True)
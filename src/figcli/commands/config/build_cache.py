@@ -1,6 +1,7 @@
 from figcli.commands.config_context import ConfigContext
 from figcli.commands.types.config import ConfigCommand
 from figcli.svcs.auth.session_manager import SessionManager
+from figcli.svcs.config import ConfigService
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.svcs.service_registry import ServiceRegistry
@@ -30,7 +31,7 @@ class BuildCache(ConfigCommand):
             for region in regions:
                 self._out.print(f"Building cache for Role: {role.role.role} and region: {region}")
                 env = GlobalEnvironment(role=role, region=region)
-                self._svc_registry.config_svc(env).get_parameter_names()
+                self._svc_registry.config_svc(env).get_parameter_names(max_staleness=ConfigService.FRESH)
 
     @VersionTracker.notify_user
     @AnonymousUsageTracker.track_command_usage
@@ -1,14 +1,18 @@
-from typing import List
+from typing import List, Iterable
 
 from botocore.exceptions import ClientError
 from figgy.data.dao.replication import ReplicationDao
 from prompt_toolkit import prompt
 from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.config.style.style import FIGGY_STYLE
 from figcli.config.commands import *
 from figcli.io.input import Input
 from figcli.io.output import Output
+from figcli.models.delete_report import DeleteReport
+from figcli.svcs.config import ConfigService
+from figcli.svcs.config_deleter import ConfigDeleter
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.utils.utils import Utils
@@ -24,11 +28,13 @@ class Delete(ConfigCommand):
 
     def __init__(self, ssm_init: SsmDao, cfg_view: RBACLimitedConfigView,
                  config_init: ConfigDao, repl_init: ReplicationDao, context: ConfigContext, colors_enabled: bool,
-                 config_completer: WordCompleter):
+                 config_completer: ConfigNameCompleter, deleter: ConfigDeleter, cfg_svc: ConfigService):
         super().__init__(delete, colors_enabled, context)
         self._ssm = ssm_init
+        self._cfg_svc = cfg_svc
         self._config = config_init
         self._repl = repl_init
+        self._deleter = deleter
         self._utils = Utils(colors_enabled)
         self._config_completer = config_completer
         self._out = Output(colors_enabled)
@@ -47,38 +53,16 @@ class Delete(ConfigCommand):
         repl_conf = self._repl.get_config_repl(key)  # type: ReplicationConfig
 
         if len(sources) > 0:
-            self._out.error(f"You're attempting to delete a key that is the source for at least one "
-                            f"replication config.\n[[{key}]] is actively replicating to these"
-                            f" destinations:\n")
-            for src in sources:
-                self._out.warn(f"Dest: [[{src.destination}]]. This config was created by [[{src.user}]]. ")
-
-            self._out.print(
-                f"\r\n[[{key}]] is a replication SOURCE. Deleting this source would effectively BREAK "
-                f"replication to the above printed destinations. You may NOT delete sources that are actively "
-                f"replicating. Please delete the above printed DESTINATIONS first. "
-                f"Once they have been deleted, you will be allowed to delete this "
-                f"SOURCE.")
+            self._print_source_error(key, sources)
             return False
         elif repl_conf is not None:
-            selection = "unselected"
-            while selection.lower() != "y" and selection.lower() != "n":
-                repl_msg = [
-                    (f'class:{self.c.rd}', f"{key} is an active replication destination created by "),
-                    (f'class:{self.c.bl}', f"{repl_conf.user}. "),
-                    (f'class:{self.c.rd}', f"Do you want to ALSO delete this replication config and "
-                                           f"permanently delete {key}? "),
-                    (f'class:', "(y/N): ")]
-                selection = prompt(repl_msg, completer=WordCompleter(['Y', 'N']), style=FIGGY_STYLE)
-                selection = selection if selection != '' else 'n'
-                if selection.strip().lower() == "y":
-                    self._repl.delete_config(key)
-                    self._ssm.delete_parameter(key)
-                    self._out.success(f"[[{key}]] and replication config destination deleted successfully.")
-                    return True
-                elif selection.strip().lower() == "n":
-                    return False
-
+            if self._confirm_destination_delete(key, repl_conf):
+                self._repl.delete_config(key)
+                self._ssm.delete_parameter(key)
+                self._cfg_svc.invalidate([key], deleted=True)
+                self._out.success(f"[[{key}]] and replication config destination deleted successfully.")
+                return True
+            return False
         else:
             try:
                 self._ssm.delete_parameter(key)
@@ -91,9 +75,83 @@ class Delete(ConfigCommand):
                 else:
                     raise
 
+            self._cfg_svc.invalidate([key], deleted=True)
             print(f"{self.c.fg_gr}{key} deleted successfully.{self.c.rs}\r\n")
             return True
 
+    def delete_params(self, keys: Iterable[str]) -> DeleteReport:
+        """
+        Safely deletes many keys at once, with the same rules as `delete_param`. Replication sources are never
+        deleted and the user is prompted for each replication destination. Everything else is deleted in batches
+        without further prompts, then a summary is printed.
+        Args:
+            keys: PS Names / Keys
+
+        Returns: DeleteReport - What was deleted, skipped, or could not be deleted.
+        """
+        plan = self._deleter.plan(keys)
+        skipped = []
+
+        for key, sources in plan.sources.items():
+            self._print_source_error(key, sources)
+            skipped.append(key)
+
+        to_delete = list(plan.plain)
+        for key, repl_conf in plan.destinations.items():
+            if self._confirm_destination_delete(key, repl_conf):
+                self._repl.delete_config(key)
+                to_delete.append(key)
+            else:
+                skipped.append(key)
+
+        report = self._deleter.delete(to_delete)
+        report.skipped = skipped
+        self._cfg_svc.invalidate(report.removed, deleted=True)
+
+        for key in report.removed:
+            self._config_completer.remove(key)
+
+        self._print_report(report)
+        return report
+
+    def _print_report(self, report: DeleteReport) -> None:
+        if report.removed:
+            self._out.success(f"Deleted [[{len(report.removed)}]] parameter(s).")
+        if report.skipped:
+            self._out.warn(f"Skipped [[{len(report.skipped)}]] parameter(s): {', '.join(report.skipped)}")
+        if report.denied:
+            self._out.error(f"You do not have permissions to delete [[{len(report.denied)}]] parameter(s): "
+                            f"{', '.join(report.denied)}")
+
+    def _print_source_error(self, key: str, sources: List[ReplicationConfig]) -> None:
+        self._out.error(f"You're attempting to delete a key that is the source for at least one "
+                        f"replication config.\n[[{key}]] is actively replicating to these"
+                        f" destinations:\n")
+        for src in sources:
+            self._out.warn(f"Dest: [[{src.destination}]]. This config was created by [[{src.user}]]. ")
+
+        self._out.print(
+            f"\r\n[[{key}]] is a replication SOURCE. Deleting this source would effectively BREAK "
+            f"replication to the above printed destinations. You may NOT delete sources that are actively "
+            f"replicating. Please delete the above printed DESTINATIONS first. "
+            f"Once they have been deleted, you will be allowed to delete this "
+            f"SOURCE.")
+
+    def _confirm_destination_delete(self, key: str, repl_conf: ReplicationConfig) -> bool:
+        selection = "unselected"
+        while selection.lower() != "y" and selection.lower() != "n":
+            repl_msg = [
+                (f'class:{self.c.rd}', f"{key} is an active replication destination created by "),
+                (f'class:{self.c.bl}', f"{repl_conf.user}. "),
+                (f'class:{self.c.rd}', f"Do you want to ALSO delete this replication config and "
+                                       f"permanently delete {key}? "),
+                (f'class:', "(y/N): ")]
+            selection = prompt(repl_msg, completer=WordCompleter(['Y', 'N']), style=FIGGY_STYLE)
+            selection = selection if selection != '' else 'n'
+            selection = selection.strip()
+
+        return selection.lower() == "y"
+
     def _delete_param(self):
         """
         Prompts user for a parameter name to delete, then deletes
@@ -105,8 +163,7 @@ class Delete(ConfigCommand):
             key = Input.input('PS Name to Delete: ', completer=self._config_completer)
             try:
                 if self.delete_param(key):
-                    if key in self._config_completer.words:
-                        self._config_completer.words.remove(key)
+                    self._config_completer.remove(key)
                 else:
                     continue
             except ClientError as e:
@@ -2,7 +2,7 @@ from prompt_toolkit.shortcuts import prompt
 from figcli.config import *
 from figgy.data.dao.ssm import SsmDao
 from figgy.data.dao.config import ConfigDao
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 from figcli.commands.types.config import ConfigCommand
 from figcli.commands.config_context import ConfigContext
 from figcli.config import *
@@ -16,7 +16,7 @@ class Dump(ConfigCommand):
     Allows users to dump PS K/V hierarchy into JSON, straight to the terminal, or to a file itself.
     """
 
-    def __init__(self, ssm_init: SsmDao, config_completer_init: WordCompleter, colors_enabled: bool,
+    def __init__(self, ssm_init: SsmDao, config_completer_init: ConfigNameCompleter, colors_enabled: bool,
                  context: ConfigContext):
         super().__init__(audit, colors_enabled, context)
         self._ssm = ssm_init
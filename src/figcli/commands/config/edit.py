@@ -5,12 +5,13 @@ from figcli.config import *
 from botocore.exceptions import ClientError
 from npyscreen import Form, MultiLineEdit, NPSApp, BoxTitle
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.commands.config_context import ConfigContext
 from figcli.commands.types.config import ConfigCommand
 from figgy.data.dao.ssm import SsmDao
 from figcli.io.input import Input
+from figcli.svcs.config import ConfigService
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.utils.utils import Utils
@@ -43,9 +44,10 @@ class EditApp(NPSApp):
 class Edit(ConfigCommand):
 
     def __init__(self, ssm_init: SsmDao, colors_enabled: bool, config_context: ConfigContext,
-                 config_view: RBACLimitedConfigView, config_completer: WordCompleter):
+                 config_view: RBACLimitedConfigView, config_completer: ConfigNameCompleter, cfg_svc: ConfigService):
         super().__init__(edit, colors_enabled, config_context)
         self._ssm = ssm_init
+        self._cfg_svc = cfg_svc
         self._config_view = config_view
         self._utils = Utils(colors_enabled)
         self._config_completer = config_completer
@@ -80,6 +82,7 @@ class Edit(ConfigCommand):
                 self._utils.error_exit("Invalid input detected, please resolve the issue and retry.")
 
             self._ssm.set_parameter(key, value, desc, parameter_type, key_id=kms_id)
+            self._cfg_svc.invalidate([key])
             print(f"{self.c.fg_gr}{key} saved successfully.{self.c.rs}")
         except ClientError as e:
             if "AccessDeniedException" == e.response['Error']['Code']:
@@ -1,7 +1,7 @@
 from typing import Tuple, Optional
 
 from botocore.exceptions import ClientError
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.commands.config_context import ConfigContext
 from figcli.commands.types.config import ConfigCommand
@@ -14,7 +14,7 @@ from figcli.utils.utils import *
 
 class Get(ConfigCommand):
 
-    def __init__(self, ssm_init: SsmDao, config_completer_init: WordCompleter,
+    def __init__(self, ssm_init: SsmDao, config_completer_init: ConfigNameCompleter,
                  colors_enabled: bool, config_context: ConfigContext):
         super().__init__(get, colors_enabled, config_context)
         self._ssm = ssm_init
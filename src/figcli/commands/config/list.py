@@ -1,11 +1,13 @@
 import curses
+import threading
 import weakref
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List as TList, Optional, Tuple
 
 import npyscreen
 from figgy.models.run_env import RunEnv
 from npyscreen import BoxTitle, MultiLine, TextCommandBox
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.commands.config.get import Get
 from figcli.commands.config_context import ConfigContext
@@ -17,12 +19,14 @@ from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.utils.utils import *
 from figcli.views.rbac_limited_config import RBACLimitedConfigView
 
+log = logging.getLogger(__name__)
+
 QUIT_CODES = [':q', 'quit', 'exit', ":wq", "q", "/quit", "/q"]
 
 
 class List(ConfigCommand):
 
-    def __init__(self, config_view: RBACLimitedConfigView, cfg: ConfigService, config_completer_init: WordCompleter,
+    def __init__(self, config_view: RBACLimitedConfigView, cfg: ConfigService, config_completer_init: ConfigNameCompleter,
                  colors_enabled: bool, config_context: ConfigContext, get: Get):
         super().__init__(list_com, colors_enabled, config_context)
         self._view = config_view
@@ -93,6 +97,26 @@ class SelectableMultiline(MultiLine):
     def set_select_callback(self, callback: Callable):
         self.select_callback = callback
 
+    def set_scroll_callback(self, callback: Callable[[TList[str]], None]):
+        """
+        `callback` is passed the values shown on screen, plus a screen's worth on either side, whenever the list is
+        scrolled to a new position.
+        """
+        self.scroll_callback = callback
+        self._last_scrolled_to = None
+
+    def update(self, clear=True):
+        super().update(clear=clear)
+
+        scroll_callback = getattr(self, 'scroll_callback', None)
+        values = self.values or []
+        position = (self.start_display_at, len(values))
+        if scroll_callback and position != self._last_scrolled_to:
+            self._last_scrolled_to = position
+            visible = len(self._my_widgets)
+            start = max(self.start_display_at - visible, 0)
+            scroll_callback(values[start:self.start_display_at + visible * 2])
+
     def h_select(self, ch):
         self.value = self.cursor_line
         self.select_callback(self.values[self.value])
@@ -196,6 +220,37 @@ class FiggyListForm(npyscreen.FormMuttActive):
         self.wMain.set_select_callback(self.update_value_box)
         self._cfg = cfg
 
+        # Values & descriptions of rows around the cursor, fetched in bulk in the background as the list scrolls.
+        self._prefetched: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._closed = threading.Event()
+        self.wMain.set_scroll_callback(self.prefetch)
+
+    def prefetch(self, ps_names: TList[str]) -> None:
+        missing = [name for name in ps_names if name not in self._prefetched]
+        if missing and not self._closed.is_set():
+            self._prefetch_pool.submit(self.__prefetch, missing)
+
+    def __prefetch(self, ps_names: TList[str]) -> None:
+        if self._closed.is_set():
+            return
+
+        try:
+            found = self._cfg.get_parameters_with_descriptions(ps_names)
+        except Exception as e:
+            log.warning(f"Unable to prefetch parameter values: {e}")
+            return
+
+        # Unreadable values are left out, so selecting them reports why through the regular lookup.
+        self._prefetched.update({name: (val, desc) for name, (val, desc) in found.items() if val is not None})
+
+    def close(self) -> None:
+        """
+        Stops prefetching once the form exits. Prefetches still queued are skipped rather than run on the way out.
+        """
+        self._closed.set()
+        self._prefetch_pool.shutdown(wait=False)
+
     def update_value_box(self, ps_name: str):
         """
         Lookup and update the value form when a user selects an item in the DisplayBox
@@ -204,7 +259,7 @@ class FiggyListForm(npyscreen.FormMuttActive):
         self.value_box.update()
 
         try:
-            val, desc, = self._cfg.get_parameter_with_description(ps_name)
+            val, desc, = self._prefetched.get(ps_name) or self._cfg.get_parameter_with_description(ps_name)
         except ParameterUndecryptable:
             val = "Undecryptable"
             desc = "You do not have access to decrypt this parameter."
@@ -276,4 +331,7 @@ class ListApp(npyscreen.NPSApp):
         F.wStatus2.value = "Filter: </search-query> <quit>"
         F.value.set_values(self._view.get_config_names())
         F.wMain.values = F.value.get()
-        F.edit()
+        try:
+            F.edit()
+        finally:
+            F.close()
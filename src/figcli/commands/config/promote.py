@@ -4,7 +4,7 @@ from botocore.exceptions import ClientError
 from figcli.config.commands import promote
 
 from figcli.config.constants import SSM_STRING
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.commands.config_context import ConfigContext
 from figcli.commands.types.config import ConfigCommand
@@ -21,7 +21,7 @@ from figcli.utils.utils import Utils
 
 class Promote(ConfigCommand):
 
-    def __init__(self, source_ssm: SsmDao, config_completer_init: WordCompleter,
+    def __init__(self, source_ssm: SsmDao, config_completer_init: ConfigNameCompleter,
                  colors_enabled: bool, config_context: ConfigContext, session_mgr: SessionManager):
         super().__init__(promote, colors_enabled, config_context)
         self.config_context = config_context
@@ -4,7 +4,7 @@ from figgy.data.dao.replication import ReplicationDao
 
 from figcli.config.commands import *
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 
 from figcli.config.constants import *
 from figcli.commands.config.delete import Delete
@@ -29,12 +29,12 @@ class Prune(ConfigCommand):
     """
 
     def __init__(self, ssm: SsmDao, ddb: ConfigDao, repl_dao: ReplicationDao, context: ConfigContext,
-                 config_completer_init: WordCompleter, colors_enabled: bool, delete: Delete, args=None):
+                 config_completer_init: ConfigNameCompleter, colors_enabled: bool, delete: Delete, args=None):
         super().__init__(prune, colors_enabled, context)
         self._ssm = ssm  # type: SsmDao
         self._config_dao = ddb  # type: ConfigDao
         self._repl = repl_dao
-        self._config_completer = config_completer_init  # type: WordCompleter
+        self._config_completer = config_completer_init  # type: ConfigNameCompleter
         self._utils = Utils(colors_enabled)
         self.example = f"{self.c.fg_bl}{CLI_NAME} config {self.command_printable} --env dev " \
             f"--config /path/to/figgy.json{self.c.rs}"
@@ -73,14 +73,19 @@ class Prune(ConfigCommand):
         # Find & Prune stray keys
         ps_keys = set(list(map(lambda x: x['Name'], self._ssm.get_all_parameters([self._namespace]))))
         ps_only_keys = ps_keys.difference(config_keys)
-        for key in ps_only_keys:
+        to_delete = []
+        for key in sorted(ps_only_keys):
             selection = Input.y_n_input(f"{key} exists in ParameterStore but does not exist "
                                         f"in your config, do you want to delete it?", default_yes=False)
 
             if selection:
-                self._delete_command.delete_param(key)
+                to_delete.append(key)
             else:
                 self._out.notify("OK, skipping due to user selection.")
+
+        if to_delete:
+            self._delete_command.delete_params(to_delete)
+
         if not ps_only_keys:
             print(f"{self.c.fg_bl}No stray keys found.{self.c.rs}")
 
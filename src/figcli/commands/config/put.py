@@ -12,6 +12,7 @@ from figcli.config import *
 from figcli.config.style.pygments.lexer import FigLexer, FiggyPygment
 from figcli.io.input import Input
 from figcli.io.output import Output
+from figcli.svcs.config import ConfigService
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.utils.utils import Utils
@@ -21,9 +22,10 @@ from figcli.views.rbac_limited_config import RBACLimitedConfigView
 class Put(ConfigCommand):
 
     def __init__(self, ssm_init: SsmDao, colors_enabled: bool, config_context: ConfigContext,
-                 config_view: RBACLimitedConfigView, get: Get):
+                 config_view: RBACLimitedConfigView, get: Get, cfg_svc: ConfigService):
         super().__init__(put, colors_enabled, config_context)
         self._ssm = ssm_init
+        self._cfg_svc = cfg_svc
         self._utils = Utils(colors_enabled)
         self._config_view = config_view
         self._get = get
@@ -100,8 +102,8 @@ class Put(ConfigCommand):
                 notify = True
 
                 self._ssm.set_parameter(key, value, desc, parameter_type, key_id=kms_id)
-                if key not in self._config_view.get_config_completer().words:
-                    self._config_view.get_config_completer().words.append(key)
+                self._cfg_svc.invalidate([key])
+                self._config_view.get_config_completer().add(key)
 
             except ClientError as e:
                 if "AccessDeniedException" == e.response['Error']['Code']:
@@ -9,7 +9,7 @@ from typing import List
 
 from botocore.exceptions import ClientError
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
+from figcli.io.config_name_completer import ConfigNameCompleter
 from tabulate import tabulate
 
 from figcli.commands.config.delete import Delete
@@ -23,6 +23,7 @@ from figgy.models.parameter_store_history import PSHistory
 from figgy.models.replication_config import ReplicationConfig
 from figgy.models.restore_config import RestoreConfig
 from figcli.svcs.kms import KmsService
+from figcli.svcs.config import ConfigService
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.utils.utils import Utils
@@ -40,8 +41,9 @@ class Restore(ConfigCommand):
             cfg_view: RBACLimitedConfigView,
             colors_enabled: bool,
             context: ConfigContext,
-            config_completer: WordCompleter,
-            delete: Delete
+            config_completer: ConfigNameCompleter,
+            delete: Delete,
+            cfg_svc: ConfigService
     ):
         super().__init__(restore, colors_enabled, context)
         self._config_context = context
@@ -55,6 +57,7 @@ class Restore(ConfigCommand):
         self._point_in_time = context.point_in_time
         self._config_completer = config_completer
         self._delete = delete
+        self._cfg_svc = cfg_svc
         self._out = Output(colors_enabled=colors_enabled)
 
     def _client_exception_msg(self, item: RestoreConfig, e: ClientError):
@@ -125,6 +128,7 @@ class Restore(ConfigCommand):
 
         try:
             self._ssm.set_parameter(item.ps_name, item.ps_value, item.ps_description, item.ps_type, key_id=key_id)
+            self._cfg_svc.invalidate([item.ps_name])
 
             current_value = self._ssm.get_parameter(item.ps_name)
             if current_value == item.ps_value:
@@ -215,6 +219,7 @@ class Restore(ConfigCommand):
                     if ssm_value != dynamo_value:
                         if ssm_value is not None:
                             self._ssm.delete_parameter(item.name)
+                            self._cfg_svc.invalidate([item.name], deleted=True)
 
                         for cfg in cfgs_before:
                             decrypted_value = self._decrypt_if_applicable(cfg)
@@ -226,6 +231,7 @@ class Restore(ConfigCommand):
 
                             self._ssm.set_parameter(cfg.ps_name, decrypted_value,
                                                     cfg.ps_description, cfg.ps_type, key_id=cfg.ps_key_id)
+                            self._cfg_svc.invalidate([cfg.ps_name])
                     else:
                         self._out.success(f"Config: {item.name} is current. Skipping.")
                 else:
@@ -11,6 +11,7 @@ from figcli.commands.types.config import ConfigCommand
 from figcli.config.commands import share
 from figcli.config.style.style import FIGGY_STYLE
 from figcli.io.output import Output
+from figcli.svcs.config import ConfigService
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
 from figcli.utils.utils import Utils
@@ -19,12 +20,13 @@ from figcli.utils.utils import Utils
 class Share(ConfigCommand):
 
     def __init__(self, ssm_init, repl_init: ReplicationDao,
-                 config_completer_init, colors_enabled: bool, config_context: ConfigContext):
+                 config_completer_init, colors_enabled: bool, config_context: ConfigContext, cfg_svc: ConfigService):
         super().__init__(share, colors_enabled, config_context)
 
         self._ssm = ssm_init
         self._repl = repl_init
         self._config_completer = config_completer_init
+        self._cfg_svc = cfg_svc
         self._utils = Utils(colors_enabled)
         self._out = Output(colors_enabled)
 
@@ -73,6 +75,7 @@ class Share(ConfigCommand):
             repl_config = ReplicationConfig(destination=dest, env_alias=self.run_env.env,
                                             namespace=namespace, source=key, type=ReplicationType.APP.value)
             self._repl.put_config_repl(repl_config)
+            self._cfg_svc.record_replication_configs([repl_config])
             self._out.success(f"[[{key}]] successfully shared.")
             to_continue = input(f"Share another? (y/N): ")
             to_continue = to_continue if to_continue != '' else 'n'
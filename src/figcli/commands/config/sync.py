@@ -1,5 +1,7 @@
+import glob
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import *
 
 from botocore.exceptions import ClientError
@@ -14,10 +16,14 @@ from figgy.data.dao.ssm import SsmDao
 from figcli.extras.key_utils import KeyUtils
 from figcli.io.output import Output
 from figcli.io.input import Input
+from figcli.models.sync_plan import SyncAction, SyncOperation, SyncPlan
 from figgy.models.replication_config import ReplicationConfig, ReplicationType
 from figcli.config import *
+from figcli.config.tuning import SYNC_MAX_THREADS
+from figcli.svcs.config import ConfigService
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
+from figcli.svcs.sync_snapshot import SyncSnapshot
 from figcli.utils.utils import Utils
 
 
@@ -29,8 +35,10 @@ class Sync(ConfigCommand):
     """
 
     def __init__(self, ssm_init: SsmDao, config_init: ConfigDao, repl_dao: ReplicationDao, colors_enabled: bool,
-                 context: ConfigContext, get: Get, put: Put):
+                 context: ConfigContext, get: Get, put: Put, cfg_svc: ConfigService,
+                 snapshot: Optional[SyncSnapshot] = None):
         super().__init__(sync, colors_enabled, context)
+        self._colors_enabled = colors_enabled
         self._config = config_init
         self._ssm = ssm_init
         self._repl = repl_dao
@@ -42,8 +50,14 @@ class Sync(ConfigCommand):
                        f"--env dev --config /path/to/config{self.c.rs}"
         self._get: Get = get
         self._put: Put = put
+        self._cfg_svc = cfg_svc
         self._FILE_PREFIX = "file://"
         self._out = Output(colors_enabled)
+        self._snapshot = snapshot if snapshot else SyncSnapshot(ssm_init, repl_dao)
+        self._plan_path = context.plan_path
+        self._apply_path = context.apply_path
+        self._planned: List[SyncOperation] = []
+        self._planned_names: Set[str] = set()
 
     def _input_config_values(self, config_keys: Set[str]) -> None:
         """
@@ -57,15 +71,18 @@ class Sync(ConfigCommand):
 
         count = 0
         for key in config_keys:
-            try:
-                if not self._get.get(key):
-                    self._out.warn(f"Fig: [[{key}]] missing from PS in environment: [[{self.run_env}]].")
-                    self._put.put_param(key=key, display_hints=False)
-                    count = count + 1
-                else:
-                    validate_msg(key)
-            except ClientError:
+            if self._snapshot.exists(key) or self._snapshot.is_denied(key):
                 validate_msg(key)
+            elif self._plan_path:
+                self._out.warn(f"Fig: [[{key}]] missing from PS in environment: [[{self.run_env}]]. "
+                               f"You will be prompted for its value on apply.")
+                self._planned.append(SyncOperation(action=SyncAction.ADD_FIG, name=key))
+                self._planned_names.add(key)
+            else:
+                self._out.warn(f"Fig: [[{key}]] missing from PS in environment: [[{self.run_env}]].")
+                self._put.put_param(key=key, display_hints=False)
+                self._snapshot.recheck([key])
+                count = count + 1
 
         if count:
             self._out.success(f"[[{count}]] {'value' if count == 1 else 'values'} added successfully")
@@ -81,7 +98,7 @@ class Sync(ConfigCommand):
         self._out.notify(f"Checking for stray config names.")
 
         # Find & Prune stray keys
-        ps_keys = set(list(map(lambda x: x['Name'], self._ssm.get_all_parameters([config_namespace]))))
+        ps_keys = self._snapshot.names_under(config_namespace)
         ps_only_keys = ps_keys.difference(all_keys)
 
         UNUSED_CONFIG_DETECTED = f"%%red%%The following Names were found in PS but are not referenced in your configurations. \n" \
@@ -110,6 +127,8 @@ class Sync(ConfigCommand):
                                                                              type=ReplicationType(REPL_TYPE_APP),
                                                                              run_env=self.run_env,
                                                                              namespace=namespace)
+        # (config to write, remote config it replaces)
+        writes: List[Tuple[ReplicationConfig, Optional[ReplicationConfig]]] = []
         for l_cfg in local_configs:
             # Namespace will be missing for --replication-only syncs. Otherwise, with standard syncs, namespace is passed
             # as a parameter here.
@@ -122,32 +141,79 @@ class Sync(ConfigCommand):
                 self.errors_detected = True
                 continue
 
-            remote_cfg = self._repl.get_config_repl(l_cfg.destination)
+            remote_cfg = self.__replication_config(l_cfg.destination)
 
             # Should never happen, except when someone manually deletes source / destination without going through CLI
-            missing_from_ps = self.__get_param_encrypted(l_cfg.source) is None
+            missing_from_ps = not self.__exists(l_cfg.source)
 
             if not remote_cfg or remote_cfg != l_cfg or missing_from_ps:
-                try:
-                    if self._can_replicate_from(l_cfg.source) and not remote_cfg or missing_from_ps:
-                        self._repl.put_config_repl(l_cfg)
-                        self._out.print(f"[[Replication added:]] {l_cfg.source} -> {l_cfg.destination}")
-                    elif self._can_replicate_from(l_cfg.source) and remote_cfg:
-                        self._repl.put_config_repl(l_cfg)
-                        self._out.notify(f"Replication updated.")
-                        self._out.warn(f"Removed: {remote_cfg.source} -> {remote_cfg.destination}")
-                        self._out.success(f"Added: {l_cfg.source} -> {l_cfg.destination}")
-                    else:
-                        self._errors_detected = True
-                        # print(f"{self.c.fg_rd}You do not have permission to configure replication from source:"
-                        #       f"{self.c.rs} {key}")
-                except ClientError:
-                    self._utils.validate(False, f"Error detected when attempting to store replication config "
-                                                f"for {l_cfg.destination}")
+                if self._can_replicate_from(l_cfg.source) and not remote_cfg or missing_from_ps:
+                    writes.append((l_cfg, None))
+                elif self._can_replicate_from(l_cfg.source) and remote_cfg:
+                    writes.append((l_cfg, remote_cfg))
+                else:
                     self._errors_detected = True
+                    # print(f"{self.c.fg_rd}You do not have permission to configure replication from source:"
+                    #       f"{self.c.rs} {key}")
             else:
                 self._out.success(f"Replication Validated: [[{l_cfg.source} -> {l_cfg.destination}]]")
 
+        if self._plan_path:
+            for l_cfg, remote_cfg in writes:
+                self.__plan_replication(l_cfg, REPL_TYPE_APP, replaces=remote_cfg)
+            return
+
+        errors = self.__put_configs([l_cfg for l_cfg, _ in writes])
+        for (l_cfg, remote_cfg), error in zip(writes, errors):
+            if error:
+                self._utils.validate(False, f"Error detected when attempting to store replication config "
+                                            f"for {l_cfg.destination}")
+                self._errors_detected = True
+            elif not remote_cfg:
+                self._out.print(f"[[Replication added:]] {l_cfg.source} -> {l_cfg.destination}")
+            else:
+                self._out.notify(f"Replication updated.")
+                self._out.warn(f"Removed: {remote_cfg.source} -> {remote_cfg.destination}")
+                self._out.success(f"Added: {l_cfg.source} -> {l_cfg.destination}")
+
+    def __replication_config(self, destination: str) -> Optional[ReplicationConfig]:
+        if self._snapshot.covers(destination):
+            return self._snapshot.replication_config(destination)
+
+        return self._repl.get_config_repl(destination)
+
+    def __plan_replication(self, config: ReplicationConfig, replication_type: str,
+                           replaces: Optional[ReplicationConfig] = None) -> None:
+        self._planned.append(SyncOperation(action=SyncAction.PUT_REPLICATION, name=config.destination,
+                                           source=config.source, namespace=config.namespace,
+                                           replication_type=replication_type))
+        self._out.print(f"[[Replication planned:]] {config.source} -> {config.destination}")
+        if replaces:
+            self._out.warn(f"Replaces: {replaces.source} -> {replaces.destination}")
+
+    def __put_configs(self, configs: List[ReplicationConfig]) -> List[Optional[ClientError]]:
+        """
+        Stores replication configs concurrently.
+        :return: The error each write failed with, if any, in the same order as `configs`.
+        """
+        if not configs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(SYNC_MAX_THREADS, len(configs))) as pool:
+            errors = list(pool.map(self.__put_config, configs))
+
+        self._cfg_svc.record_replication_configs(config for config, error in zip(configs, errors) if error is None)
+        return errors
+
+    def __put_config(self, config: ReplicationConfig) -> Optional[ClientError]:
+        try:
+            self._repl.put_config_repl(config)
+        except ClientError as e:
+            return e
+
+        self._snapshot.put_config(config)
+        return None
+
     def _notify_of_data_repl_orphans(self, config_repl: Dict) -> None:
         """
         Notify user of detected stray replication configurations when using the --replication-only flag.
@@ -157,7 +223,7 @@ class Sync(ConfigCommand):
         notify = False
         for repl in config_repl:
             namespace = self._utils.parse_namespace(config_repl[repl])
-            remote_cfgs = self._repl.get_all_configs(namespace)
+            remote_cfgs = self._snapshot.configs_under(namespace)
 
             if remote_cfgs:
                 for cfg in remote_cfgs:
@@ -190,7 +256,7 @@ class Sync(ConfigCommand):
 
         self._sync_repl_configs(config_repl, namespace=namespace)
         self._out.notify(f"\nChecking for stray replication configurations.")
-        remote_cfgs = self._repl.get_all_configs(namespace)
+        remote_cfgs = self._snapshot.configs_under(namespace)
         notify = True
         if remote_cfgs:
             for cfg in remote_cfgs:
@@ -246,27 +312,34 @@ class Sync(ConfigCommand):
             namespace: namespace for app
         """
         self._out.notify("Validating replication for all merge keys.")
+        writes: List[ReplicationConfig] = []
         for key in config_merge:
             self._validate_merge_keys(key, config_merge[key], namespace)
 
-            config = self._repl.get_config_repl(key)
+            config = self.__replication_config(key)
             if not config or (config.source != config_merge[key]):
-                try:
-                    repl_config = ReplicationConfig(destination=key, run_env=self.run_env, namespace=namespace,
-                                                    source=config_merge[key], type=ReplicationType(REPL_TYPE_MERGE))
-                    self._repl.put_config_repl(repl_config)
-                except ClientError:
-                    self._utils.validate(False, f"Error detected when attempting to store replication config for {key}")
-                    self._errors_detected = True
+                writes.append(ReplicationConfig(destination=key, run_env=self.run_env, namespace=namespace,
+                                                source=config_merge[key], type=ReplicationType(REPL_TYPE_MERGE)))
             else:
                 self._out.success(f"Merge key replication config validated: [[{key}]]")
 
+        if self._plan_path:
+            for repl_config in writes:
+                self.__plan_replication(repl_config, REPL_TYPE_MERGE)
+            return
+
+        for repl_config, error in zip(writes, self.__put_configs(writes)):
+            if error:
+                self._utils.validate(False, f"Error detected when attempting to store replication config for "
+                                            f"{repl_config.destination}")
+                self._errors_detected = True
+
     def _validate_expected_names(self, all_names: Set, repl_conf: Dict, merge_conf: Dict):
         self._out.notify(f"Validating shared keys exist.")
         print_resolution_message = False
         merged_confs = {**repl_conf, **merge_conf}
         for name in all_names:
-            if self.__get_param_encrypted(name) is None:
+            if not self.__exists(name):
                 awaiting_repl = False
                 for cnf in merged_confs:
                     if name == cnf or name in list(repl_conf.values()):
@@ -289,36 +362,24 @@ class Sync(ConfigCommand):
             self._out.success("Shared keys have been validated.")
 
     def _can_replicate_from(self, source: str):
-        try:
-            if self.__get_param_encrypted(source) is not None:
-                return True
-            else:
-                self._out.warn(f"Replication source: [[{source}]] is missing from ParameterStore. "
-                      f"It must be added before config replication can be configured.\n")
-                self._input_config_values({source})
-                return True
-        except ClientError as e:
-            denied = "AccessDeniedException" == e.response['Error']['Code']
-            if denied and "AWSKMS; Status Code: 400;" in e.response['Error']['Message']:
-                self._out.error(f"You do not have access to decrypt the value of Name: [[{source}]]")
-            elif denied:
-                self._out.error(f"You do not have access to Parameter: [[{source}]]")
-            else:
-                raise
-        return False
+        if self.__exists(source):
+            return True
+        else:
+            self._out.warn(f"Replication source: [[{source}]] is missing from ParameterStore. "
+                  f"It must be added before config replication can be configured.\n")
+            self._input_config_values({source})
+            return True
 
-    def __get_param_encrypted(self, source: str) -> Optional[str]:
-        try:
-             return self._ssm.get_parameter_encrypted(source)
-        except ClientError as e:
-            denied = "AccessDeniedException" == e.response['Error']['Code']
-            if denied and "AWSKMS; Status Code: 400;" in e.response['Error']['Message']:
-                self._out.error(f"You do not have access to decrypt the value of Name: [[{source}]]")
-                return None
-            elif denied:
-                self._utils.error_exit(f"You do not have access to Parameter: {source}")
-            else:
-                raise
+    def __exists(self, name: str) -> bool:
+        # Figs a plan will add are treated as present, they are prompted for on apply.
+        if name in self._planned_names:
+            return True
+
+        exists = self._snapshot.exists(name)
+        if self._snapshot.is_denied(name):
+            self._utils.error_exit(f"You do not have access to Parameter: {name}")
+
+        return exists
 
     def _validate_replication_config(self, config_repl: Dict, app_conf: bool = True):
         """
@@ -346,7 +407,7 @@ class Sync(ConfigCommand):
             Notifies the user if there is a parameter that has been shared into their namespace by an outside party
             but they have not added it to the `shared_figs` block of their figgy.json
         """
-        all_repl_cfgs = self._repl.get_all_configs(namespace)
+        all_repl_cfgs = self._snapshot.configs_under(namespace)
         for cfg in all_repl_cfgs:
             in_merge_conf = self._in_merge_value(cfg.destination, merge_conf)
 
@@ -401,11 +462,12 @@ class Sync(ConfigCommand):
 
         return repl_copy
 
-    def run_ci_sync(self) -> None:
+    def _parse_ci_config(self) -> Tuple[str, Set[str], Set[str], Dict, Dict, Set[str]]:
         """
-            Orchestrates a standard `sync` command WITHOUT The `--replication-only` flag set.
+        Validates & parses the figgy.json at the configured path.
+        :return: namespace, config keys, shared names, replication config (with the repl_from block merged in),
+            merge config and every name the configuration expects to exist.
         """
-        # Validate & parse figgy.json
         config = self._utils.get_ci_config(self._config_path)
         shared_names = set(self._utils.get_config_key_safe(SHARED_KEY, config, default=[]))
         repl_conf = self._utils.get_config_key_safe(REPLICATION_KEY, config, default={})
@@ -413,11 +475,22 @@ class Sync(ConfigCommand):
         merge_conf = self._utils.get_config_key_safe(MERGE_KEY, config, default={})
         config_keys = set(self._utils.get_config_key_safe(CONFIG_KEY, config, default=[]))
         namespace = self._utils.get_namespace(config)
-        merge_keys = set(merge_conf.keys())
         all_keys = KeyUtils.find_all_expected_names(config_keys, shared_names, merge_conf, repl_conf,
                                                     repl_from_conf, namespace)
 
         repl_conf = KeyUtils.merge_repl_and_repl_from_blocks(repl_conf, repl_from_conf, namespace)
+        return namespace, config_keys, shared_names, repl_conf, merge_conf, all_keys
+
+    def run_ci_sync(self) -> None:
+        """
+            Orchestrates a standard `sync` command WITHOUT The `--replication-only` flag set.
+        """
+        # Validate & parse figgy.json
+        namespace, config_keys, shared_names, repl_conf, merge_conf, all_keys = self._parse_ci_config()
+
+        # Read all remote state up front, everything below is compared against this snapshot.
+        self._snapshot.load([namespace], all_keys | set(repl_conf.keys()))
+
         # Add missing config values
         self._out.notify(f"Validating all configuration keys exist in ParameterStore.")
         self._input_config_values(config_keys)
@@ -446,6 +519,63 @@ class Sync(ConfigCommand):
         # validate expected keys exist
         self._validate_expected_names(all_keys, repl_conf, merge_conf)
 
+    def _config_paths(self) -> List[str]:
+        """
+        Expands --config into the figgy.json files it refers to. It may be a single file, a directory to search for
+        figgy.json files, or a glob.
+        """
+        pattern = self._config_path
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, '**', FIGGY_JSON_FILE_NAME)
+
+        if not any(char in pattern for char in '*?['):
+            return [pattern]
+
+        paths = sorted(glob.glob(pattern, recursive=True))
+        self._utils.validate(len(paths) > 0, f"No {FIGGY_JSON_FILE_NAME} files found at: {self._config_path}")
+        return paths
+
+    def __for_config(self, config_path: str) -> "Sync":
+        """
+        A Sync of a single figgy.json that shares this sync's snapshot & plan.
+        """
+        service = Sync(self._ssm, self._config, self._repl, self._colors_enabled, self.context, self._get, self._put,
+                       self._cfg_svc, snapshot=self._snapshot)
+        service._config_path = config_path
+        service._planned = self._planned
+        service._planned_names = self._planned_names
+        return service
+
+    def run_multi_sync(self, config_paths: List[str]) -> None:
+        """
+        Orchestrates a standard `sync` of many figgy.json files, e.g. every service in a monorepo. The remote state of
+        all services is read concurrently into one shared snapshot, then each service is synced against it in turn.
+        Services are not synced concurrently, even with --plan, they print as they go and may prompt for missing figs.
+        """
+        services = [self.__for_config(path) for path in config_paths]
+        namespaces, names = [], set()
+        for service in services:
+            namespace, _, _, repl_conf, _, all_keys = service._parse_ci_config()
+            namespaces.append(namespace)
+            names |= all_keys | set(repl_conf.keys())
+
+        self._out.notify(f"Reading remote configuration for [[{len(services)}]] services.")
+        self._snapshot.load(namespaces, names)
+
+        for service in services:
+            print()
+            self._out.notify_h2(f"Syncing: {service._config_path}")
+            service.run_ci_sync()
+
+        print()
+        self._out.print_h2("Sync report")
+        for service in services:
+            if service._errors_detected:
+                self._out.error(f"[[{service._config_path}]] has errors.")
+                self._errors_detected = True
+            else:
+                self._out.success(f"[[{service._config_path}]] is in sync.")
+
     def run_repl_sync(self) -> None:
         """
         Orchestrates sync when the user passes in the `--replication-only` flag.
@@ -456,17 +586,80 @@ class Sync(ConfigCommand):
 
         repl_conf = self._fill_repl_conf_variables(repl_conf)
         self._validate_replication_config(repl_conf, app_conf=False)
+        self._snapshot.load([self._utils.parse_namespace(dest) for dest in repl_conf.values()], repl_conf.keys())
         self._sync_repl_configs(repl_conf)
         self._notify_of_data_repl_orphans(repl_conf)
 
+    def write_plan(self) -> None:
+        """
+        Writes the operations recorded while running sync with `--plan`, along with a hash of the remote state they
+        were computed from.
+        """
+        plan = SyncPlan(env=self.run_env.env, namespaces=self._snapshot.namespaces,
+                        names=self._snapshot.checked_names, snapshot_hash=self._snapshot.digest(),
+                        operations=self._planned)
+
+        with open(self._plan_path, "w") as file:
+            file.write(plan.json(indent=2))
+
+        print()
+        self._out.notify(f"[[{len(plan.operations)}]] {'change' if len(plan.operations) == 1 else 'changes'} "
+                         f"planned. Plan written to: [[{self._plan_path}]]")
+
+    def run_apply(self) -> None:
+        """
+        Orchestrates `sync --apply`. Makes only the changes listed in a plan written by `sync --plan`, and only if the
+        remote state the plan was computed from has not changed since.
+        """
+        self._utils.validate(os.path.exists(self._apply_path), f"Path {self._apply_path} is invalid. "
+                                                               f"That file does not exist.")
+        plan = SyncPlan.parse_file(self._apply_path)
+        self._utils.validate(plan.env == self.run_env.env, f"The plan at {self._apply_path} was created for "
+                                                           f"environment: {plan.env}, not: {self.run_env.env}.")
+
+        self._snapshot.load(plan.namespaces, plan.names)
+        self._utils.validate(self._snapshot.digest() == plan.snapshot_hash,
+                             f"Remote configuration has changed since the plan at {self._apply_path} was created. "
+                             f"Re-run sync with --{sync_plan.name} to create a new plan.")
+
+        for op in plan.operations:
+            if op.action == SyncAction.ADD_FIG:
+                self._out.warn(f"Fig: [[{op.name}]] missing from PS in environment: [[{self.run_env}]].")
+                self._put.put_param(key=op.name, display_hints=False)
+
+        configs = [ReplicationConfig(destination=op.name, run_env=self.run_env, namespace=op.namespace,
+                                     source=op.source, type=ReplicationType(op.replication_type))
+                   for op in plan.operations if op.action == SyncAction.PUT_REPLICATION]
+
+        for repl_config, error in zip(configs, self.__put_configs(configs)):
+            if error:
+                self._utils.validate(False, f"Error detected when attempting to store replication config for "
+                                            f"{repl_config.destination}")
+                self._errors_detected = True
+            else:
+                self._out.print(f"[[Replication stored:]] {repl_config.source} -> {repl_config.destination}")
+
     @VersionTracker.notify_user
     @AnonymousUsageTracker.track_command_usage
     def execute(self):
         print()
-        if self._replication_only:
+        self._utils.validate(not (self._plan_path and self._apply_path),
+                             f"--{sync_plan.name} and --{sync_apply.name} cannot be used together.")
+
+        if self._apply_path:
+            self.run_apply()
+        elif self._replication_only:
             self.run_repl_sync()
         else:
-            self.run_ci_sync()
+            config_paths = self._config_paths()
+            if len(config_paths) > 1:
+                self.run_multi_sync(config_paths)
+            else:
+                self._config_path = config_paths[0]
+                self.run_ci_sync()
+
+        if self._plan_path:
+            self.write_plan()
 
         if self._errors_detected:
             self._out.error_h2('Sync failed. Please address the outputted errors.')
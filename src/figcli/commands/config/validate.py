@@ -1,30 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+
+from tabulate import tabulate
+
 from figcli.commands.config_context import ConfigContext
 from figcli.commands.types.config import ConfigCommand
 from figcli.config import *
 from figgy.data.dao.ssm import SsmDao
 from figcli.extras.key_utils import KeyUtils
 from figcli.io.output import Output
+from figcli.models.assumable_role import AssumableRole
+from figcli.svcs.auth.session_manager import SessionManager
 from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
 from figcli.svcs.observability.version_tracker import VersionTracker
+from figcli.ui.models.global_environment import GlobalEnvironment
 from figcli.utils.utils import Utils
 
 
 class Validate(ConfigCommand):
 
-    def __init__(self, ssm_init: SsmDao, colors_enabled: bool, context: ConfigContext):
+    def __init__(self, ssm_init: SsmDao, colors_enabled: bool, context: ConfigContext, session_mgr: SessionManager):
         super().__init__(validate, colors_enabled, context)
         self._ssm = ssm_init
+        self._session_mgr = session_mgr
         self._config_path = context.ci_config_path if context.ci_config_path else Utils.find_figgy_json()
         self._utils = Utils(colors_enabled)
         self._replication_only = context.replication_only
+        self._all_envs = context.all_envs
         self._errors_detected = False
         self.example = f"{self.c.fg_bl}{CLI_NAME} config {self.command_printable} " \
                        f"--env dev --config /path/to/config{self.c.rs}"
         self._FILE_PREFIX = "file://"
         self._out = Output(colors_enabled)
 
-    def _validate(self):
-        missing_key = False
+    def _expected_names(self) -> Tuple[str, Set[str]]:
+        """
+        :return: The namespace of the figgy.json being validated, and every name it expects to exist.
+        """
         config = self._utils.get_ci_config(self._config_path)
         shared_names = set(self._utils.get_config_key_safe(SHARED_KEY, config, default=[]))
         repl_conf = self._utils.get_config_key_safe(REPLICATION_KEY, config, default={})
@@ -34,12 +46,16 @@ class Validate(ConfigCommand):
         namespace = self._utils.get_namespace(config)
         all_names = KeyUtils.find_all_expected_names(config_keys, shared_names, merge_conf, repl_conf,
                                                      repl_from_conf, namespace)
+        return namespace, set(all_names)
 
-        all_params = self._ssm.get_all_parameters([namespace])
+    @staticmethod
+    def _param_names(ssm: SsmDao, namespace: str) -> Set[str]:
+        return set(param['Name'] for param in ssm.get_all_parameters([namespace]))
 
-        all_param_names = []
-        for param in all_params:
-            all_param_names.append(param['Name'])
+    def _validate(self):
+        missing_key = False
+        namespace, all_names = self._expected_names()
+        all_param_names = self._param_names(self._ssm, namespace)
 
         print()
         for name in all_names:
@@ -55,7 +71,55 @@ class Validate(ConfigCommand):
         else:
             self._out.success(f"\nSuccess! All figs have been located in the [[{self.run_env}]] ParameterStore!")
 
+    def _env_roles(self) -> List[AssumableRole]:
+        """
+        :return: The role matching the selected role in each environment it may be assumed in, ordered by environment.
+        """
+        roles: Dict[str, AssumableRole] = {}
+        for role in self.context.defaults.assumable_roles:
+            if role.role == self.context.role:
+                roles[role.run_env.env] = role
+
+        return [roles[env] for env in sorted(roles)]
+
+    def _validate_all_envs(self):
+        namespace, all_names = self._expected_names()
+        roles = self._env_roles()
+        self._utils.validate(len(roles) > 0, f"Role: {self.context.role} cannot be assumed in any environment.")
+        envs = [role.run_env.env for role in roles]
+
+        # Sessions are created one at a time as hydrating them may prompt for MFA. Clients are thread-safe.
+        clients = [SsmDao(self._session_mgr.get_session(GlobalEnvironment(role=role,
+                                                                          region=self.context.defaults.region),
+                                                        prompt=False).client('ssm'))
+                   for role in roles]
+
+        self._out.notify(f"\nValidating [[{len(all_names)}]] figs in [[{len(envs)}]] environments: "
+                         f"[[{', '.join(envs)}]]")
+        with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+            found = list(pool.map(lambda ssm: self._param_names(ssm, namespace), clients))
+
+        missing = {env: all_names - names for env, names in zip(envs, found)}
+        missing_names = sorted(set().union(*missing.values()))
+
+        if missing_names:
+            print()
+            print(tabulate(
+                [[name] + ['missing' if name in missing[env] else '' for env in envs] for name in missing_names],
+                headers=['Fig'] + envs,
+                tablefmt="grid",
+                stralign="left",
+            ))
+            print("\n")
+            self._utils.error_exit(f"{MISSING_PS_NAME_MESSAGE}")
+        else:
+            self._out.success(f"\nSuccess! All figs have been located in the ParameterStore of every environment: "
+                              f"[[{', '.join(envs)}]]!")
+
     @VersionTracker.notify_user
     @AnonymousUsageTracker.track_command_usage
     def execute(self):
-        self._validate()
+        if self._all_envs:
+            self._validate_all_envs()
+        else:
+            self._validate()
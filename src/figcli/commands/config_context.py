@@ -26,12 +26,15 @@ class ConfigContext(CommandContext):
         self.out_file = Utils.attr_if_exists(out, args)
         self.prefix = Utils.attr_if_exists(prefix, args)
         self.service = Utils.attr_if_exists(service, args)
+        self.plan_path = Utils.attr_if_exists(sync_plan, args)
+        self.apply_path = Utils.attr_if_exists(sync_apply, args)
 
         # Flags like --prompt that are unset or set to true
         self.repl = Utils.is_set_true(replication_only, args)
         self.manual = Utils.is_set_true(manual, args)
         self.point_in_time = Utils.is_set_true(point_in_time, args)
         self.all_profiles = Utils.is_set_true(all_profiles, args)
+        self.all_envs = Utils.is_set_true(all_envs, args)
         self.skip_upgrade = Utils.is_set_true(skip_upgrade, args)
         self.replication_only = Utils.is_set_true(replication_only, args)
         self.point_in_time = Utils.is_set_true(point_in_time, args)
@@ -19,6 +19,7 @@ from figcli.commands.config.validate import Validate
 from figcli.commands.config_context import ConfigContext
 from figcli.commands.factory import Factory
 from figcli.svcs.config import ConfigService
+from figcli.svcs.config_deleter import ConfigDeleter
 from figcli.svcs.kms import KmsService
 from figcli.svcs.auth.session_manager import SessionManager
 from figcli.views.rbac_limited_config import RBACLimitedConfigView
@@ -34,7 +35,7 @@ class ConfigFactory(Factory):
     def __init__(self, command: CliCommand, context: ConfigContext, ssm: SsmDao, config_svc: ConfigService,
                  cfg: ConfigDao, kms: KmsService, s3_resource: ServiceResource, colors_enabled: bool,
                  config_view: RBACLimitedConfigView, audit: AuditDao, repl: ReplicationDao,
-                 session_manager: SessionManager):
+                 session_manager: SessionManager, config_deleter: ConfigDeleter):
 
         self._command: CliCommand = command
         self._config_context: ConfigContext = context
@@ -51,6 +52,7 @@ class ConfigFactory(Factory):
         self._args = context.args
         self._config_completer = self._config_view.get_config_completer()
         self._session_manager = session_manager
+        self._config_deleter = config_deleter
 
     def instance(self):
         return self.get(self._command)
@@ -58,19 +60,21 @@ class ConfigFactory(Factory):
     def get(self, command: CliCommand):
         if command == sync:
             return Sync(self._ssm, self._config, self._repl, self._colors_enabled, self._config_context, self.get(get),
-                        self.get(put))
+                        self.get(put), self._cfg_svc)
         elif command == prune:
             return Prune(self._ssm, self._config, self._repl, self._config_context, self._config_completer,
                            self._colors_enabled, self.get(delete), args=self._args)
         elif command == put:
-            return Put(self._ssm, self._colors_enabled, self._config_context, self._config_view, self.get(get))
+            return Put(self._ssm, self._colors_enabled, self._config_context, self._config_view, self.get(get),
+                       self._cfg_svc)
         elif command == delete:
             return Delete(self._ssm, self._config_view, self._config, self._repl, self._config_context,
-                          self._colors_enabled, self._config_completer)
+                          self._colors_enabled, self._config_completer, self._config_deleter, self._cfg_svc)
         elif command == get:
             return Get(self._ssm, self._config_completer, self._colors_enabled, self._config_context)
         elif command == share:
-            return Share(self._ssm, self._repl, self._config_completer, self._colors_enabled, self._config_context)
+            return Share(self._ssm, self._repl, self._config_completer, self._colors_enabled, self._config_context,
+                         self._cfg_svc)
         elif command == list_com:
             return FigList(self._config_view, self._cfg_svc, self._config_completer, self._colors_enabled,
                            self._config_context, self.get(get))
@@ -84,16 +88,17 @@ class ConfigFactory(Factory):
         elif command == restore:
             return Restore(self._ssm, self._kms, self._config, self._repl, self._audit,
                            self._config_view, self._colors_enabled,
-                           self._config_context, self._config_completer, self.get(delete))
+                           self._config_context, self._config_completer, self.get(delete), self._cfg_svc)
         elif command == promote:
             return Promote(self._ssm, self._config_completer, self._colors_enabled,
                            self._config_context, self._session_manager)
         elif command == edit:
-            return Edit(self._ssm, self._colors_enabled, self._config_context, self._config_view, self._config_completer)
+            return Edit(self._ssm, self._colors_enabled, self._config_context, self._config_view, self._config_completer,
+                        self._cfg_svc)
         elif command == generate:
             return Generate(self._colors_enabled, self._config_context)
         elif command == validate:
-            return Validate(self._ssm, self._colors_enabled, self._config_context)
+            return Validate(self._ssm, self._colors_enabled, self._config_context, self._session_manager)
         elif command == build_cache:
             return BuildCache(self._session_manager, self._colors_enabled, self._config_context)
         else:
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from figcli.commands.maintenance_context import MaintenanceContext
+from figcli.commands.types.maintenance import MaintenanceCommand
+from figcli.config import *
+from figcli.io.output import Output
+from figcli.svcs.cache.janitor import CacheJanitor, CacheCompactionReport, CacheUsage
+from figcli.svcs.config import ConfigService
+from figcli.svcs.observability.anonymous_usage_tracker import AnonymousUsageTracker
+from tabulate import tabulate
+
+
+class CompactCache(MaintenanceCommand):
+    """
+    Drives the --compact-cache command
+    """
+
+    def __init__(self, maintenance_context: MaintenanceContext, config_service: Optional[ConfigService]):
+        super().__init__(compact_cache, maintenance_context.defaults.colors_enabled, maintenance_context)
+        self._janitor = CacheJanitor()
+        self._out = Output(colors_enabled=maintenance_context.defaults.colors_enabled)
+
+    @staticmethod
+    def _size(usage: CacheUsage) -> str:
+        return f'{usage.bytes / 1024 / 1024:.2f} MB'
+
+    def compact(self):
+        self._out.notify(f'Compacting local cache at: [[{CACHE_DIR}]]')
+        report: CacheCompactionReport = self._janitor.run()
+
+        print(tabulate(
+            [
+                ['Before', self._size(report.before), report.before.entries],
+                ['After', self._size(report.after), report.after.entries],
+                ['Budget', f'{report.max_bytes / 1024 / 1024:.2f} MB', report.max_entries],
+            ],
+            headers=['', 'Size', 'Entries'],
+            tablefmt="grid",
+            numalign="center",
+            stralign="left",
+        ))
+
+        self._out.success(f'Dropped [[{report.expired}]] expired and evicted [[{report.evicted}]] least recently used '
+                          f'cache entries.')
+
+    @AnonymousUsageTracker.track_command_usage
+    def execute(self):
+        self.compact()
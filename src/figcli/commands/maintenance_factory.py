@@ -2,6 +2,7 @@ from typing import Optional
 
 from figcli.commands.factory import Factory
 from figcli.commands.figgy_context import FiggyContext
+from figcli.commands.help.compact_cache import CompactCache
 from figcli.commands.help.upgrade import Upgrade
 from figcli.commands.help.version import Version
 from figcli.commands.maintenance_context import MaintenanceContext
@@ -29,6 +30,8 @@ class MaintenanceFactory(Factory):
             return Version(self._context, self._config)
         elif upgrade in self._options:
             return Upgrade(self._context, self._config)
+        elif compact_cache in self._options:
+            return CompactCache(self._context, self._config)
         else:
             self._utils.error_exit(f"{command.name} is not a valid command. You must select from: "
                                    f"[{CollectionUtils.printable_set(help_commands)}]. Try using --help for more info.")
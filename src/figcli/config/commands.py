@@ -44,12 +44,16 @@ out = CliCommand('out')
 skip_upgrade = CliCommand('skip-upgrade')
 service = CliCommand('service')
 debug = CliCommand('debug')
+cache_stats = CliCommand('cache-stats')
 copy_from = CliCommand('copy-from')
 generate = CliCommand('generate')
 from_path = CliCommand('from')
 validate = CliCommand('validate')
 profile = CliCommand('profile')
 build_cache = CliCommand('build-cache')
+sync_plan = CliCommand('plan')
+sync_apply = CliCommand('apply')
+all_envs = CliCommand('all-envs')
 
 # IAM sub commands
 export = CliCommand('export')
@@ -74,6 +78,7 @@ store_true = 'store_true'
 # help commands
 sandbox = CliCommand('sandbox')
 upgrade = CliCommand('upgrade')
+compact_cache = CliCommand('compact-cache')
 
 # Maps CLI `--options` for each argument, and sets flags if necessary
 arg_options = {
@@ -94,6 +99,7 @@ arg_options = {
             env: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         delete: {
@@ -102,6 +108,7 @@ arg_options = {
             env: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         get: {
@@ -111,6 +118,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         list_com: {
@@ -120,6 +128,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         put: {
@@ -129,6 +138,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         edit: {
@@ -138,6 +148,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         restore: {
@@ -148,6 +159,7 @@ arg_options = {
             point_in_time: {action: store_true, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         share: {
@@ -157,6 +169,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         sync: {
@@ -168,8 +181,11 @@ arg_options = {
             config: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             copy_from: {action: None, required: False},
             profile: {action: None, required: False},
+            sync_plan: {action: None, required: False},
+            sync_apply: {action: None, required: False},
         },
         browse: {
             info: {action: store_true, required: False},
@@ -178,6 +194,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             prefix: {action: None, required: False},
             profile: {action: None, required: False},
         },
@@ -190,6 +207,7 @@ arg_options = {
             out: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         audit: {
@@ -198,6 +216,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         promote: {
@@ -206,6 +225,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
         },
         generate: {
             info: {action: store_true, required: False},
@@ -214,6 +234,7 @@ arg_options = {
             role: {action: None, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         validate: {
@@ -221,14 +242,17 @@ arg_options = {
             prompt_com: {action: store_true, required: False},
             env: {action: None, required: False},
             config: {action: None, required: False},
+            all_envs: {action: store_true, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         },
         build_cache: {
             info: {action: store_true, required: False},
             skip_upgrade: {action: store_true, required: False},
             debug: {action: store_true, required: False},
+            cache_stats: {action: store_true, required: False},
             profile: {action: None, required: False},
         }
     },
@@ -287,7 +311,7 @@ config_commands = [sync, put, edit, delete, prune, get, share, generate,
                    list_com, browse, audit, dump, restore, promote, validate, build_cache]
 iam_commands = [export, iam_restore]
 help_commands = [configure, login, sandbox, role]
-maintenance_commands = [version, upgrade]
+maintenance_commands = [version, upgrade, compact_cache]
 login_commands = [login, sandbox]
 ui_commands = [ui]
 ots_commands = [ots_get, ots_put]
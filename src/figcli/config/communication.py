@@ -23,6 +23,8 @@ CI_CONFIG_HELP_TEXT = f"Path to your project's figgy.json file."
 # Help Text
 VERSION_HELP_TEXT = f'Prints current version, which is, in this case: {VERSION}'
 UPGRADE_HELP_TEXT = f'If available for your operating system, walks the user through an automatic upgrade process.'
+COMPACT_CACHE_HELP_TEXT = f'Drops expired entries from the local {CLI_NAME} cache, evicts the least recently used ' \
+                          f'entries until the cache is within its size budget, and reports cache usage.'
 SKIP_UPGRADE_HELP_TEXT = f'Prevents the figgy for checking for a new version. Useful when running E2E tests locally.'
 COMMAND_HELP_TEXT = f'Valid values are: {config_commands}'
 RESOURCE_HELP_TEXT = f'Valid values are: {resources}'
@@ -46,7 +48,10 @@ CLEANUP_HELP_TEXT = 'Prune will compare your config desired state as defined in
                     'configurations (configs that exist in AWS but not in your figgy.json file).'
 MIGRATE_HELP_TEXT = f"Walks a user through migrating application configs from Consul into Parameter Store"
 SYNC_HELP_TEXT = "Synchronizes your defined figgy.json configurations with those in Parameter Store. " \
-                 "This ensures the proper configurations exist in the provided run environment for your application."
+                 "This ensures the proper configurations exist in the provided run environment for your application. " \
+                 "--config may also be a directory or glob of figgy.json files, to sync many services at once. Their " \
+                 "remote configuration is read concurrently, but services are then synced one at a time so their " \
+                 "output and prompts stay in order. This also applies with --plan."
 GET_HELP_TEXT = "Retrieve an arbitrary value from ParameterStore by Name."
 BROWSE_HELP_TEXT = "Browse, look up, and delete parameters through a tree structure."
 AUDIT_HELP_TEXT = "Audit parameter store changes to parameters."
@@ -58,6 +63,7 @@ EXPORT_HELP_TEXT = "Writes temporary STS AWS credentials to your ~/.aws/credenti
 PROMOTE_HELP_TEXT = "Promote a set of configurations under an arbitrary app namespace to a higher environment."
 RESTORE_HELP_TEXT = "Restore a single parameter or all parameters within a time range"
 DEBUG_HELP_TEXT = "Turn on debug mode for enhanced logging."
+CACHE_STATS_HELP_TEXT = "Print local cache hit/miss counters and timings once the command completes."
 EDIT_HELP_TEXT = "Edit the value of an existing parameter store parameter, or create a new one"
 COPY_FROM_HELP_TEXT = "Copy values from another Parameter Store namespace."
 GENERATE_HELP_TEXT = "Generate a new figgy.json file from an existing figgy.json file. This is useful when you " \
@@ -93,6 +99,11 @@ POINT_IN_TIME = "Restore all parameters to a point in time."
 
 ALL_PROFILES = "Export all available AWS profiles to ~/.aws/credentials"
 ROLE = "Specify role to run command with"
+ALL_ENVS_HELP_TEXT = "Validate against every environment your role can access, and print which figs are missing " \
+                     "from each."
+SYNC_PLAN_HELP_TEXT = "Compute the changes `sync` would make without making them, and write them to the provided path."
+SYNC_APPLY_HELP_TEXT = "Make the changes in a plan written by `sync --plan`, if the remote configuration it was " \
+                       "computed against has not changed."
 
 HELP_TEXT_MAP = {
     version: VERSION_HELP_TEXT,
@@ -126,6 +137,7 @@ HELP_TEXT_MAP = {
     all_profiles: ALL_PROFILES,
     role: ROLE,
     debug: DEBUG_HELP_TEXT,
+    cache_stats: CACHE_STATS_HELP_TEXT,
     edit: EDIT_HELP_TEXT,
     copy_from: COPY_FROM_HELP_TEXT,
     generate: GENERATE_HELP_TEXT,
@@ -135,6 +147,7 @@ HELP_TEXT_MAP = {
     validate: VALIDATE_HELP_TEXT,
     profile: PROFILE_HELP_TEXT,
     upgrade: UPGRADE_HELP_TEXT,
+    compact_cache: COMPACT_CACHE_HELP_TEXT,
     iam_restore: IAM_RESTORE_HELP_TEXT,
     ui: UI_HELP_TEXT,
     run: RUN_HELP_TEXT,
@@ -142,6 +155,9 @@ HELP_TEXT_MAP = {
     ots: OTS_HELP_TEXT,
     ots_get: OTS_GET_HELP_TEXT,
     ots_put: OTS_PUT_HELP_TEXT,
+    sync_plan: SYNC_PLAN_HELP_TEXT,
+    sync_apply: SYNC_APPLY_HELP_TEXT,
+    all_envs: ALL_ENVS_HELP_TEXT,
 }
 
 # Other
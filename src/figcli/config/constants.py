@@ -100,7 +100,8 @@ HOME = str(Path.home())
 DECRYPTER_S3_PATH_PREFIX = f'figgy/decrypt/'
 AWS_CREDENTIALS_FILE_PATH = f'{HOME}/.aws/credentials'
 AWS_CONFIG_FILE_PATH = f'{HOME}/.aws/config'
-CACHE_OTHER_DIR = f'{HOME}/.figgy/cache/other'
+CACHE_DIR = f'{HOME}/.figgy/cache'
+CACHE_OTHER_DIR = f'{CACHE_DIR}/other'
 DEFAULT_INSTALL_PATH = '/usr/local/bin/figgy'
 ERROR_LOG_DIR = f'{HOME}/.figgy/errors'
 CONFIG_OVERRIDE_FILE_PATH = f'{HOME}/.figgy/config'
@@ -174,4 +175,5 @@ KEYCHAIN_ENCRYPTION_KEY = 'figgy-encryption-key'
 DEFAULT_ENCRYPTION_KEY = 'wX1C0nK1glfzaWQU8SKukdS7XZgYlAMW5ueb_V3cfSE='
 
 # Default paths to search for figgy.json in
+FIGGY_JSON_FILE_NAME = 'figgy.json'
 DEFAULT_FIGGY_JSON_PATHS = ['figgy.json', 'figgy/figgy.json', 'config/figgy.json', '_figgy/figgy.json', '.figgy/figgy.json']
\ No newline at end of file
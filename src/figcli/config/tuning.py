@@ -12,3 +12,31 @@ DYNAMO_DB_MAX_POOL_SIZE = int(max(POOLED_SVCS) * 1.1)
 # files errors if we are caching too many Boto3 connections
 MAX_OPEN_FILES = 130
 MAX_CACHED_BOTO_POOLS = int(MAX_OPEN_FILES / DYNAMO_DB_MAX_POOL_SIZE / len(POOLED_SVCS))
+
+# Local cache budgets enforced by the cache janitor (`figgy --compact-cache`) across ~/.figgy/cache
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+CACHE_MAX_ENTRIES = 10000
+
+# Cache entries that have not been rewritten in this long are considered expired and are dropped during compaction.
+CACHE_ENTRY_MAX_AGE = 60 * 60 * 24 * 30 * 1000  # 30 days in MS
+
+# Full refreshes of the remote parameter name cache use a segmented parallel scan.
+CONFIG_CACHE_SCAN_SEGMENTS = 16
+CONFIG_CACHE_SCAN_MAX_THREADS = DEFAULT_THREADS
+
+# Most parameter names offered by the interactive name completer for a single keystroke.
+CONFIG_COMPLETER_MAX_COMPLETIONS = 1000
+
+# Bulk value lookups fetch parameters in GetParameters batches (10 names at most) across a bounded pool.
+CONFIG_BULK_GET_BATCH_SIZE = 10
+CONFIG_BULK_GET_MAX_THREADS = DEFAULT_THREADS
+
+# Bulk description lookups filter DescribeParameters by name, 50 names at most per filter.
+CONFIG_BULK_DESCRIBE_BATCH_SIZE = 50
+
+# Batch deletes remove parameters in DeleteParameters batches (10 names at most) across a bounded pool.
+CONFIG_BULK_DELETE_BATCH_SIZE = 10
+CONFIG_BULK_DELETE_MAX_THREADS = DEFAULT_THREADS
+
+# `sync` reads its remote snapshot & applies replication config writes across a bounded pool.
+SYNC_MAX_THREADS = DEFAULT_THREADS
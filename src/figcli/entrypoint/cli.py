@@ -17,6 +17,7 @@ from figcli.models.assumable_role import AssumableRole
 from figcli.models.defaults.defaults import CLIDefaults
 from figcli.models.role import Role
 from figgy.models.run_env import RunEnv
+from figcli.svcs.observability.cache_stats import CacheStats
 from figcli.svcs.observability.error_reporter import FiggyErrorReporter
 from figcli.svcs.setup import FiggySetup
 from figcli.utils.environment_validator import EnvironmentValidator
@@ -48,6 +49,7 @@ class FiggyCLI:
         parser.add_argument(f'--{version.name}', help=VERSION_HELP_TEXT, action=store_true)
         parser.add_argument(f'--{skip_upgrade.name}', help=SKIP_UPGRADE_HELP_TEXT, action=store_true)
         parser.add_argument(f'--{upgrade.name}', help=UPGRADE_HELP_TEXT, action=store_true)
+        parser.add_argument(f'--{compact_cache.name}', help=COMPACT_CACHE_HELP_TEXT, action=store_true)
 
         resource_subparsers = parser.add_subparsers(title='resources', dest='resource', metavar='')
 
@@ -182,7 +184,8 @@ class FiggyCLI:
                or Utils.command_set(sandbox, args) \
                or Utils.is_set_true(version, args) \
                or Utils.attr_exists(profile, args) \
-               or Utils.is_set_true(upgrade, args)
+               or Utils.is_set_true(upgrade, args) \
+               or Utils.is_set_true(compact_cache, args)
 
     @staticmethod
     def validate_environment(defaults: CLIDefaults):
@@ -255,7 +258,12 @@ def main():
         if hasattr(args, 'info') and args.info:
             command.print_help_text()
         else:
-            command.execute()
+            # Reported even when the command exits early or fails, those are often the runs worth inspecting.
+            try:
+                command.execute()
+            finally:
+                if Utils.is_set_true(cache_stats, args):
+                    print(CacheStats.report())
 
     except AssertionError as e:
         Utils.stc_error_exit(e.args[0])
@@ -0,0 +1,65 @@
+import threading
+from itertools import islice
+from typing import Iterable, Iterator
+
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.document import Document
+
+from figcli.config.tuning import CONFIG_COMPLETER_MAX_COMPLETIONS
+from figcli.svcs.cache.name_index import NameIndex
+
+
+class ConfigNameCompleter(Completer):
+    """
+    Completes parameter names from everything typed before the cursor, the same way
+    WordCompleter(names, sentence=True, match_middle=True) does, without scanning every name on each keystroke.
+
+    Completions are yielded lazily, ranked as follows:
+        1. Names starting with the typed text, straight from a bisect range over the sorted index.
+        2. Names where the typed text starts a path segment, e.g. `foo` -> `/app/foo/bar`
+        3. All other names containing the typed text.
+
+    Middle matches come from the NameIndex trigram index, which is built in the background on creation. At most
+    `max_completions` are offered, the prompt can't usefully display more and building each one has a cost.
+    """
+
+    def __init__(self, names: Iterable[str], max_completions: int = CONFIG_COMPLETER_MAX_COMPLETIONS):
+        self._index = NameIndex(names)
+        self._max_completions = max_completions
+
+        # Middle matches need the trigram index, build it while the user is still typing a prefix.
+        threading.Thread(target=self._index.prepare_search, daemon=True).start()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add(self, name: str) -> None:
+        self._index.update(added=[name])
+
+    def remove(self, name: str) -> None:
+        self._index.update(deleted=[name])
+
+    def matches(self, text: str) -> Iterator[str]:
+        """
+        :return: Names matching `text`, in ranked order.
+        """
+        yield from self._index.prefix(text)
+
+        if not text:
+            return
+
+        # Each rank is streamed from the index in alphabetical order, so nothing past the last completion is matched.
+        segment_start = text if text.startswith('/') else f'/{text}'
+        yield from (name for name in self._index.iter_search(segment_start) if not name.startswith(text))
+
+        if segment_start != text:
+            yield from (name for name in self._index.iter_search(text)
+                        if segment_start not in name and not name.startswith(text))
+
+    def get_completions(self, document: Document, complete_event) -> Iterator[Completion]:
+        text = document.text_before_cursor
+        for name in islice(self.matches(text), self._max_completions):
+            yield Completion(name, -len(text))
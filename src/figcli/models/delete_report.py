@@ -0,0 +1,20 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class DeleteReport(BaseModel):
+    """
+    Outcome of deleting a batch of parameters.
+    """
+    deleted: List[str] = []
+    not_found: List[str] = []
+    denied: List[str] = []
+    skipped: List[str] = []
+
+    @property
+    def removed(self) -> List[str]:
+        """
+        Names that no longer exist, whether deleted now or already gone.
+        """
+        return self.deleted + self.not_found
@@ -0,0 +1,21 @@
+from enum import Enum
+from typing import Optional
+
+from figgy.models.fig import Fig
+from pydantic import BaseModel
+
+
+class FigLookupState(Enum):
+    FOUND = "found"
+    MISSING = "missing"
+    DENIED = "denied"
+    UNDECRYPTABLE = "undecryptable"
+
+
+class FigLookup(BaseModel):
+    """
+    Outcome of looking up a single fig as part of a batch. `fig` is only set when the fig was found.
+    """
+    name: str
+    state: FigLookupState
+    fig: Optional[Fig] = None
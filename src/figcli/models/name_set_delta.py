@@ -0,0 +1,13 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class NameSetDelta(BaseModel):
+    """
+    Changes to the parameter name set between two name set versions.
+    """
+    version: str
+    full_resync: bool = False
+    added: List[str] = []
+    deleted: List[str] = []
@@ -0,0 +1,32 @@
+from enum import Enum
+from typing import List, Optional, Union
+
+from pydantic import BaseModel
+
+
+class SyncAction(Enum):
+    ADD_FIG = "add_fig"
+    PUT_REPLICATION = "put_replication"
+
+
+class SyncOperation(BaseModel):
+    """
+    A single change `sync` will make. `name` is the fig to add, or the destination of the replication config to store.
+    """
+    action: SyncAction
+    name: str
+    source: Optional[Union[List[str], str]] = None
+    namespace: Optional[str] = None
+    replication_type: Optional[str] = None
+
+
+class SyncPlan(BaseModel):
+    """
+    Output of `sync --plan`. Records the remote state the plan was computed against so `sync --apply` can verify it
+    is unchanged before executing the operations.
+    """
+    env: str
+    namespaces: List[str] = []
+    names: List[str] = []
+    snapshot_hash: str
+    operations: List[SyncOperation] = []
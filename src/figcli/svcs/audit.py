@@ -1,6 +1,5 @@
 import logging
 from functools import lru_cache
-from multiprocessing.pool import ThreadPool
 from typing import List, Optional
 
 import cachetools.func
@@ -89,21 +88,8 @@ class AuditService:
         active_parameters = self._cfg.get_parameter_names()
         active_logs = [l for l in all_logs if l.parameter_name in active_parameters]
 
-        # Use multiple threads to lookup which parameters are replication destinations and remove them from the
-        # log list. Since we are waiting on network, this is many times faster.
-        # We cannot use ThreadPoolExecutor due to compatibility issues when running from within a flask request.
-        # I have  Todo to dive deeper into this and address these compatibility issues
-        with ThreadPool(processes=AUDIT_SVC_MAX_THREADS) as pool:
-            futures, repl_dest_params = {}, []
-            for l in active_logs:
-                thread = pool.apply_async(self._cfg.is_replication_destination, args=(l.parameter_name,))
-                futures[l.parameter_name] = thread
-
-            for param_name, future in futures.items():
-                if future.get():
-                    repl_dest_params.append(param_name)
-
-            # remove destinations:
-            active_logs = [l for l in active_logs if l.parameter_name not in repl_dest_params]
+        # Remove replication destinations, classified in bulk against the local replication index.
+        _, repl_dest_params = self._cfg.classify_replication(l.parameter_name for l in active_logs)
+        active_logs = [l for l in active_logs if l.parameter_name not in repl_dest_params]
 
         return active_logs
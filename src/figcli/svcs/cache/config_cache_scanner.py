@@ -0,0 +1,89 @@
+import logging
+import queue
+import sys
+from typing import Iterator, List, Set
+
+from figgy.data.models.config_item import ConfigState
+from tqdm import tqdm
+
+from figcli.config import CACHE_TABLE_NAME, CACHE_PARAMETER_KEY_NAME, CACHE_STATE_ATTR_NAME
+from figcli.config.tuning import CONFIG_CACHE_SCAN_SEGMENTS, CONFIG_CACHE_SCAN_MAX_THREADS
+from figcli.svcs.cache.lazy_client import LazyClient
+from figcli.utils.utils import Utils
+
+log = logging.getLogger(__name__)
+
+
+class ConfigCacheScanner:
+    """
+    Reads every active parameter name from the remote config cache table with a segmented, parallel scan.
+
+    The table is split into `segments` scan segments that are read concurrently by at most `max_workers` threads.
+    Pages are handed back to the caller as soon as any segment returns them, so names can be consumed while the
+    rest of the table is still being read.
+
+    Requires a LazyClient over a boto3 dynamodb client.
+    """
+
+    _DONE = object()
+
+    def __init__(self, client: LazyClient, segments: int = CONFIG_CACHE_SCAN_SEGMENTS,
+                 max_workers: int = CONFIG_CACHE_SCAN_MAX_THREADS):
+        self._client = client
+        self._segments = max(segments, 1)
+        self._max_workers = max(min(max_workers, self._segments), 1)
+
+    def __scan_segment(self, segment: int, results: queue.Queue) -> None:
+        try:
+            paginator = self._client.get().get_paginator('scan')
+            pages = paginator.paginate(
+                TableName=CACHE_TABLE_NAME,
+                Segment=segment,
+                TotalSegments=self._segments,
+                ProjectionExpression='#name, #state',
+                ExpressionAttributeNames={'#name': CACHE_PARAMETER_KEY_NAME, '#state': CACHE_STATE_ATTR_NAME}
+            )
+
+            for page in pages:
+                results.put([
+                    item[CACHE_PARAMETER_KEY_NAME]['S'] for item in page.get('Items', [])
+                    # Items without a state are treated as active, just like incremental refreshes do.
+                    if item.get(CACHE_STATE_ATTR_NAME, {}).get('S') != ConfigState.DELETED.value
+                ])
+        finally:
+            results.put(self._DONE)
+
+    def pages(self) -> Iterator[List[str]]:
+        """
+        :return: Pages of active parameter names, in whatever order the scan segments return them. Raises the first
+            scan error, if any, once all segments are finished.
+        """
+        results = queue.Queue()
+        with Utils.thread_pool(self._max_workers, self._segments) as pool:
+            futures = [pool.apply_async(self.__scan_segment, args=(segment, results))
+                       for segment in range(self._segments)]
+
+            remaining = self._segments
+            while remaining:
+                page = results.get()
+                if page is self._DONE:
+                    remaining -= 1
+                else:
+                    yield page
+
+            for future in futures:
+                future.get()
+
+    def active_names(self) -> Set[str]:
+        """
+        :return: All active parameter names in the remote cache. Shows a progress indicator when run interactively.
+        """
+        names = set()
+        with tqdm(desc="Refreshing parameter names...", unit=" names", disable=not sys.stdout.isatty(),
+                  leave=False) as progress:
+            for page in self.pages():
+                names.update(page)
+                progress.update(len(page))
+
+        log.info(f"Scanned {len(names)} active names from {CACHE_TABLE_NAME} across {self._segments} segments.")
+        return names
@@ -0,0 +1,130 @@
+import glob
+import logging
+import os
+from typing import List, Tuple, Callable
+
+from pydantic import BaseModel
+
+from figcli.config import CACHE_DIR, CACHE_OTHER_DIR
+from figcli.config.tuning import CACHE_MAX_BYTES, CACHE_MAX_ENTRIES, CACHE_ENTRY_MAX_AGE
+from figcli.svcs.cache.name_store import NameStore
+from figcli.svcs.cache.storage import SqliteStorage
+from figcli.utils.utils import Utils
+
+log = logging.getLogger(__name__)
+
+
+class CacheUsage(BaseModel):
+    """
+    Size of the local cache at a point in time.
+    """
+    bytes: int = 0
+    entries: int = 0
+
+
+class CacheCompactionReport(BaseModel):
+    """
+    Result of a CacheJanitor run.
+    """
+    before: CacheUsage
+    after: CacheUsage
+    expired: int = 0
+    evicted: int = 0
+    max_bytes: int
+    max_entries: int
+
+
+class CacheJanitor:
+    """
+    Keeps the local figgy cache within a size budget.
+
+    Each run drops expired entries from every SQLite-backed cache, evicts the least recently accessed entries and
+    name stores until the cache is within budget, then compacts what remains. Other cache files (defaults, sessions,
+    vaults) count towards the budget but are never removed, figgy can't always rebuild them without user input.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES,
+                 max_entries: int = CACHE_MAX_ENTRIES, max_age: int = CACHE_ENTRY_MAX_AGE):
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._max_age = max_age
+
+    @staticmethod
+    def __databases() -> List[SqliteStorage]:
+        return [SqliteStorage(path) for path in sorted(glob.glob(f'{CACHE_OTHER_DIR}/*-cache.db'))]
+
+    @staticmethod
+    def __name_stores() -> List[NameStore]:
+        return [NameStore(path) for path in sorted(glob.glob(f'{CACHE_OTHER_DIR}/*.names'))]
+
+    def usage(self) -> CacheUsage:
+        """
+        :return: Total bytes on disk and total entries currently held by the local cache.
+        """
+        total_bytes, entries = 0, 0
+        for root, _, files in os.walk(self._cache_dir):
+            for file in files:
+                try:
+                    total_bytes += os.path.getsize(os.path.join(root, file))
+                except OSError:
+                    pass
+
+        for db in self.__databases():
+            entries += len(db.usage())
+
+        entries += len(self.__name_stores())
+        return CacheUsage(bytes=total_bytes, entries=entries)
+
+    def run(self) -> CacheCompactionReport:
+        before = self.usage()
+        databases = self.__databases()
+        name_stores = self.__name_stores()
+
+        expired = 0
+        expire_before = Utils.millis_since_epoch() - self._max_age
+        for db in databases:
+            expired += db.expire(expire_before)
+
+        # Tuples of (last access, size, evict) for everything that may be evicted.
+        candidates: List[Tuple[int, int, Callable]] = []
+        for db in databases:
+            for cache_key, last_access, size in db.usage():
+                candidates.append((last_access, size, lambda db=db, key=cache_key: db.remove(key)))
+
+        # Name store reads bump the access time, writes the modified time.
+        for store in name_stores:
+            stat = os.stat(store.path)
+            candidates.append((int(max(stat.st_atime, stat.st_mtime) * 1000), stat.st_size, store.wipe))
+
+        # Files we won't evict still count towards the byte budget.
+        evictable_bytes = sum(size for _, size, _ in candidates)
+        db_bytes = sum(self.__file_size(db.path) for db in databases)
+        fixed_bytes = max(before.bytes - db_bytes - sum(self.__file_size(s.path) for s in name_stores), 0)
+        total_bytes, total_entries = fixed_bytes + evictable_bytes, len(candidates)
+
+        evicted = 0
+        for last_access, size, evict in sorted(candidates, key=lambda c: c[0]):
+            if total_bytes <= self._max_bytes and total_entries <= self._max_entries:
+                break
+
+            evict()
+            evicted += 1
+            total_bytes -= size
+            total_entries -= 1
+
+        log.info(f"Cache janitor expired {expired} and evicted {evicted} entries.")
+
+        for db in databases:
+            db.vacuum()
+
+        for store in name_stores:
+            if os.path.exists(store.path):
+                store.compact()
+
+        return CacheCompactionReport(before=before, after=self.usage(), expired=expired, evicted=evicted,
+                                     max_bytes=self._max_bytes, max_entries=self._max_entries)
+
+    @staticmethod
+    def __file_size(path: str) -> int:
+        return sum(os.path.getsize(f) for f in [path, f'{path}-wal'] if os.path.exists(f))
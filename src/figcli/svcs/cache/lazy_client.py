@@ -0,0 +1,24 @@
+import threading
+from typing import Any, Callable
+
+
+class LazyClient:
+    """
+    A boto3 client that is only created the first time it is used, so services that never make a remote call don't
+    pay for creating one.
+
+    Services that fan out across threads share a single LazyClient. Boto3 clients are thread-safe, resources are
+    not, so only clients may be wrapped.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            if self._client is None:
+                self._client = self._factory()
+
+            return self._client
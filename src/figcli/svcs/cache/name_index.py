@@ -0,0 +1,238 @@
+import threading
+from bisect import bisect_left, insort
+from typing import List, Iterable, Iterator, Set, Dict, Tuple, Optional
+
+
+class NameIndex:
+    """
+    In-memory index over a set of parameter names.
+
+    Names are kept in a sorted array so prefix listings, one-level children and root namespaces are answered with
+    bisect ranges instead of full scans. Substring search is backed by a lazily built trigram index over the distinct
+    path segments, so only names containing a matching segment are ever checked.
+
+    The sorted array is copy-on-write: updates build a new array and swap it in, so readers on other threads always
+    see a consistent snapshot without locking. The substring index is guarded by a lock.
+    """
+
+    _MAX_CHAR = chr(0x10FFFF)
+
+    # Searches whose candidate names exceed 1/_DENSE_SHARE of the index stream the sorted array instead.
+    _DENSE_SHARE = 8
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._lock = threading.Lock()
+        self._names: List[str] = sorted(set(names))
+        self._segments: Optional[Dict[str, Set[str]]] = None
+        self._trigrams: Optional[Dict[str, Set[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        names = self._names
+        pos = bisect_left(names, name)
+        return pos < len(names) and names[pos] == name
+
+    @property
+    def names(self) -> List[str]:
+        """
+        :return: All indexed names, sorted. The returned list is shared and must not be mutated.
+        """
+        return self._names
+
+    @staticmethod
+    def _range(names: List[str], prefix: str) -> Tuple[int, int]:
+        return bisect_left(names, prefix), bisect_left(names, prefix + NameIndex._MAX_CHAR)
+
+    def prefix(self, prefix: str) -> List[str]:
+        """
+        :return: All names starting with `prefix`, sorted.
+        """
+        names = self._names
+        start, end = self._range(names, prefix)
+        return names[start:end]
+
+    def has_descendants(self, prefix: str) -> bool:
+        """
+        :return: True if any name is nested below `prefix`, i.e. `prefix` is a directory.
+        """
+        start, end = self._range(self._names, f'{prefix.rstrip("/")}/')
+        return start < end
+
+    def children(self, prefix: str) -> List[str]:
+        """
+        :return: Names starting with `prefix` that are exactly one path segment deeper than `prefix`.
+            e.g. children('/app') -> ['/app/foo'] for names ['/app/foo', '/app/foo/bar']
+        """
+        names = self._names
+        depth = prefix.count('/') + 1
+        pos, end = self._range(names, prefix)
+        children = []
+
+        while pos < end:
+            name = names[pos]
+            name_depth = name.count('/')
+            if name_depth == depth:
+                children.append(name)
+                pos += 1
+            elif name_depth > depth:
+                # Skip everything nested under this name's ancestor at the child depth.
+                ancestor = '/'.join(name.split('/')[:depth + 1])
+                pos = max(pos + 1, self._range(names, f'{ancestor}/')[1])
+            else:
+                pos += 1
+
+        return children
+
+    def child_nodes(self, prefix: str) -> Dict[str, bool]:
+        """
+        Like `children`, but also includes the directories one path segment deeper than `prefix`, whether or not
+        they are names themselves.
+            e.g. child_nodes('/app') -> {'/app/foo': True, '/app/baz': False} for names ['/app/foo/bar', '/app/baz']
+
+        :return: Dict of child path -> whether any name is nested below it.
+        """
+        names = self._names
+        parent = f'{prefix.rstrip("/")}/'
+        pos, end = self._range(names, parent)
+        nodes: Dict[str, bool] = {}
+
+        while pos < end:
+            name = names[pos]
+            segment_end = name.find('/', len(parent))
+            if segment_end == -1:
+                nodes.setdefault(name, False)
+                pos += 1
+            else:
+                # Skip everything nested under this child, it only needs to be seen once.
+                child = name[:segment_end]
+                nodes[child] = True
+                pos = max(pos + 1, self._range(names, f'{child}/')[1])
+
+        return nodes
+
+    def root_namespaces(self) -> List[str]:
+        """
+        :return: Distinct first path segments of all names, e.g. ['/app', '/shared']
+        """
+        names = self._names
+        roots = []
+        pos = 0
+
+        while pos < len(names):
+            name = names[pos]
+            parts = name.split('/')
+            root = f'/{parts[1]}' if len(parts) > 1 else name
+            if not roots or roots[-1] != root:
+                roots.append(root)
+
+            # Skip past every other name nested under this root
+            pos = self._range(names, f'{root}/')[1] if name.startswith(f'{root}/') else pos + 1
+
+        return sorted(set(roots))
+
+    def search(self, query: str) -> List[str]:
+        """
+        :return: All names containing `query`, sorted.
+        """
+        return list(self.iter_search(query))
+
+    def iter_search(self, query: str) -> Iterator[str]:
+        """
+        Lazy `search`, yields names containing `query` in sorted order so callers that need only the first few can
+        stop early. If the segments matching `query` hold a large share of all names, matches are dense and the sorted
+        array is filtered as it's streamed, rather than collecting & sorting every match up front.
+        """
+        pieces = [piece for piece in query.split('/') if piece]
+        if not pieces:
+            yield from (name for name in self._names if query in name)
+            return
+
+        piece = max(pieces, key=len)
+
+        with self._lock:
+            segments, trigrams = self.__search_index()
+            names = self._names
+            if len(piece) >= 3:
+                candidate_sets = sorted((trigrams.get(piece[i:i + 3], set()) for i in range(len(piece) - 2)), key=len)
+                candidate_segments = set.intersection(*candidate_sets)
+            else:
+                candidate_segments = segments.keys()
+
+            candidates = [segments[segment] for segment in candidate_segments if piece in segment]
+            matches = None
+            if sum(len(segment_names) for segment_names in candidates) * self._DENSE_SHARE < len(names):
+                matches = {name for segment_names in candidates for name in segment_names if query in name}
+
+        if matches is None:
+            yield from (name for name in names if query in name)
+        else:
+            yield from sorted(matches)
+
+    def prepare_search(self) -> None:
+        """
+        Build the substring search index now rather than on the first search, e.g. from a background thread.
+        """
+        with self._lock:
+            self.__search_index()
+
+    def __search_index(self) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """
+        Lazily builds the substring search index. Must be called while holding the lock.
+        """
+        if self._segments is None or self._trigrams is None:
+            self._segments, self._trigrams = {}, {}
+            self.__index(self._names, self._segments, self._trigrams)
+
+        return self._segments, self._trigrams
+
+    @staticmethod
+    def __index(names: Iterable[str], segments: Dict[str, Set[str]], trigrams: Dict[str, Set[str]]) -> None:
+        for name in names:
+            for segment in name.split('/'):
+                if not segment:
+                    continue
+
+                if segment not in segments:
+                    segments[segment] = set()
+                    for i in range(len(segment) - 2):
+                        trigrams.setdefault(segment[i:i + 3], set()).add(segment)
+
+                segments[segment].add(name)
+
+    def update(self, added: Iterable[str] = (), deleted: Iterable[str] = ()) -> None:
+        """
+        Incrementally apply names added to or removed from the indexed set. Each change costs a bisect into the
+        sorted array plus a copy of the array reference list, so small deltas never re-sort the whole index.
+        """
+        with self._lock:
+            added = {name for name in added if name not in self}
+            deleted = {name for name in deleted if name in self} - added
+            if not added and not deleted:
+                return
+
+            names = list(self._names)
+            for name in deleted:
+                del names[bisect_left(names, name)]
+
+            for name in sorted(added):
+                insort(names, name)
+
+            if self._segments is not None and self._trigrams is not None:
+                for name in deleted:
+                    for segment in name.split('/'):
+                        if segment in self._segments:
+                            self._segments[segment].discard(name)
+
+                self.__index(added, self._segments, self._trigrams)
+
+            self._names = names
+
+    def reset(self, names: Iterable[str]) -> None:
+        """
+        Replace the full set of indexed names.
+        """
+        with self._lock:
+            self._names = sorted(set(names))
+            self._segments, self._trigrams = None, None
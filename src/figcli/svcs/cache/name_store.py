@@ -0,0 +1,356 @@
+import logging
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import Set, Tuple, Optional, Iterable, List, Iterator
+
+from filelock import FileLock
+
+from figcli.svcs.cache.storage import atomic_write, SqliteStorage
+from figcli.svcs.observability.cache_stats import CacheStats
+from figcli.utils.utils import Utils
+
+log = logging.getLogger(__name__)
+
+
+class CorruptNameStoreException(Exception):
+    pass
+
+
+class _StaleMappingException(Exception):
+    pass
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(buf, pos: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_block(names: Iterable[str], restart_interval: int) -> Tuple[bytes, List[int]]:
+    """
+    Front-code a sorted list of names. Each entry is stored as <shared prefix len><suffix len><suffix> where the shared
+    prefix is relative to the previous entry. Every `restart_interval` entries the shared prefix is reset to zero so
+    that the block can be searched without decoding it from the start.
+
+    :return: encoded entries, and the offset of every restart point within them
+    """
+    out, restarts = bytearray(), []
+    prev = b''
+    for i, name in enumerate(sorted(names)):
+        encoded = name.encode('utf-8')
+        shared = 0
+        if i % restart_interval == 0:
+            restarts.append(len(out))
+        else:
+            limit = min(len(prev), len(encoded))
+            while shared < limit and prev[shared] == encoded[shared]:
+                shared += 1
+
+        _encode_varint(shared, out)
+        _encode_varint(len(encoded) - shared, out)
+        out += encoded[shared:]
+        prev = encoded
+
+    return bytes(out), restarts
+
+
+def _decode_block(buf, pos: int, count: int) -> Tuple[List[str], int]:
+    names, prev = [], b''
+    for _ in range(count):
+        # Fast path for single byte varints, which covers almost every path in practice.
+        shared = buf[pos]
+        if shared < 0x80:
+            pos += 1
+        else:
+            shared, pos = _decode_varint(buf, pos)
+
+        length = buf[pos]
+        if length < 0x80:
+            pos += 1
+        else:
+            length, pos = _decode_varint(buf, pos)
+
+        prev = prev[:shared] + buf[pos:pos + length]
+        pos += length
+        names.append(prev.decode('utf-8'))
+
+    return names, pos
+
+
+class NameStore:
+    """
+    Compact, memory-mappable on-disk set of parameter names.
+
+    Layout (all integers little endian):
+
+        header:  magic (8) | version (u16) | reserved (u16) | last_write (u64) | last_refresh (u64)
+                 | delta_count (u32) | data_end (u64)
+        base:    count (u32) | restart_count (u32) | restart offsets (u32 * restart_count) | front-coded entries
+        deltas:  zero or more of: marker (1) | payload length (u32) | added count (u32) | deleted count (u32)
+                 | front-coded added names | front-coded deleted names
+
+    The base segment holds a sorted, front-coded snapshot of all names. Incremental updates append a delta segment
+    after the last valid byte and then bump `data_end` & `last_write` in the header, so an update never rewrites the
+    base. Bytes past `data_end` (e.g. from an interrupted append) are ignored. Once enough deltas accumulate, the
+    store is compacted into a fresh base segment with an atomic rename.
+
+    Readers never lock; writers serialize on a FileLock.
+    """
+
+    _MAGIC = b'FIGNAMES'
+    _VERSION = 1
+    _HEADER = struct.Struct('<8sHHQQIQ')
+    _SEGMENT = struct.Struct('<cIII')
+    _DELTA_MARKER = b'D'
+    _RESTART_INTERVAL = 16
+    _MAX_DELTAS = 16
+
+    # Reads bump the file's access time for LRU eviction by the cache janitor, at most this often.
+    ACCESS_RESOLUTION_MS = SqliteStorage.ACCESS_RESOLUTION_MS
+
+    def __init__(self, path: str):
+        self._path = path
+        self._name = os.path.basename(path)
+        self._memo: Tuple[Optional[Tuple[int, int, int]], Tuple[int, int, int, Set[str]]] = (None, (0, 0, 0, set()))
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextmanager
+    def __locked(self) -> Iterator[None]:
+        lock = FileLock(f'{self._path}.lock')
+        with CacheStats.timer(self._name, CacheStats.WHOLE_CACHE, 'lock_wait_ms'):
+            lock.acquire()
+
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def __publish(self, data: bytes) -> None:
+        atomic_write(self._path, data)
+        CacheStats.record(self._name, CacheStats.WHOLE_CACHE, bytes_written=len(data))
+
+    def __signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    @staticmethod
+    def _encode_base(names: Iterable[str], last_write: int, last_refresh: int) -> bytes:
+        names = set(names)
+        entries, restarts = _encode_block(names, NameStore._RESTART_INTERVAL)
+        base = bytearray()
+        base += struct.pack('<II', len(names), len(restarts))
+        base += struct.pack(f'<{len(restarts)}I', *restarts)
+        base += entries
+
+        header = NameStore._HEADER.pack(NameStore._MAGIC, NameStore._VERSION, 0, last_write, last_refresh, 0,
+                                        NameStore._HEADER.size + len(base))
+        return header + bytes(base)
+
+    def _read_header(self, buf) -> Tuple[int, int, int, int]:
+        if len(buf) < self._HEADER.size:
+            raise CorruptNameStoreException(f"Name store at {self._path} is truncated.")
+
+        magic, version, _, last_write, last_refresh, delta_count, data_end = self._HEADER.unpack_from(buf, 0)
+        if magic != self._MAGIC or version != self._VERSION:
+            raise CorruptNameStoreException(f"Name store at {self._path} has an invalid header.")
+
+        if data_end > len(buf):
+            # A writer appended a delta after this buffer was mapped. Callers should map the file again.
+            raise _StaleMappingException()
+
+        return last_write, last_refresh, delta_count, data_end
+
+    def _decode(self, buf) -> Tuple[int, int, int, Set[str]]:
+        last_write, last_refresh, delta_count, data_end = self._read_header(buf)
+
+        pos = self._HEADER.size
+        count, restart_count = struct.unpack_from('<II', buf, pos)
+        pos += 8 + 4 * restart_count
+        base, pos = _decode_block(buf, pos, count)
+        names = set(base)
+
+        while pos < data_end:
+            marker, length, added_count, deleted_count = self._SEGMENT.unpack_from(buf, pos)
+            if marker != self._DELTA_MARKER:
+                raise CorruptNameStoreException(f"Name store at {self._path} contains an invalid delta segment.")
+
+            pos += self._SEGMENT.size
+            added, pos = _decode_block(buf, pos, added_count)
+            deleted, pos = _decode_block(buf, pos, deleted_count)
+            names.difference_update(deleted)
+            names.update(added)
+
+        return last_write, last_refresh, delta_count, names
+
+    def _load(self) -> Tuple[int, int, int, Set[str]]:
+        """
+        :return: last_write, last_refresh, delta count, and the full set of names. Served from memory if the backing
+                 file is unchanged since it was last read.
+        """
+        for _ in range(3):
+            signature = self.__signature()
+            if signature is None:
+                return 0, 0, 0, set()
+
+            memo_signature, contents = self._memo
+            if signature == memo_signature:
+                return contents
+
+            try:
+                with open(self._path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                        CacheStats.record(self._name, CacheStats.WHOLE_CACHE, bytes_read=len(buf))
+                        with CacheStats.timer(self._name, CacheStats.WHOLE_CACHE, 'decode_ms'):
+                            contents = self._decode(buf)
+            except _StaleMappingException:
+                continue
+            except (CorruptNameStoreException, struct.error, IndexError, UnicodeDecodeError, ValueError) as e:
+                log.info(f"Unable to read name store at {self._path}, it will be rebuilt. Error: {e}")
+                return 0, 0, 0, set()
+
+            if self.__signature() == signature:
+                self._memo = (signature, contents)
+
+            return contents
+
+        log.info(f"Name store at {self._path} is changing too quickly to read, it will be rebuilt.")
+        return 0, 0, 0, set()
+
+    def last_refresh(self) -> int:
+        """
+        :return: millis since epoch of the last time the full name set was written. 0 if the store is empty.
+        """
+        return self._load()[1]
+
+    def get(self) -> Tuple[int, Set[str]]:
+        """
+        :return: Tuple of last_write time and the stored names. The returned set is shared & must not be mutated.
+        """
+        last_write, _, _, names = self._load()
+        self.__record_access()
+        return last_write, names
+
+    def __record_access(self) -> None:
+        """
+        Only the access time is set, the modified time is part of the memo signature and must not change on reads.
+        """
+        try:
+            stat = os.stat(self._path)
+            now_ns = time.time_ns()
+            if now_ns - stat.st_atime_ns > self.ACCESS_RESOLUTION_MS * 1000000:
+                os.utime(self._path, ns=(now_ns, stat.st_mtime_ns))
+        except OSError:
+            pass
+
+    def write(self, names: Iterable[str]) -> None:
+        """
+        Replace the stored names with a new base segment, resetting both last_write and last_refresh.
+        """
+        names = set(names)
+        now = Utils.millis_since_epoch()
+        with self.__locked():
+            self.__publish(self._encode_base(names, now, now))
+            self._memo = (self.__signature(), (now, now, 0, names))
+
+    def apply(self, added: Set[str], deleted: Set[str], advance: bool = True) -> None:
+        """
+        Record names added to and deleted from the set since the last write by appending a delta segment. The base is
+        only rewritten when enough deltas have accumulated to warrant compaction.
+
+        :param advance: Whether to move last_write forward. Changes made locally, rather than synced from the remote
+            cache, must not move it, or remote changes made since the last sync would be skipped. An empty store is
+            left empty in that case.
+        """
+        now = Utils.millis_since_epoch()
+        with self.__locked():
+            if self.__signature() is None:
+                if advance:
+                    self.__publish(self._encode_base(set(added) - set(deleted), now, 0))
+                return
+
+            last_write, last_refresh, delta_count, names = self._load()
+            now = now if advance else last_write
+            if delta_count + 1 >= self._MAX_DELTAS:
+                merged = (set(names) - set(deleted)) | set(added)
+                self.__publish(self._encode_base(merged, now, last_refresh))
+                self._memo = (self.__signature(), (now, last_refresh, 0, merged))
+                return
+
+            added_block, _ = _encode_block(added, len(added) + 1)
+            deleted_block, _ = _encode_block(deleted, len(deleted) + 1)
+            payload = added_block + deleted_block
+            segment = self._SEGMENT.pack(self._DELTA_MARKER, len(payload), len(added), len(deleted)) + payload
+
+            with open(self._path, 'r+b') as f:
+                # Bytes past data_end belong to an interrupted append and are overwritten.
+                data_end = self._HEADER.unpack(f.read(self._HEADER.size))[-1]
+                f.seek(data_end)
+                f.write(segment)
+                CacheStats.record(self._name, CacheStats.WHOLE_CACHE, bytes_written=len(segment))
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+
+                f.seek(0)
+                f.write(self._HEADER.pack(self._MAGIC, self._VERSION, 0, now, last_refresh, delta_count + 1,
+                                          data_end + len(segment)))
+                f.flush()
+                os.fsync(f.fileno())
+
+    def touch(self) -> None:
+        """
+        Move last_write forward without changing the names, e.g. after a sync found nothing new. Only the header is
+        rewritten. An empty store is left empty.
+        """
+        now = Utils.millis_since_epoch()
+        with self.__locked():
+            if self.__signature() is None:
+                return
+
+            _, last_refresh, delta_count, names = self._load()
+            with open(self._path, 'r+b') as f:
+                data_end = self._HEADER.unpack(f.read(self._HEADER.size))[-1]
+                f.seek(0)
+                f.write(self._HEADER.pack(self._MAGIC, self._VERSION, 0, now, last_refresh, delta_count, data_end))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._memo = (self.__signature(), (now, last_refresh, delta_count, names))
+
+    def compact(self) -> None:
+        """
+        Merge any delta segments into a fresh base segment.
+        """
+        with self.__locked():
+            last_write, last_refresh, delta_count, names = self._load()
+            if delta_count > 0:
+                self.__publish(self._encode_base(names, last_write, last_refresh))
+                self._memo = (self.__signature(), (last_write, last_refresh, 0, names))
+
+    def wipe(self) -> None:
+        with self.__locked():
+            if os.path.exists(self._path):
+                os.remove(self._path)
+            self._memo = (None, (0, 0, 0, set()))
@@ -0,0 +1,56 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class ReplicationIndex:
+    """
+    In-memory index over replication configs, answering which parameters are replication sources or destinations
+    without a remote lookup per name.
+
+    Built from (destination, source) pairs. Merge configs, whose source is a list of merge values rather than a
+    single parameter name, are indexed as destinations only, just like a source lookup against the replication
+    table would treat them.
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[str, Optional[str]]] = ()):
+        self._sources: Dict[str, Optional[str]] = {}  # destination -> source
+        self._destinations: Dict[str, Set[str]] = {}  # source -> destinations
+
+        for destination, source in pairs:
+            self.put(destination, source)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def put(self, destination: str, source: Optional[str]) -> None:
+        self.remove(destination)
+        self._sources[destination] = source
+        if source is not None:
+            self._destinations.setdefault(source, set()).add(destination)
+
+    def remove(self, destination: str) -> None:
+        source = self._sources.pop(destination, None)
+        destinations = self._destinations.get(source)
+        if destinations is not None:
+            destinations.discard(destination)
+            if not destinations:
+                del self._destinations[source]
+
+    def is_source(self, name: str) -> bool:
+        return name in self._destinations
+
+    def is_destination(self, name: str) -> bool:
+        return name in self._sources
+
+    def destinations_of(self, source: str) -> List[str]:
+        return sorted(self._destinations.get(source, ()))
+
+    def classify(self, names: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """
+        :return: Tuple[sources, destinations] - The subsets of `names` that are replication sources & destinations.
+            A name may be both.
+        """
+        names = set(names)
+        return names.intersection(self._destinations), names.intersection(self._sources)
+
+    def pairs(self) -> List[Tuple[str, Optional[str]]]:
+        return list(self._sources.items())
@@ -0,0 +1,39 @@
+import logging
+from typing import List, Optional, Tuple
+
+from figcli.config import REPL_TABLE_NAME, REPL_DEST_KEY_NAME, REPL_SOURCE_ATTR_NAME
+from figcli.svcs.cache.lazy_client import LazyClient
+
+log = logging.getLogger(__name__)
+
+
+class ReplicationScanner:
+    """
+    Reads the destination & source of every replication config with a single paginated scan of the replication
+    table. Only the two attributes needed to build a ReplicationIndex are read.
+
+    Requires a LazyClient over a boto3 dynamodb client.
+    """
+
+    def __init__(self, client: LazyClient):
+        self._client = client
+
+    def pairs(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        :return: (destination, source) of every replication config. Source is None for merge configs, their source
+            is a list of merge values rather than a parameter name.
+        """
+        paginator = self._client.get().get_paginator('scan')
+        pages = paginator.paginate(
+            TableName=REPL_TABLE_NAME,
+            ProjectionExpression='#dest, #src',
+            ExpressionAttributeNames={'#dest': REPL_DEST_KEY_NAME, '#src': REPL_SOURCE_ATTR_NAME}
+        )
+
+        pairs = []
+        for page in pages:
+            for item in page.get('Items', []):
+                pairs.append((item[REPL_DEST_KEY_NAME]['S'], item.get(REPL_SOURCE_ATTR_NAME, {}).get('S')))
+
+        log.info(f"Scanned {len(pairs)} replication configs from {REPL_TABLE_NAME}.")
+        return pairs
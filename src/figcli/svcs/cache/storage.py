@@ -0,0 +1,486 @@
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Optional, List, Iterator, Tuple, Callable, Any
+
+import jsonpickle
+from filelock import FileLock
+
+from figcli.config import CACHE_OTHER_DIR
+from figcli.svcs.observability.cache_stats import CacheStats
+from figcli.svcs.vault import FiggyVault
+from figcli.utils.utils import Utils
+
+log = logging.getLogger(__name__)
+
+EMPTY_CACHE_STR = 'CACHE_EMPTY'
+
+# Keys of each stored cache entry.
+STORE_KEY = 'cache'
+LAST_WRITE_KEY = 'last_write'
+LAST_REFRESH_KEY = 'last_refresh'
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """
+    Replace the file at `path` with `data` such that concurrent readers see either the old or the new contents in full.
+    The data is written & fsynced to a temp file in the same directory, then renamed over the destination.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class CacheStorage(ABC):
+    """
+    Persistence backend for a CacheManager. A backend stores one entry per cache key. Each entry is a dict containing
+    the cached object under STORE_KEY, and the LAST_WRITE_KEY / LAST_REFRESH_KEY timestamps for that object.
+    """
+
+    @abstractmethod
+    def read(self, cache_key: str) -> Optional[Dict]:
+        """
+        :param cache_key: key to lookup
+        :return: The stored entry for this key, or None if it does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def write(self, cache_key: str, entry: Dict) -> None:
+        """
+        Insert or fully replace the entry stored at cache_key.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, cache_key: str) -> None:
+        pass
+
+    @abstractmethod
+    def keys(self) -> List[str]:
+        pass
+
+    @abstractmethod
+    def wipe(self) -> None:
+        """
+        Remove all entries, recreating the backing store from scratch.
+        """
+        pass
+
+    @contextmanager
+    def session(self) -> Iterator["CacheStorage"]:
+        """
+        Groups several reads & writes into a single atomic unit of work. Operations must be performed against the
+        yielded storage, and are committed together when the context exits without error.
+        """
+        yield self
+
+
+class DocumentSession(CacheStorage):
+    """
+    In-memory view over a decoded cache document. Used by JsonFileStorage so that a whole session of operations costs a
+    single read and, if anything changed, a single write of the underlying file.
+    """
+
+    def __init__(self, contents: Dict, opener: Callable[[str, Any], Optional[Dict]] = lambda key, val: val,
+                 sealer: Callable[[Dict], Any] = lambda entry: entry):
+        """
+        :param contents: Stored document, mapping each cache key to its (possibly sealed) entry.
+        :param opener: Turns a stored value back into an entry, e.g. by decrypting it.
+        :param sealer: Turns an entry into the value to store, e.g. by encrypting it.
+        """
+        self.contents = contents
+        self.dirty = False
+        self._open = opener
+        self._seal = sealer
+
+    def read(self, cache_key: str) -> Optional[Dict]:
+        return self._open(cache_key, self.contents.get(cache_key))
+
+    def write(self, cache_key: str, entry: Dict) -> None:
+        self.contents[cache_key] = self._seal(entry)
+        self.dirty = True
+
+    def remove(self, cache_key: str) -> None:
+        if cache_key in self.contents:
+            del self.contents[cache_key]
+            self.dirty = True
+
+    def keys(self) -> List[str]:
+        return list(self.contents.keys())
+
+    def wipe(self) -> None:
+        self.contents = {}
+        self.dirty = True
+
+
+class JsonFileStorage(CacheStorage):
+    """
+    Stores all entries as a single jsonpickle document in one file.
+
+    If a vault is provided, each entry is encrypted individually and the file holds a json document mapping each cache
+    key to its encrypted entry. A lookup decrypts only the requested entry, and a write only encrypts the entry being
+    written. Files written with the legacy whole-file encryption are transparently converted on their next write.
+
+    Writers serialize on a FileLock and publish a new version of the file with an atomic rename, so readers never
+    observe a partial write and never need to take the lock. Each instance memoizes the decoded document, keyed by the
+    file's stat() signature, so repeated reads of an unchanged file cost a single stat() call.
+
+    Objects returned from the memoized document are shared across reads and must not be mutated in place.
+    """
+
+    _FORMAT_KEY = 'format'
+    _ENTRIES_KEY = 'entries'
+    _ENTRY_ENCRYPTED_FORMAT = 'entry-encrypted-v1'
+
+    def __init__(self, cache_file: str, vault: FiggyVault = None):
+        self._cache_file = cache_file
+        self._name = os.path.basename(cache_file)
+        self.vault = vault
+        self._memo: Tuple[Optional[Tuple[int, int, int]], Dict] = (None, {})
+        self._opened: Dict[str, Tuple[str, Dict]] = {}
+
+    def __get_lock(self):
+        return FileLock(f'{self._cache_file}.lock')
+
+    def __signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self._cache_file)
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def __parse(self, data: bytes) -> Dict:
+        """
+        Parse the contents of a cache file into a document of cache_key -> stored entry. Primed files (from older
+        versions of figgy) are treated as empty documents.
+
+        :param data: data read from the file
+        :return: parsed document. For vault-backed caches each value is a sealed (encrypted) entry.
+        """
+        if data == bytes(EMPTY_CACHE_STR, 'utf-8'):
+            return {}
+
+        if not self.vault:
+            return jsonpickle.decode(data.decode('utf-8'))
+
+        if data.startswith(b'{'):
+            document = json.loads(data.decode('utf-8'))
+            if document.get(self._FORMAT_KEY) != self._ENTRY_ENCRYPTED_FORMAT:
+                raise json.JSONDecodeError(f"Unrecognized cache format in {self._cache_file}", '', 0)
+
+            return document.get(self._ENTRIES_KEY, {})
+
+        # Legacy format: the whole file is a single encrypted blob. Reseal each entry individually so the next write
+        # persists the per-entry format.
+        legacy: Dict = jsonpickle.decode(self.vault.decrypt(data).decode('utf-8'))
+        return {key: self.__seal(entry) for key, entry in legacy.items()}
+
+    def __serialize(self, contents: Dict) -> bytes:
+        if not self.vault:
+            return bytes(jsonpickle.dumps(contents), 'utf-8')
+
+        return bytes(json.dumps({self._FORMAT_KEY: self._ENTRY_ENCRYPTED_FORMAT, self._ENTRIES_KEY: contents}), 'utf-8')
+
+    def __seal(self, entry: Dict) -> Any:
+        """
+        Encrypt a single entry if this cache has an assigned cryptography vault.
+        """
+        if not self.vault:
+            return entry
+
+        return self.vault.encrypt(jsonpickle.encode(entry)).decode('utf-8')
+
+    def __open(self, cache_key: str, sealed: Any) -> Optional[Dict]:
+        """
+        Decrypt a single sealed entry. Decrypted entries are memoized against their ciphertext, so an unchanged entry
+        is only ever decrypted once.
+        """
+        if sealed is None or not self.vault:
+            return sealed
+
+        opened = self._opened.get(cache_key)
+        if opened and opened[0] == sealed:
+            return opened[1]
+
+        with CacheStats.timer(self._name, cache_key, 'decrypt_ms'):
+            entry = jsonpickle.decode(self.vault.decrypt(sealed.encode('utf-8')).decode('utf-8'))
+
+        self._opened[cache_key] = (sealed, entry)
+        return entry
+
+    def _load(self) -> Dict:
+        """
+        :return: The decoded cache document, served from memory if the file has not changed since it was last read.
+        """
+        signature = self.__signature()
+        memo_signature, contents = self._memo
+        if signature is not None and signature == memo_signature:
+            return contents
+
+        if signature is None:
+            return {}
+
+        with open(self._cache_file, 'rb') as cache:
+            data = cache.read()
+
+        CacheStats.record(self._name, CacheStats.WHOLE_CACHE, bytes_read=len(data))
+        with CacheStats.timer(self._name, CacheStats.WHOLE_CACHE, 'decode_ms'):
+            contents = self.__parse(data)
+
+        # A writer may have replaced the file while we were reading it. Only memoize if it's still the same file.
+        if self.__signature() == signature:
+            self._memo = (signature, contents)
+
+        return contents
+
+    def __write(self, contents: Dict):
+        data = self.__serialize(contents)
+        atomic_write(self._cache_file, data)
+        CacheStats.record(self._name, CacheStats.WHOLE_CACHE, bytes_written=len(data))
+        self._memo = (self.__signature(), contents)
+
+    @contextmanager
+    def session(self) -> Iterator[CacheStorage]:
+        lock = self.__get_lock()
+        with CacheStats.timer(self._name, CacheStats.WHOLE_CACHE, 'lock_wait_ms'):
+            lock.acquire()
+
+        try:
+            # Shallow copy so uncommitted changes never leak into the memoized document
+            document = DocumentSession(dict(self._load()), opener=self.__open, sealer=self.__seal)
+            yield document
+
+            if document.dirty:
+                self.__write(document.contents)
+        finally:
+            lock.release()
+
+    def read(self, cache_key: str) -> Optional[Dict]:
+        return self.__open(cache_key, self._load().get(cache_key))
+
+    def write(self, cache_key: str, entry: Dict) -> None:
+        with self.session() as document:
+            document.write(cache_key, entry)
+
+    def remove(self, cache_key: str) -> None:
+        with self.session() as document:
+            document.remove(cache_key)
+
+    def keys(self) -> List[str]:
+        return list(self._load().keys())
+
+    def wipe(self) -> None:
+        log.info(f"Wiping cache file: {self._cache_file}")
+        with self.__get_lock():
+            self.__write({})
+
+
+class SqliteStorage(CacheStorage):
+    """
+    Stores each entry as its own row in a SQLite database running in WAL mode. Lookups and writes only touch the row
+    for the targeted cache key, so large caches (like parameter names) don't need to be decoded or rewritten in
+    their entirety when a single key changes. Readers are never blocked by writers.
+    """
+
+    _TABLE = 'figgy_cache'
+
+    # Reads record when each entry was last accessed for LRU eviction. To keep reads cheap, the access time is only
+    # persisted if the recorded value is older than this resolution.
+    ACCESS_RESOLUTION_MS = 60 * 60 * 1000  # 1 hour
+
+    def __init__(self, db_file: str):
+        self._db_file = db_file
+        self._name = os.path.basename(db_file)
+        self._local = threading.local()
+
+        # Access times recorded by reads, persisted by the next write transaction so reads never take the write lock.
+        self._pending_access: Dict[str, int] = {}
+        self._access_lock = threading.Lock()
+        self._access_flush_registered = False
+
+    @staticmethod
+    def for_cache(cache_name: str) -> "SqliteStorage":
+        """
+        :return: The database of a named cache. These caches used to be stored in a `<name>-cache.json` file, which is
+            removed if it's still around. Nothing reads it anymore, and the janitor never removes files it doesn't own.
+        """
+        legacy_file = f'{CACHE_OTHER_DIR}/{cache_name}-cache.json'
+        for path in [legacy_file, f'{legacy_file}.lock']:
+            try:
+                os.remove(path)
+                log.info(f"Removed legacy cache file: {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                log.info(f"Unable to remove legacy cache file: {path}. Error: {e}")
+
+        return SqliteStorage(f'{CACHE_OTHER_DIR}/{cache_name}-cache.db')
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            try:
+                conn = self.__connect()
+            except sqlite3.DatabaseError as e:
+                log.info(f"Cache database at {self._db_file} is corrupt, recreating. Error: {e}")
+                self.__remove_files()
+                conn = self.__connect()
+
+            self._local.conn = conn
+
+        return conn
+
+    def __connect(self) -> sqlite3.Connection:
+        # isolation_level=None puts the connection in autocommit mode, multi-statement writes use explicit transactions
+        conn = sqlite3.connect(self._db_file, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'CREATE TABLE IF NOT EXISTS {self._TABLE} ('
+                     f'cache_key TEXT PRIMARY KEY, '
+                     f'payload TEXT NOT NULL, '
+                     f'last_write INTEGER NOT NULL, '
+                     f'last_refresh INTEGER NOT NULL, '
+                     f'last_access INTEGER NOT NULL DEFAULT 0)')
+
+        columns = [row[1] for row in conn.execute(f'PRAGMA table_info({self._TABLE})')]
+        if 'last_access' not in columns:
+            conn.execute(f'ALTER TABLE {self._TABLE} ADD COLUMN last_access INTEGER NOT NULL DEFAULT 0')
+
+        return conn
+
+    @property
+    def path(self) -> str:
+        return self._db_file
+
+    def __remove_files(self):
+        for suffix in ['', '-wal', '-shm']:
+            try:
+                os.remove(f'{self._db_file}{suffix}')
+            except OSError:
+                pass
+
+    @contextmanager
+    def session(self) -> Iterator[CacheStorage]:
+        conn = self._conn()
+        if conn.in_transaction:
+            yield self
+            return
+
+        with CacheStats.timer(self._name, CacheStats.WHOLE_CACHE, 'lock_wait_ms'):
+            conn.execute('BEGIN IMMEDIATE')
+
+        try:
+            self.__write_access(conn)
+            yield self
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        else:
+            conn.execute('COMMIT')
+
+    def read(self, cache_key: str) -> Optional[Dict]:
+        row = self._conn().execute(f'SELECT payload, last_write, last_refresh, last_access FROM {self._TABLE} '
+                                   f'WHERE cache_key = ?', (cache_key,)).fetchone()
+        if not row:
+            return None
+
+        payload, last_write, last_refresh, last_access = row
+        CacheStats.record(self._name, cache_key, bytes_read=len(payload))
+        now = Utils.millis_since_epoch()
+        if now - last_access > self.ACCESS_RESOLUTION_MS:
+            self.__record_access(cache_key, now)
+
+        with CacheStats.timer(self._name, cache_key, 'decode_ms'):
+            value = jsonpickle.decode(payload)
+
+        return {
+            STORE_KEY: value,
+            LAST_WRITE_KEY: last_write,
+            LAST_REFRESH_KEY: last_refresh,
+        }
+
+    def __record_access(self, cache_key: str, accessed_at: int) -> None:
+        with self._access_lock:
+            self._pending_access[cache_key] = accessed_at
+            if not self._access_flush_registered:
+                atexit.register(self.flush_access)
+                self._access_flush_registered = True
+
+    def __write_access(self, conn: sqlite3.Connection) -> None:
+        with self._access_lock:
+            pending, self._pending_access = self._pending_access, {}
+
+        if pending:
+            conn.executemany(f'UPDATE {self._TABLE} SET last_access = MAX(last_access, ?) WHERE cache_key = ?',
+                             [(accessed_at, cache_key) for cache_key, accessed_at in pending.items()])
+
+    def flush_access(self) -> None:
+        """
+        Persist access times recorded by reads since the last write. Never waits on another writer, if the database is
+        locked they are dropped. Runs at exit for processes that only read.
+        """
+        try:
+            conn = sqlite3.connect(self._db_file, timeout=0, isolation_level=None)
+            try:
+                self.__write_access(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            log.info(f"Skipped recording cache access times in {self._db_file}: {e}")
+
+    def write(self, cache_key: str, entry: Dict) -> None:
+        payload = jsonpickle.encode(entry.get(STORE_KEY))
+        CacheStats.record(self._name, cache_key, bytes_written=len(payload))
+        self._conn().execute(f'INSERT OR REPLACE INTO {self._TABLE} '
+                             f'(cache_key, payload, last_write, last_refresh, last_access) VALUES (?, ?, ?, ?, ?)',
+                             (cache_key, payload, entry.get(LAST_WRITE_KEY, 0), entry.get(LAST_REFRESH_KEY, 0),
+                              Utils.millis_since_epoch()))
+
+    def remove(self, cache_key: str) -> None:
+        self._conn().execute(f'DELETE FROM {self._TABLE} WHERE cache_key = ?', (cache_key,))
+
+    def keys(self) -> List[str]:
+        return [row[0] for row in self._conn().execute(f'SELECT cache_key FROM {self._TABLE}')]
+
+    def wipe(self) -> None:
+        log.info(f"Wiping cache database: {self._db_file}")
+        self._conn().execute(f'DELETE FROM {self._TABLE}')
+
+    def usage(self) -> List[Tuple[str, int, int]]:
+        """
+        :return: (cache_key, last_access, payload size in bytes) of every entry.
+        """
+        return self._conn().execute(f'SELECT cache_key, MAX(last_access, last_write), LENGTH(payload) '
+                                    f'FROM {self._TABLE}').fetchall()
+
+    def expire(self, written_before: int) -> int:
+        """
+        Remove all entries last written before `written_before`.
+        :return: number of removed entries
+        """
+        return self._conn().execute(f'DELETE FROM {self._TABLE} WHERE last_write < ?', (written_before,)).rowcount
+
+    def vacuum(self) -> None:
+        """
+        Rebuild the database file, returning the space freed by removed entries to the file system.
+        """
+        conn = self._conn()
+        conn.execute('VACUUM')
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
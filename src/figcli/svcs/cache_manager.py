@@ -1,64 +1,139 @@
 import json
 import logging
 import os
-import cachetools.func
-from typing import Dict, Any, Union, Set, Tuple, List, Callable
-
-import jsonpickle
-from filelock import FileLock
+from contextlib import contextmanager, ExitStack
+from typing import Dict, Any, Union, Set, Tuple, List, Callable, Optional, Iterator
 
 from figcli.config import *
+from figcli.svcs.cache.name_store import NameStore
+from figcli.svcs.cache.storage import CacheStorage, JsonFileStorage, STORE_KEY, LAST_WRITE_KEY, LAST_REFRESH_KEY
+from figcli.svcs.observability.cache_stats import CacheStats
 from figcli.svcs.vault import FiggyVault
 from figcli.utils.utils import Utils
 
 log = logging.getLogger(__name__)
 
-EMPTY_CACHE_STR = 'CACHE_EMPTY'
-
-
-def write_empty_cache_file(path: str):
-    with open(path, "w") as cache:
-        cache.write(EMPTY_CACHE_STR)
-    log.info(f"Cache written at path: {path}")
-
-
-def prime_cache(function):
-    def inner(self, *args, **kwargs):
-        if not os.path.exists(self._cache_file):
-            log.info("Cache file doesn't exist. Priming cache file.")
-            write_empty_cache_file(self._cache_file)
-            log.info("Cache primed.")
-        return function(self, *args, **kwargs)
-
-    return inner
-
 
 def wipe_bad_cache(function):
     def inner(self, *args, **kwargs):
         try:
-            function(self, *args, **kwargs)
-        except json.JSONDecodeError as e:
+            return function(self, *args, **kwargs)
+        except json.JSONDecodeError:
             log.info("Cache file has been corrupted, recreating.")
-            os.remove(self._cache_file)
-            write_empty_cache_file(self._cache_file)
+            self._storage.wipe()
 
         return function(self, *args, **kwargs)
 
     return inner
 
 
+class CacheTransaction:
+    """
+    A unit of work against a single cache. Every operation performed through a transaction shares one read of the
+    underlying storage, and all changes are persisted together when the transaction is committed.
+    Retrieve one with CacheManager.transaction()
+    """
+
+    def __init__(self, storage: CacheStorage):
+        self._storage = storage
+
+    def last_refresh(self, cache_key: str) -> int:
+        return (self._storage.read(cache_key) or {}).get(LAST_REFRESH_KEY, 0)
+
+    def get(self, cache_key: str, default=None) -> Tuple[int, Any]:
+        cache = self._storage.read(cache_key) or {}
+        log.debug(f'Returning items from cache for cache key: {cache_key}')
+        return cache.get(LAST_WRITE_KEY, 0), cache.get(STORE_KEY, default)
+
+    def write(self, cache_key: str, object: Any) -> None:
+        object = list(object) if isinstance(object, Set) else object  # set is not json serializable
+        self._storage.write(cache_key, {
+            STORE_KEY: object,
+            LAST_WRITE_KEY: Utils.millis_since_epoch(),
+            LAST_REFRESH_KEY: Utils.millis_since_epoch()
+        })
+
+    def remove(self, cache_key: str) -> None:
+        self._storage.remove(cache_key)
+
+    def append(self, cache_key: str, objects: Union[Dict, Set[Any]]) -> None:
+        if isinstance(objects, Set):
+            objects = list(objects)
+
+        if len(objects) > 0:
+            log.debug(f'Appending {len(objects)} items to local cache: {objects}')
+
+            cache = self._storage.read(cache_key) or {}
+            refresh_time = cache.get(LAST_REFRESH_KEY, 0)
+            cache_obj = cache.get(STORE_KEY)
+
+            if isinstance(cache_obj, Dict) and isinstance(objects, Dict) or cache_obj is None:
+                cache_obj = {**cache_obj, **objects} if cache_obj else objects
+            elif isinstance(cache_obj, List) and isinstance(objects, List) or cache_obj is None:
+                cache_obj = list(set(cache_obj + objects)) if cache_obj else objects
+            else:
+                raise RuntimeError(
+                    "Invalid state detected. Cache contains an invalid type that cannot be appended to, "
+                    "or the type provided does not match the type stored in the cache.")
+
+            self._storage.write(cache_key, {
+                STORE_KEY: cache_obj,
+                LAST_WRITE_KEY: Utils.millis_since_epoch(),
+                LAST_REFRESH_KEY: refresh_time,
+            })
+        else:
+            log.info('No cached items found to add to cache.')
+
+    def delete(self, cache_key: str, objects: Union[Dict, Set[Any]]) -> None:
+        if isinstance(objects, Set):
+            objects = list(objects)
+
+        if len(objects) > 0:
+            log.info(f'Deleting {len(objects)} items from local cache: {objects}')
+
+            cache = self._storage.read(cache_key) or {}
+            refresh_time = cache.get(LAST_REFRESH_KEY, 0)
+            cache_obj = cache.get(STORE_KEY)
+            log.info(f'In cache: {cache_obj}')
+
+            if isinstance(cache_obj, Dict) and isinstance(objects, Dict) or cache_obj is None:
+                log.info(f'Cache Obj is a dict')
+                if cache_obj:
+                    cache_obj = {key: val for key, val in cache_obj.items() if key not in objects}
+
+            elif isinstance(cache_obj, List) and isinstance(objects, List) or cache_obj is None:
+                log.info(f"Cache obj is a list..")
+                if cache_obj:
+                    cache_obj = list(set(cache_obj) - set(objects))
+
+            else:
+                raise RuntimeError(
+                    "Invalid state detected. Cache contains an invalid type that cannot be appended to, "
+                    "or the type provided does not match the type stored in the cache.")
+
+            log.info(f'New cache obj: {cache_obj}')
+            self._storage.write(cache_key, {
+                STORE_KEY: cache_obj,
+                LAST_WRITE_KEY: Utils.millis_since_epoch(),
+                LAST_REFRESH_KEY: refresh_time,
+            })
+        else:
+            log.info('No cached items found to add to cache.')
+
+
 class CacheManager:
     """
-    Manages a local cache file to enhance figgy performance
+    Manages a local cache to enhance figgy performance. Entries are persisted through a pluggable CacheStorage backend,
+    by default a single (optionally encrypted) json file.
     """
 
-    _STORE_KEY = 'cache'
-    _LAST_WRITE_KEY = 'last_write'
-    _LAST_REFRESH_KEY = 'last_refresh'
+    _STORE_KEY = STORE_KEY
+    _LAST_WRITE_KEY = LAST_WRITE_KEY
+    _LAST_REFRESH_KEY = LAST_REFRESH_KEY
     DEFAULT_REFRESH_INTERVAL = 60 * 60 * 24 * 7 * 1000  # 1 week in MS
 
     def __init__(self, cache_name: Union[str, CliCommand, None] = "default", file_override: Union[str, None] = None,
-                 vault: FiggyVault = None):
+                 vault: FiggyVault = None, storage: Optional[CacheStorage] = None):
         cache_name = cache_name.name if isinstance(cache_name, CliCommand) else cache_name
         self._cache_file: str = f'{CACHE_OTHER_DIR}/{cache_name}-cache.json' if not file_override else file_override
         os.makedirs(CACHE_OTHER_DIR, exist_ok=True)
@@ -67,55 +142,51 @@ class CacheManager:
             os.makedirs("/".join(file_override.split('/')[:-1]), exist_ok=True)
 
         self.vault = vault
+        self._storage: CacheStorage = storage if storage else JsonFileStorage(self._cache_file, vault=vault)
+        self._name_stores: Dict[str, NameStore] = {}
+        self._stats_name = cache_name if not file_override else os.path.basename(file_override)
 
-    def __get_lock(self):
-        return FileLock(f'{self._cache_file}.lock')
-
-    @cachetools.func.ttl_cache(maxsize=3, ttl=500)
-    def __decrypt(self, data: bytes) -> str:
+    def name_store(self, cache_key: str) -> NameStore:
         """
-        Decrypt the contents of a file, except when the file has been primed and we don't know if this file is going
-        to be encrypted or decrypted eventually. If the file's contents are the primed contents, return an empty
-        pickled json object and avoid decryption.
-
-        :param data: data read from the file to decrypt
-        :return: decrypted data if it was decrypted, or just the data if there is no need to decrypt
+        Large sets of names (like all parameter names in an account) are stored in a dedicated compact format instead
+        of as a regular cache entry.
+        :param cache_key: key identifying the set of names
+        :return: The NameStore persisted alongside this cache for this cache_key
         """
-        if data == bytes(EMPTY_CACHE_STR, 'utf-8'):
-            return jsonpickle.encode({})
+        if cache_key not in self._name_stores:
+            prefix = os.path.splitext(self._cache_file)[0]
+            self._name_stores[cache_key] = NameStore(f'{prefix}-{cache_key}.names')
 
-        if self.vault:
-            data = self.vault.decrypt(data).decode('utf-8')
-            return data
-        else:
-            return data.decode('utf-8')
+        return self._name_stores[cache_key]
 
-    def __encrypt(self, data: str) -> bytes:
+    def __reader(self) -> CacheTransaction:
         """
-        Encrypt and store this data in the cache if this cache has an assigned cryptography vault.
-        :param data: data to encrypt
-        :return: encrypted bytes
+        Lookups don't need isolation from other operations, so they go straight to storage without opening a
+        transaction. This keeps reads lock-free.
         """
+        return CacheTransaction(self._storage)
 
-        if self.vault:
-            return self.vault.encrypt(bytes(data, 'utf-8'))
-        else:
-            return bytes(data, 'utf-8')
-
-    @cachetools.func.ttl_cache(maxsize=3, ttl=500)
-    def __read(self) -> str:
-        with self.__get_lock():
-            with open(self._cache_file, 'rb') as cache:
-                val = self.__decrypt(cache.read())
-                return val
-
-    def __write(self, data: str):
-        self.__read.cache_clear()
-        self.__decrypt.cache_clear()
+    @contextmanager
+    def transaction(self) -> Iterator[CacheTransaction]:
+        """
+        Open a transaction against this cache. The cache is read once when the transaction begins, and all writes
+        performed through the transaction are committed in a single write when the `with` block exits without error.
+
+        Example:
+            with cache_mgr.transaction() as txn:
+                last_write, names = txn.get(key)
+                txn.append(key, added)
+                txn.delete(key, deleted)
+        """
+        with ExitStack() as stack:
+            try:
+                session = stack.enter_context(self._storage.session())
+            except json.JSONDecodeError:
+                log.info("Cache file has been corrupted, recreating.")
+                self._storage.wipe()
+                session = stack.enter_context(self._storage.session())
 
-        with self.__get_lock():
-            with open(self._cache_file, 'wb') as cache:
-                cache.write(self.__encrypt(data))
+            yield CacheTransaction(session)
 
     def get_val_or_refresh(self, cache_key: str, refresher: Callable, args=[],
                            max_age: int = DEFAULT_REFRESH_INTERVAL) -> Any:
@@ -123,7 +194,6 @@ class CacheManager:
         last_write, val = self.get_or_refresh(cache_key, refresher, *args, max_age=max_age)
         return val
 
-    @prime_cache
     @wipe_bad_cache
     def get_or_refresh(self, cache_key: str, refresher: Callable, *args, max_age: int = DEFAULT_REFRESH_INTERVAL) \
             -> Tuple[int, Any]:
@@ -131,7 +201,10 @@ class CacheManager:
 
         last_write, val = self.get(cache_key)
         if Utils.millis_since_epoch() - last_write > max_age or not val:
-            new_val = refresher(*args)
+            with CacheStats.timer(self._stats_name, cache_key, 'remote_ms'):
+                new_val = refresher(*args)
+
+            CacheStats.record(self._stats_name, cache_key, refreshes=1)
             self.write(cache_key, new_val)
             log.info(f"{cache_key} not found in cache. It was fetched.")
             return Utils.millis_since_epoch(), new_val
@@ -139,7 +212,6 @@ class CacheManager:
             log.info(f"Value for key: {cache_key} was found in cache.")
             return last_write, val
 
-    @prime_cache
     @wipe_bad_cache
     def last_refresh(self, cache_key: str) -> int:
         """
@@ -147,13 +219,8 @@ class CacheManager:
         :param cache_key: key
         :return: int - millis since epoch - the last time this cache key was totally overwritten by the write method.
         """
+        return self.__reader().last_refresh(cache_key)
 
-        cache_string = self.__read()
-        contents: Dict = jsonpickle.decode(cache_string)
-
-        return contents.get(cache_key, {}).get(self._LAST_REFRESH_KEY, 0)
-
-    @prime_cache
     @wipe_bad_cache
     def write(self, cache_key: str, object: Any) -> None:
         """
@@ -163,19 +230,11 @@ class CacheManager:
         :param object: Any - Object to write, must be serializable by `json` library
         """
         try:
-            object = list(object) if isinstance(object, Set) else object  # set is not json serializable
-            contents: Dict = jsonpickle.decode(self.__read())
-            contents[cache_key] = {
-                self._STORE_KEY: object,
-                self._LAST_WRITE_KEY: Utils.millis_since_epoch(),
-                self._LAST_REFRESH_KEY: Utils.millis_since_epoch()
-            }
-
-            self.__write(jsonpickle.dumps(contents))
+            with self.transaction() as txn:
+                txn.write(cache_key, object)
         except Exception as e:
             print(f"Error writing to cache key: {cache_key}: {e}")
 
-    @prime_cache
     @wipe_bad_cache
     def get(self, cache_key: str, default=None) -> Tuple[int, Any]:
         """
@@ -184,18 +243,13 @@ class CacheManager:
         :param default: Default value to return if the key doesn't exist in cache.
         :return: Tuple with last_write time, and the stored object.
         """
-
-        cache_contents = self.__read()
-        contents: Dict = jsonpickle.decode(cache_contents)
-        cache = contents.get(cache_key, {})
-        result = cache.get(self._LAST_WRITE_KEY, 0), cache.get(self._STORE_KEY, default)
-        log.debug(f'Returning items from cache for cache key: {cache_key}')
+        result = self.__reader().get(cache_key, default)
+        CacheStats.record(self._stats_name, cache_key, **{'hits' if result[0] else 'misses': 1})
         return result
 
     def get_val(self, cache_key: str, default=None) -> Any:
         return self.get(cache_key, default)[1]
 
-    @prime_cache
     @wipe_bad_cache
     def append(self, cache_key: str, objects: Union[Dict, Set[Any]]):
         """
@@ -207,39 +261,8 @@ class CacheManager:
         :param cache_key: Key to append or merge items with
         :param objects: Objects to add.
         """
-
-        if isinstance(objects, Set):
-            objects = list(objects)
-
-        if len(objects) > 0:
-            log.debug(f'Appending {len(objects)} items to local cache: {objects}')
-
-            contents: Dict = jsonpickle.decode(self.__read())
-            cache = contents.get(cache_key, {})
-            refresh_time = cache.get(self._LAST_REFRESH_KEY, 0)
-            cache_obj = cache.get(self._STORE_KEY)
-
-            if isinstance(cache_obj, Dict) and isinstance(objects, Dict) or cache_obj is None:
-                if cache_obj:
-                    cache_obj.update(objects)
-                else:
-                    cache_obj = objects
-            elif isinstance(cache_obj, List) and isinstance(objects, List) or cache_obj is None:
-                cache_obj = list(set(cache_obj + objects)) if cache_obj else objects
-            else:
-                raise RuntimeError(
-                    "Invalid state detected. Cache contains an invalid type that cannot be appended to, "
-                    "or the type provided does not match the type stored in the cache.")
-
-            contents[cache_key] = {
-                self._STORE_KEY: cache_obj,
-                self._LAST_WRITE_KEY: Utils.millis_since_epoch(),
-                self._LAST_REFRESH_KEY: refresh_time,
-            }
-
-            self.__write(jsonpickle.dumps(contents))
-        else:
-            log.info('No cached items found to add to cache.')
+        with self.transaction() as txn:
+            txn.append(cache_key, objects)
 
     def delete(self, cache_key: str, objects: Union[Dict, Set[Any]]):
         """
@@ -247,45 +270,16 @@ class CacheManager:
         :param cache_key: Key to potentially delete items from
         :param objects: *Keys* in the cached DICT to delete, or items in a cached LIST to delete.
         """
+        with self.transaction() as txn:
+            txn.delete(cache_key, objects)
 
-        if isinstance(objects, Set):
-            objects = list(objects)
-
-        if len(objects) > 0:
-            log.info(f'Deleting {len(objects)} items from local cache: {objects}')
-
-            contents: Dict = jsonpickle.decode(self.__read())
-            cache = contents.get(cache_key, {})
-            refresh_time = cache.get(self._LAST_REFRESH_KEY, 0)
-            cache_obj = cache.get(self._STORE_KEY)
-            log.info(f'In cache: {cache_obj}')
-
-            if isinstance(cache_obj, Dict) and isinstance(objects, Dict) or cache_obj is None:
-                log.info(f'Cache Obj is a dict')
-                if cache_obj:
-                    for obj in objects:
-                        del cache_obj[obj]
-
-            elif isinstance(cache_obj, List) and isinstance(objects, List) or cache_obj is None:
-                log.info(f"Cache obj is a list..")
-                if cache_obj:
-                    cache_obj = list(set(cache_obj) - set(objects))
-
-            else:
-                raise RuntimeError(
-                    "Invalid state detected. Cache contains an invalid type that cannot be appended to, "
-                    "or the type provided does not match the type stored in the cache.")
-
-            log.info(f'New cache obj: {cache_obj}')
-            contents[cache_key] = {
-                self._STORE_KEY: cache_obj,
-                self._LAST_WRITE_KEY: Utils.millis_since_epoch(),
-                self._LAST_REFRESH_KEY: refresh_time,
-            }
-
-            self.__write(jsonpickle.dumps(contents))
-        else:
-            log.info('No cached items found to add to cache.')
+    @wipe_bad_cache
+    def evict(self, cache_key: str) -> None:
+        """
+        Remove a single entry from the cache, the next lookup of `cache_key` will refresh it.
+        """
+        with self.transaction() as txn:
+            txn.remove(cache_key)
 
     def wipe_cache(self):
-        self.__write(jsonpickle.dumps({}))
+        self._storage.wipe()
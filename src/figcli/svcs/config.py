@@ -1,10 +1,15 @@
 import json
 import logging
+import operator
+import threading
+import uuid
 import cachetools.func
-from typing import Set, List, Tuple, Optional
+from collections import deque
+from typing import Set, List, Tuple, Optional, Dict, Any, Callable, TypeVar, Deque, FrozenSet, Iterable, Iterator
 
 from botocore.exceptions import ClientError
-from cachetools import cached, TTLCache
+from cachetools import cached, cachedmethod, TTLCache
+from cachetools.keys import hashkey
 from figgy.data.dao.audit import AuditDao
 from figgy.data.dao.config import ConfigDao
 from figgy.data.dao.replication import ReplicationDao
@@ -16,13 +21,24 @@ from figgy.models.run_env import RunEnv
 from figgy.svcs.fig_service import FigService
 
 from figcli.config import PS_FIGGY_REPL_KEY_ID_PATH, PS_FIGGY_ALL_KMS_KEYS_PATH, PS_FIGGY_REGIONS
+from figcli.config.tuning import CONFIG_BULK_GET_BATCH_SIZE, CONFIG_BULK_GET_MAX_THREADS
+from figcli.models.fig_lookup import FigLookup, FigLookupState
 from figcli.models.kms_key import KmsKey
+from figcli.models.name_set_delta import NameSetDelta
+from figcli.svcs.cache.config_cache_scanner import ConfigCacheScanner
+from figcli.svcs.cache.name_index import NameIndex
+from figcli.svcs.cache.replication_index import ReplicationIndex
+from figcli.svcs.cache.replication_scanner import ReplicationScanner
 from figcli.svcs.cache_manager import CacheManager
 from figcli.svcs.kms import KmsService
+from figcli.svcs.observability.cache_stats import CacheStats
+from figcli.svcs.parameter_describer import ParameterDescriber
 from figcli.utils.utils import Utils
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
 
 class ParameterUndecryptable(Exception):
     pass
@@ -37,51 +53,166 @@ class ConfigService:
     caches for the fastest possible lookup times.
     """
     _PS_NAME_CACHE_KEY = 'parameter_names'
-    MEMORY_CACHED_NAMES: Set[str] = []
-    MEMORY_CACHE_REFRESH_INTERVAL: int = 5000
-    MEMORY_CACHE_LAST_REFRESH_TIME: int = 0
+    _REPL_INDEX_CACHE_KEY = 'replication_index'
+
+    # Staleness budgets (in MS) callers may pass to parameter name lookups.
+    FRESH: int = 0
+    INTERACTIVE_STALENESS: int = 30 * 1000
+    MEMORY_CACHE_REFRESH_INTERVAL: int = 5000  # Default budget
+    NAME_HISTORY_SIZE: int = 100
     DEFAULT_FIG_CACHE_DURATION: int = 60 * 60 * 24 * 7 * 1000  # 1 week in MS
+    REPLICATION_INDEX_REFRESH_INTERVAL: int = 30 * 1000
 
     def __init__(self, config_dao: ConfigDao, ssm: SsmDao, replication_dao: ReplicationDao,
-                 cache_mgr: CacheManager, kms_svc: KmsService, run_env: RunEnv):
+                 cache_mgr: CacheManager, kms_svc: KmsService, run_env: RunEnv,
+                 cache_scanner: Optional[ConfigCacheScanner] = None,
+                 repl_scanner: Optional[ReplicationScanner] = None,
+                 describer: Optional[ParameterDescriber] = None):
         self._config_dao = config_dao
+        self._cache_scanner = cache_scanner
+        self._repl_scanner = repl_scanner
+        self._describer = describer
         self._cache_mgr = cache_mgr
         self._run_env = run_env
         self._repl = replication_dao
         self._ssm: SsmDao = ssm
         self._kms = kms_svc
         self._fig_svc: FigService = FigService(ssm)
+        self._name_index: Optional[NameIndex] = None
+        self._name_index_watermark: int = 0
+
+        # (millis since epoch the names were last known to match the remote cache, names)
+        self._memory_names: Tuple[int, Optional[Set[str]]] = (0, None)
+        self._names_lock = threading.Lock()
+
+        # Bumped every time the name set changes. Views derived from the name set are memoized against it.
+        self._names_generation: int = 0
+        self._names_token: str = uuid.uuid4().hex[:8]
+        self._derived: Dict[str, Tuple[str, Any]] = {}
+
+        # (generation, added, deleted) for recent name set changes, so clients can catch up without a full reload
+        self._names_history: Deque[Tuple[int, FrozenSet[str], FrozenSet[str]]] = \
+            deque(maxlen=self.NAME_HISTORY_SIZE)
+
+        # (millis since epoch the index was loaded, index)
+        self._repl_index: Tuple[int, Optional[ReplicationIndex]] = (0, None)
+        self._repl_index_lock = threading.Lock()
+
+        # Memoized per-name lookups. Entries are evicted name by name as this service saves & deletes figs.
+        self._memo_lock = threading.RLock()
+        self._encrypted_cache = TTLCache(maxsize=256, ttl=30)
+        self._repl_config_cache = TTLCache(maxsize=256, ttl=30)
+        self._repl_configs_by_source_cache = TTLCache(maxsize=256, ttl=30)
 
-    def get_root_namespaces(self) -> List[str]:
-        all_params = self.get_parameter_names()
-        return sorted(list(set([f"/{p.split('/')[1]}" for p in all_params])))
+    def get_root_namespaces(self, max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> List[str]:
+        return self.get_or_derive('root-namespaces', lambda: self.get_name_index(max_staleness).root_namespaces(),
+                                  max_staleness)
+
+    def get_name_index(self, max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> NameIndex:
+        """
+        :param max_staleness: See `get_parameter_names`
+        :return: An index over all parameter names. The index is kept up to date incrementally each time parameter
+            names are refreshed.
+        """
+        all_parameters = self.get_parameter_names(max_staleness)
+        if self._name_index is None:
+            self._name_index = NameIndex(all_parameters)
+
+        return self._name_index
+
+    def __sync_name_index(self, all_parameters: Set[str], watermark: int, added: Set[str] = None,
+                          deleted: Set[str] = None, new_watermark: int = 0) -> None:
+        """
+        Apply a name delta to the in-memory name index. If the local name store was modified by some other process
+        since the index was last synced, the delta alone is insufficient and the index is rebuilt instead.
+        """
+        if self._name_index is None:
+            self._name_index_watermark = new_watermark
+            return
+
+        if added is not None and deleted is not None and watermark == self._name_index_watermark:
+            self._name_index.update(added, deleted)
+        else:
+            self._name_index.reset(all_parameters)
+
+        self._name_index_watermark = new_watermark
 
     @Utils.trace
-    def get_parameter_names(self) -> Set[str]:
+    def get_parameter_names(self, max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> Set[str]:
+        """
+        Looks up parameter names from three tiers, stopping at the first one that is fresh enough:
+
+            1. Process memory, if names were last synced with the remote cache within `max_staleness`.
+            2. The local name store, if it was last synced (by any figgy process) within `max_staleness`.
+            3. The remote cache, by querying names changed since the local name store was last written & merging
+               them into it.
+
+        Concurrent callers share a single in-flight lookup. Callers waiting on it accept its result if the lookup
+        started after they asked, or if it falls within their staleness budget.
+
+        :param max_staleness: How old, in MS, the returned names may be. Use FRESH for commands that must see every
+            change, e.g. sync & validate, and INTERACTIVE_STALENESS for prompts & completion.
+        :return: Set[str] names of all configs stored in ParameterStore. The returned set is shared & must not
+            be mutated.
+        """
+        requested_at = Utils.millis_since_epoch()
+        cache_key = f'{self._run_env.env}-{self._PS_NAME_CACHE_KEY}'
+
+        names = self.__memory_names(requested_at, max_staleness)
+        if names is None:
+            with self._names_lock:
+                names = self.__memory_names(requested_at, max_staleness)
+                if names is None:
+                    return self.__lookup_parameter_names(cache_key, max_staleness)
+
+        CacheStats.record('memory', cache_key, hits=1)
+        return names
+
+    def __memory_names(self, requested_at: int, max_staleness: int) -> Optional[Set[str]]:
+        synced_at, names = self._memory_names
+        if names is not None and (synced_at >= requested_at or requested_at - synced_at <= max_staleness):
+            return names
+
+        return None
+
+    def __lookup_parameter_names(self, cache_key: str, max_staleness: int) -> Set[str]:
         """
         Looks up local cached configs, then queries new config names from the remote cache, merges the two, and
         finally updates the local cache. This ensures very fast bootstrap times b/c querying thousands of parameter
         names from a remote cache can a bit too much time. `figgy` does not accept slow performance.
-
-        :return: Set[str] names of all configs stored in ParameterStore.
         """
-        cache_key = f'{self._run_env.env}-{self._PS_NAME_CACHE_KEY}'
+        name_store = self._cache_mgr.name_store(cache_key)
+        started_at = Utils.millis_since_epoch()
+        synced_at = started_at
 
         # Find last cache full refresh date
-        last_refresh = self._cache_mgr.last_refresh(cache_key)
+        last_refresh = name_store.last_refresh()
 
         # Do a full refresh if cache is too old.
-        if Utils.millis_since_epoch() - last_refresh > self.__CACHE_REFRESH_INTERVAL:
-            configs: Set[ConfigItem] = self._config_dao.get_config_names_after(0)
-            all_parameters: Set[str] = set([x.name for x in configs if x.state == ConfigState.ACTIVE])
-            self._cache_mgr.write(cache_key, all_parameters)
+        if started_at - last_refresh > self.__CACHE_REFRESH_INTERVAL:
+            with CacheStats.timer(self._run_env.env, cache_key, 'remote_ms'):
+                all_parameters: Set[str] = self.__get_all_remote_names()
+
+            name_store.write(all_parameters)
+            self.__sync_name_index(all_parameters, watermark=0, new_watermark=name_store.get()[0])
+            CacheStats.record(self._run_env.env, cache_key, misses=1, refreshes=1)
         else:
 
             # Get items from cache
-            last_write, cached_contents = self._cache_mgr.get(cache_key)
+            last_write, cached_contents = name_store.get()
+
+            CacheStats.record(self._run_env.env, cache_key, hits=1)
+
+            if started_at - last_write <= max_staleness:
+                # Recently synced by this or another figgy process, no need to query the remote cache.
+                self.__sync_name_index(cached_contents, watermark=last_write, added=set(), deleted=set(),
+                                       new_watermark=last_write)
+                self.__set_memory_names(last_write, cached_contents)
+                return cached_contents
 
             # Find new items added to remote cache table since last local cache write
-            updated_items: Set[ConfigItem] = self._config_dao.get_config_names_after(last_write)
+            with CacheStats.timer(self._run_env.env, cache_key, 'remote_ms'):
+                updated_items: Set[ConfigItem] = self._config_dao.get_config_names_after(last_write)
 
             # Add new names to cache
             added_names, deleted_names = set(), set()
@@ -94,19 +225,141 @@ class ConfigService:
                     # Default to add if no state set
                     added_names.add(item.name)
 
-            self._cache_mgr.append(cache_key, added_names)
-            self._cache_mgr.delete(cache_key, deleted_names)
+            if added_names or deleted_names:
+                name_store.apply(added_names, deleted_names)
+            else:
+                # Nothing changed remotely, but the names were still synced. Record it, or every later lookup would
+                # query the remote cache again, over an ever-widening window.
+                name_store.touch()
 
-            log.debug(f"Cached: {cached_contents}")
+            log.debug(f"Cached: {len(cached_contents)} names")
             log.debug(f"Cached: {deleted_names}")
             log.debug(f"Cached: {added_names}")
 
             all_parameters = set(cached_contents) - deleted_names | added_names
+            self.__sync_name_index(all_parameters, watermark=last_write, added=added_names, deleted=deleted_names,
+                                   new_watermark=name_store.get()[0])
 
+        self.__set_memory_names(synced_at, all_parameters)
         return all_parameters
 
-    def get_parameter_names_by_filter(self, filter_str: str):
-        return filter(lambda x: filter_str in x, self.get_parameter_names())
+    def __set_memory_names(self, synced_at: int, names: Set[str], added: Set[str] = None,
+                           deleted: Set[str] = None) -> None:
+        """
+        Replace the in-memory names, bumping the generation & recording the change in the name history if they
+        differ. If `added` & `deleted` aren't provided they are computed from the previous names.
+        """
+        _, previous = self._memory_names
+        if previous is None:
+            self._names_generation += 1
+        elif previous is not names:
+            if added is None or deleted is None:
+                added, deleted = names - previous, previous - names
+
+            if added or deleted:
+                self._names_generation += 1
+                self._names_history.append((self._names_generation, frozenset(added), frozenset(deleted)))
+
+        self._memory_names = (synced_at, names)
+
+    def __record_local_change(self, added: Set[str] = frozenset(), deleted: Set[str] = frozenset()) -> None:
+        """
+        Apply a put or delete made by this process to the in-memory names, so it is visible before it reaches the
+        remote cache.
+        """
+        with self._names_lock:
+            synced_at, names = self._memory_names
+            if names is None:
+                return
+
+            added, deleted = added - names, deleted & names
+            if not added and not deleted:
+                return
+
+            self.__set_memory_names(synced_at, (names - deleted) | added, added, deleted)
+            if self._name_index is not None:
+                self._name_index.update(added, deleted)
+                # The next sync with the name store must rebuild the index, it may not contain this change yet.
+                self._name_index_watermark = -1
+
+    def names_version(self, max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> str:
+        """
+        :return: An opaque version of the current name set, changes whenever the name set changes.
+        """
+        return self.get_parameter_names_with_version(max_staleness)[1]
+
+    def get_parameter_names_with_version(self, max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) \
+            -> Tuple[Set[str], str]:
+        """
+        :return: Tuple[names, version] - `get_parameter_names` and the `names_version` of exactly those names. Calling
+            the two separately could pair names with the version of an earlier or later name set.
+        """
+        self.get_parameter_names(max_staleness)
+        with self._names_lock:
+            return self._memory_names[1], f'{self._names_token}-{self._names_generation}'
+
+    def get_parameter_names_since(self, version: str,
+                                  max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> NameSetDelta:
+        """
+        :param version: A version previously returned by `names_version`
+        :return: Names added and deleted since `version`. If the changes since `version` are no longer known, e.g.
+            because it came from another process or is older than the retained history, the delta is flagged as a
+            full resync and the client must reload all names.
+        """
+        self.get_parameter_names(max_staleness)
+        token, _, generation = version.rpartition('-')
+
+        with self._names_lock:
+            current_generation = self._names_generation
+            history = list(self._names_history)
+
+        current = f'{self._names_token}-{current_generation}'
+        if not generation.isdigit() or token != self._names_token or int(generation) > current_generation:
+            return NameSetDelta(version=current, full_resync=True)
+
+        since = int(generation)
+        changes = [(added, deleted) for gen, added, deleted in history if gen > since]
+        if len(changes) < current_generation - since:
+            return NameSetDelta(version=current, full_resync=True)
+
+        all_added, all_deleted = set(), set()
+        for added, deleted in changes:
+            all_added = (all_added - deleted) | added
+            all_deleted = (all_deleted - added) | deleted
+
+        return NameSetDelta(version=current, added=sorted(all_added), deleted=sorted(all_deleted))
+
+    def get_or_derive(self, key: str, derive: Callable[[], T],
+                      max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> T:
+        """
+        Memoize a view derived from the name set, e.g. the browse tree, until the name set changes.
+
+        :param key: Unique key of this derived view
+        :param derive: Builds the view
+        """
+        version = self.names_version(max_staleness)
+        memo = self._derived.get(key)
+        if memo and memo[0] == version:
+            return memo[1]
+
+        # Version is taken before deriving, so a concurrent change at worst causes an extra rebuild.
+        value = derive()
+        self._derived[key] = (version, value)
+        return value
+
+    def __get_all_remote_names(self) -> Set[str]:
+        """
+        :return: All active parameter names in the remote cache. Uses a parallel segmented scan when available.
+        """
+        if self._cache_scanner:
+            return self._cache_scanner.active_names()
+
+        configs: Set[ConfigItem] = self._config_dao.get_config_names_after(0)
+        return set([x.name for x in configs if x.state == ConfigState.ACTIVE])
+
+    def get_parameter_names_by_filter(self, filter_str: str,
+                                      max_staleness: int = MEMORY_CACHE_REFRESH_INTERVAL) -> List[str]:
+        return self.get_name_index(max_staleness).search(filter_str)
 
     def get_parameter_with_description(self, name: str) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -125,6 +378,107 @@ class ConfigService:
             if "AccessDeniedException" == e.response['Error']['Code'] and 'ciphertext' in f'{e}':
                 raise ParameterUndecryptable(f'{e}')
 
+    def get_parameters_with_descriptions(self, names: Iterable[str],
+                                         descriptions: Optional[Dict[str, Optional[str]]] = None) \
+            -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Bulk version of `get_parameter_with_description`. Values are fetched with decryption in GetParameters batches
+        across a bounded pool rather than one parameter at a time.
+
+        :param names: Parameter names to look up - e.g. [/app/foo/bar, /app/foo/baz]
+        :param descriptions: Descriptions of `names`, if the caller already has them. Otherwise only `names` are
+            described, or everything one level under each distinct parent path of `names` without a describer.
+        :return: Dict[name, Tuple[value, description]] for every name that exists. Value is None for parameters the
+            user may not read or decrypt.
+        """
+        names = sorted(set(names))
+        if not names:
+            return {}
+
+        if descriptions is None and self._describer:
+            descriptions = self._describer.descriptions(names)
+        elif descriptions is None:
+            parents = set(name[:name.rfind('/')] or '/' for name in names)
+            described = self._ssm.get_all_parameters(list(parents), option='OneLevel')
+            descriptions = {param['Name']: param.get('Description') for param in described}
+
+        names = [name for name in names if name in descriptions]
+        batches = self.__batches(names)
+        values: Dict[str, str] = {}
+        if batches:
+            with Utils.thread_pool(CONFIG_BULK_GET_MAX_THREADS, len(batches)) as pool:
+                for parameters, _ in pool.map(self.__get_parameter_batch, batches):
+                    values.update({param['Name']: param['Value'] for param in parameters})
+
+        return {name: (values.get(name), descriptions[name]) for name in names}
+
+    def get_parameters_with_descriptions_by_path(self, path: str) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Bulk lookup of the values & descriptions of every parameter nested anywhere under `path`. See
+        `get_parameters_with_descriptions`.
+        """
+        described = self._ssm.get_all_parameters([path], option='Recursive')
+        descriptions = {param['Name']: param.get('Description') for param in described}
+        return self.get_parameters_with_descriptions(descriptions.keys(), descriptions)
+
+    @staticmethod
+    def __batches(names: List[str]) -> List[List[str]]:
+        return [names[i:i + CONFIG_BULK_GET_BATCH_SIZE] for i in range(0, len(names), CONFIG_BULK_GET_BATCH_SIZE)]
+
+    def __get_parameter_batch(self, names: List[str]) -> Tuple[List[Dict], Dict[str, FigLookupState]]:
+        """
+        :return: Tuple[parameters, failures] - GetParameters results for the readable `names`, and why each of the
+            others could not be read. Names that don't exist are in neither.
+        """
+        try:
+            return self._ssm.get_parameter_values(names, decrypt=True), {}
+        except ClientError as e:
+            if "AccessDeniedException" != e.response['Error']['Code']:
+                raise
+
+            if len(names) == 1:
+                state = FigLookupState.UNDECRYPTABLE if 'ciphertext' in f'{e}' else FigLookupState.DENIED
+                return [], {names[0]: state}
+
+            # A single parameter we can't read or decrypt fails the whole batch, so fall back to fetching each one.
+            parameters, failures = [], {}
+            for name in names:
+                name_parameters, name_failures = self.__get_parameter_batch([name])
+                parameters.extend(name_parameters)
+                failures.update(name_failures)
+            return parameters, failures
+
+    def get_figs(self, names: Iterable[str]) -> Iterator[FigLookup]:
+        """
+        Batch version of `get_fig_simple` that also sets replication flags like `get_fig` does. Figs are fetched with
+        decryption in GetParameters batches across a bounded pool, and replication flags come from one bulk
+        classification of all `names`.
+
+        :return: One FigLookup per distinct name, yielded batch by batch as each completes, so in no particular order.
+        """
+        names = sorted(set(names))
+        batches = self.__batches(names)
+        if not batches:
+            return
+
+        sources, destinations = self.classify_replication(names)
+
+        with Utils.thread_pool(CONFIG_BULK_GET_MAX_THREADS, len(batches)) as pool:
+            for batch, (parameters, failures) in pool.imap_unordered(
+                    lambda names_batch: (names_batch, self.__get_parameter_batch(names_batch)), batches):
+                found = {param['Name']: param for param in parameters}
+
+                for name in batch:
+                    param = found.get(name)
+                    if param is not None:
+                        fig = Fig(name=name, value=param['Value'], type=param.get('Type'),
+                                  version=param.get('Version'))
+                        fig.is_repl_source = name in sources
+                        fig.is_repl_dest = name in destinations
+                        yield FigLookup(name=name, state=FigLookupState.FOUND, fig=fig)
+                    else:
+                        yield FigLookup(name=name, state=failures.get(name, FigLookupState.MISSING))
+
     def get_fig(self, name: str, version: int = 0) -> Fig:
         """ Version is defaulted to 0, which will return latest. """
         fig = self._fig_svc.get(name, version)
@@ -141,8 +495,9 @@ class ConfigService:
 
     def set_fig(self, fig: Fig):
         self._fig_svc.set(fig)
+        self.invalidate([fig.name])
 
-    @cachetools.func.ttl_cache(maxsize=256, ttl=30)
+    @cachedmethod(operator.attrgetter('_encrypted_cache'), lock=operator.attrgetter('_memo_lock'))
     def is_encrypted(self, name: str) -> bool:
         try:
             return self.get_fig(name).kms_key_id is not None
@@ -151,23 +506,90 @@ class ConfigService:
             if "AccessDeniedException" == e.response['Error']['Code'] and 'ciphertext' in f'{e}':
                 return True
 
-    @cachetools.func.ttl_cache(maxsize=256, ttl=15)
+    def __replication_index(self) -> Optional[ReplicationIndex]:
+        """
+        :return: An index over all replication configs for bulk lookups. It is rebuilt from a full scan of the
+            replication table at most every REPLICATION_INDEX_REFRESH_INTERVAL, shared with other figgy processes
+            through the local cache, and updated in place as replication configs are recorded or deleted in between.
+            None if no replication scanner is available.
+        """
+        if not self._repl_scanner:
+            return None
+
+        with self._repl_index_lock:
+            loaded_at, index = self._repl_index
+            now = Utils.millis_since_epoch()
+            if index is None or now - loaded_at > self.REPLICATION_INDEX_REFRESH_INTERVAL:
+                # Aged by the last full scan. Recorded writes bump the cache's last write, but don't make it any
+                # fresher with respect to configs changed by others.
+                scanned_at = self._cache_mgr.last_refresh(self._REPL_INDEX_CACHE_KEY)
+                if now - scanned_at > self.REPLICATION_INDEX_REFRESH_INTERVAL:
+                    configs = dict(self._repl_scanner.pairs())
+                    self._cache_mgr.write(self._REPL_INDEX_CACHE_KEY, configs)
+                    scanned_at = now
+                else:
+                    configs = self._cache_mgr.get_val(self._REPL_INDEX_CACHE_KEY, default={})
+
+                index = ReplicationIndex(configs.items())
+                self._repl_index = (scanned_at, index)
+
+            return index
+
     def is_replication_source(self, name: str) -> bool:
-        return bool(self._repl.get_cfgs_by_src(name))
+        return bool(self.get_replication_configs_by_source(name))
 
-    @cachetools.func.ttl_cache(maxsize=256, ttl=15)
     def is_replication_destination(self, name: str) -> bool:
-        return bool(self._repl.get_config_repl(name))
+        return bool(self.get_replication_config(name))
+
+    def classify_replication(self, names: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """
+        Bulk version of `is_replication_source` & `is_replication_destination`. Answered from the replication index,
+        single lookups are cheaper as keyed queries & don't use it.
+
+        :return: Tuple[sources, destinations] - The subsets of `names` that are replication sources & destinations.
+        """
+        index = self.__replication_index()
+        if index:
+            return index.classify(names)
+
+        names = set(names)
+        return set(filter(self.is_replication_source, names)), set(filter(self.is_replication_destination, names))
+
+    def record_replication_configs(self, configs: Iterable[ReplicationConfig]) -> None:
+        """
+        Write-through after `configs` were stored in the replication table by a caller writing to it directly. They
+        are added to the replication index, in memory and in the local cache, and memoized lookups they affect are
+        evicted.
+        """
+        # Merge configs have a list of merge values as their source, not a parameter name.
+        configs = {config.destination: config.source if isinstance(config.source, str) else None
+                   for config in configs}
+        if not configs:
+            return
+
+        with self._memo_lock:
+            for destination, source in configs.items():
+                self._repl_config_cache.pop(hashkey(destination), None)
+                self._repl_configs_by_source_cache.pop(hashkey(source), None)
+
+        with self._repl_index_lock:
+            loaded_at, index = self._repl_index
+            if index is not None:
+                for destination, source in configs.items():
+                    index.put(destination, source)
+
+            if self._repl_scanner:
+                self._cache_mgr.append(self._REPL_INDEX_CACHE_KEY, configs)
 
     @cachetools.func.ttl_cache(maxsize=256, ttl=3600)
     def get_replication_key(self) -> str:
         return self._fig_svc.get_simple(PS_FIGGY_REPL_KEY_ID_PATH).value
 
-    @cachetools.func.ttl_cache(maxsize=256, ttl=30)
+    @cachedmethod(operator.attrgetter('_repl_config_cache'), lock=operator.attrgetter('_memo_lock'))
     def get_replication_config(self, name: str) -> ReplicationConfig:
         return self._repl.get_config_repl(name)
 
-    @cachetools.func.ttl_cache(maxsize=256, ttl=30)
+    @cachedmethod(operator.attrgetter('_repl_configs_by_source_cache'), lock=operator.attrgetter('_memo_lock'))
     def get_replication_configs_by_source(self, name: str) -> List[ReplicationConfig]:
         return self._repl.get_cfgs_by_src(name)
 
@@ -195,6 +617,7 @@ class ConfigService:
     def save(self, fig: Fig):
         log.info(f'Saving Fig: {fig}')
         self._fig_svc.save(fig)
+        self.invalidate([fig.name])
 
     def delete(self, name: str):
         """
@@ -203,12 +626,58 @@ class ConfigService:
             If this config is a repl destination, delete it, if not, try anyways, it's harmless & faster
             than checking first.
         """
-        if self.is_replication_source(name):
+        # Checked remotely, a stale answer here could break replication.
+        if self._repl.get_cfgs_by_src(name):
             raise ValueError("Cannot delete fig, it is a source of replication!")
 
-        # Todo: Wipe caches. Here
         self._repl.delete_config(name)
         self._fig_svc.delete(name)
+        self.invalidate([name], deleted=True)
+
+    def invalidate(self, names: Iterable[str], deleted: bool = False) -> None:
+        """
+        Write-through invalidation after the figs `names` were saved, or deleted if `deleted` is set. Called by this
+        service and by commands that write to ParameterStore directly. The names are added to or removed from the
+        in-memory names, name index & local name store, bumping the name set generation, and only memoized lookups of
+        `names` are evicted. Nothing else has to be refreshed.
+        """
+        names = set(names)
+        if not names:
+            return
+
+        added_names, deleted_names = (set(), names) if deleted else (names, set())
+        self.__record_local_change(added=added_names, deleted=deleted_names)
+
+        # Leave last_write alone so changes made remotely since the last sync are still picked up.
+        name_store = self._cache_mgr.name_store(f'{self._run_env.env}-{self._PS_NAME_CACHE_KEY}')
+        _, stored = name_store.get()
+        added_names, deleted_names = added_names - stored, deleted_names & stored
+        if added_names or deleted_names:
+            name_store.apply(added_names, deleted_names, advance=False)
+
+        for name in names:
+            self._cache_mgr.evict(name)
+
+        with self._memo_lock:
+            for name in names:
+                self._encrypted_cache.pop(hashkey(name), None)
+                self._repl_config_cache.pop(hashkey(name), None)
+
+            if deleted:
+                # Sources whose memoized configs still list one of `names` as a destination
+                for key, configs in list(self._repl_configs_by_source_cache.items()):
+                    if any(config.destination in names for config in configs or []):
+                        self._repl_configs_by_source_cache.pop(key, None)
+
+        if deleted:
+            with self._repl_index_lock:
+                loaded_at, index = self._repl_index
+                if index is not None:
+                    for name in names:
+                        index.remove(name)
+
+                if self._repl_scanner:
+                    self._cache_mgr.delete(self._REPL_INDEX_CACHE_KEY, {name: None for name in names})
 
     def decrypt(self, parameter_name: str, encrypted_data) -> str:
         return self._kms.safe_decrypt_parameter(parameter_name, encrypted_data)
\ No newline at end of file
@@ -0,0 +1,126 @@
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Iterable, Tuple
+
+from botocore.exceptions import ClientError
+from figgy.data.dao.replication import ReplicationDao
+from figgy.models.replication_config import ReplicationConfig
+
+from figcli.config.tuning import CONFIG_BULK_DELETE_BATCH_SIZE, CONFIG_BULK_DELETE_MAX_THREADS
+from figcli.models.delete_report import DeleteReport
+from figcli.svcs.cache.lazy_client import LazyClient
+from figcli.svcs.config import ConfigService
+
+log = logging.getLogger(__name__)
+
+
+class DeletePlan:
+    """
+    Parameters to delete, classified by the part they play in replication.
+    """
+
+    def __init__(self, sources: Dict[str, List[ReplicationConfig]], destinations: Dict[str, ReplicationConfig],
+                 plain: List[str]):
+        self.sources = sources  # name -> configs replicating from it
+        self.destinations = destinations  # name -> config replicating to it
+        self.plain = plain
+
+
+class ConfigDeleter:
+    """
+    Deletes many parameters at once.
+
+    `plan` classifies names as replication sources, destinations or plain parameters from the replication index, and
+    `delete` removes parameters with DeleteParameters in batches spread across at most `max_workers` threads.
+    Deciding what to do with sources and destinations is left to the caller.
+
+    Requires a LazyClient over a boto3 ssm client.
+    """
+
+    # Replication configs are stored with the namespace of their destination.
+    _NAMESPACE = re.compile(r"^(/app/[A-Za-z0-9_-]+/).*")
+
+    def __init__(self, ssm: LazyClient, repl: ReplicationDao, cfg_svc: ConfigService,
+                 max_workers: int = CONFIG_BULK_DELETE_MAX_THREADS):
+        self._ssm = ssm
+        self._repl = repl
+        self._cfg_svc = cfg_svc
+        self._max_workers = max(max_workers, 1)
+
+    def plan(self, names: Iterable[str]) -> DeletePlan:
+        """
+        Names are classified by one bulk lookup against the replication index. Only the few names it marks as sources
+        or destinations are looked up in the replication table, sources to be certain they still are, a stale answer
+        could let a source be deleted and break replication, and destinations for their configs. These lookups share
+        the ReplicationDao's resource, so they run one after another.
+        """
+        names = sorted(set(names))
+        indexed_sources, indexed_destinations = self._cfg_svc.classify_replication(names)
+
+        sources: Dict[str, List[ReplicationConfig]] = {}
+        for name in sorted(indexed_sources):
+            repl_confs = self._repl.get_cfgs_by_src(name)
+            if repl_confs:
+                sources[name] = repl_confs
+
+        by_namespace: Dict[str, List[str]] = {}
+        for name in sorted(indexed_destinations):
+            match = self._NAMESPACE.match(name)
+            by_namespace.setdefault(match.group(1) if match else None, []).append(name)
+
+        destinations: Dict[str, ReplicationConfig] = {}
+        # No namespace to look up configs by, look each one up.
+        for name in by_namespace.pop(None, []):
+            repl_conf = self._repl.get_config_repl(name)
+            if repl_conf is not None:
+                destinations[name] = repl_conf
+
+        for namespace, ns_names in by_namespace.items():
+            ns_names = set(ns_names)
+            for repl_conf in self._repl.get_all_configs(namespace) or []:
+                if repl_conf.destination in ns_names:
+                    destinations[repl_conf.destination] = repl_conf
+
+        plain = [name for name in names if name not in sources and name not in destinations]
+        return DeletePlan(sources, destinations, plain)
+
+    def delete(self, names: Iterable[str]) -> DeleteReport:
+        """
+        Deletes `names` from ParameterStore, does not check or touch replication configs.
+        """
+        names = sorted(set(names))
+        report = DeleteReport()
+        batches = [names[i:i + CONFIG_BULK_DELETE_BATCH_SIZE]
+                   for i in range(0, len(names), CONFIG_BULK_DELETE_BATCH_SIZE)]
+        if not batches:
+            return report
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(batches))) as pool:
+            for deleted, not_found, denied in pool.map(self.__delete_batch, batches):
+                report.deleted.extend(deleted)
+                report.not_found.extend(not_found)
+                report.denied.extend(denied)
+
+        log.info(f"Deleted {len(report.deleted)} of {len(names)} parameters in {len(batches)} batches.")
+        return report
+
+    def __delete_batch(self, names: List[str]) -> Tuple[List[str], List[str], List[str]]:
+        try:
+            result = self._ssm.get().delete_parameters(Names=names)
+            return result.get('DeletedParameters', []), result.get('InvalidParameters', []), []
+        except ClientError as e:
+            if "AccessDeniedException" != e.response['Error']['Code']:
+                raise
+
+            if len(names) == 1:
+                return [], [], names
+
+            # A single parameter we may not delete fails the whole batch, so fall back to deleting each one.
+            deleted, not_found, denied = [], [], []
+            for name in names:
+                name_deleted, name_not_found, name_denied = self.__delete_batch([name])
+                deleted.extend(name_deleted)
+                not_found.extend(name_not_found)
+                denied.extend(name_denied)
+            return deleted, not_found, denied
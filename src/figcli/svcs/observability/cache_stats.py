@@ -0,0 +1,102 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Tuple, List, Iterator
+
+from pydantic import BaseModel
+from tabulate import tabulate
+
+
+class CacheKeyStats(BaseModel):
+    """
+    Counters & timings recorded for a single key of a single cache. Timings are in milliseconds.
+    """
+    cache: str
+    key: str
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    decode_ms: float = 0
+    decrypt_ms: float = 0
+    lock_wait_ms: float = 0
+    remote_ms: float = 0
+
+
+class CacheStats:
+    """
+    Process-wide, thread-safe registry of cache counters and timings, keyed by cache and cache key. Cache layers
+    record into it as they work; `figgy <resource> <command> --cache-stats` and the UI's /maintenance/cache-stats
+    route report from it.
+
+    Operations that act on a whole cache rather than a single key (e.g. reading an entire cache file) are recorded
+    under the key WHOLE_CACHE.
+    """
+
+    WHOLE_CACHE = '*'
+
+    _lock = threading.Lock()
+    _stats: Dict[Tuple[str, str], CacheKeyStats] = {}
+
+    @staticmethod
+    def __get(cache: str, key: str) -> CacheKeyStats:
+        stats = CacheStats._stats.get((cache, key))
+        if not stats:
+            stats = CacheKeyStats(cache=cache, key=key)
+            CacheStats._stats[(cache, key)] = stats
+
+        return stats
+
+    @staticmethod
+    def record(cache: str, key: str, **amounts) -> None:
+        """
+        Add to one or more counters for this cache key.
+        Example: CacheStats.record('dev-cache.db', 'parameter_names', hits=1, bytes_read=512)
+        """
+        with CacheStats._lock:
+            stats = CacheStats.__get(cache, key)
+            for field, amount in amounts.items():
+                setattr(stats, field, getattr(stats, field) + amount)
+
+    @staticmethod
+    @contextmanager
+    def timer(cache: str, key: str, field: str) -> Iterator[None]:
+        """
+        Time the wrapped block and add the elapsed milliseconds to `field` for this cache key.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            CacheStats.record(cache, key, **{field: (time.perf_counter() - start) * 1000})
+
+    @staticmethod
+    def snapshot() -> List[CacheKeyStats]:
+        with CacheStats._lock:
+            return [stats.copy() for _, stats in sorted(CacheStats._stats.items())]
+
+    @staticmethod
+    def reset() -> None:
+        with CacheStats._lock:
+            CacheStats._stats = {}
+
+    @staticmethod
+    def report() -> str:
+        """
+        :return: printable table of all recorded stats
+        """
+        rows = [
+            [s.cache, s.key, s.hits, s.misses, s.refreshes, s.bytes_read, s.bytes_written,
+             f'{s.decode_ms:.1f}', f'{s.decrypt_ms:.1f}', f'{s.lock_wait_ms:.1f}', f'{s.remote_ms:.1f}']
+            for s in CacheStats.snapshot()
+        ]
+
+        return tabulate(
+            rows,
+            headers=['Cache', 'Key', 'Hits', 'Misses', 'Refreshes', 'Bytes Read', 'Bytes Written',
+                     'Decode ms', 'Decrypt ms', 'Lock Wait ms', 'Remote ms'],
+            tablefmt="grid",
+            numalign="center",
+            stralign="left",
+        )
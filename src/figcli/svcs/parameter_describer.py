@@ -0,0 +1,44 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+
+from figcli.config.tuning import CONFIG_BULK_DESCRIBE_BATCH_SIZE, CONFIG_BULK_GET_MAX_THREADS
+from figcli.svcs.cache.lazy_client import LazyClient
+from figcli.utils.utils import Utils
+
+log = logging.getLogger(__name__)
+
+
+class ParameterDescriber:
+    """
+    Describes parameters by name with DescribeParameters name filters, so only the parameters asked for are described
+    rather than every parameter under their parent paths.
+
+    Requires a LazyClient over a boto3 ssm client.
+    """
+
+    def __init__(self, client: LazyClient, max_workers: int = CONFIG_BULK_GET_MAX_THREADS):
+        self._client = client
+        self._max_workers = max(max_workers, 1)
+
+    def descriptions(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        :return: Dict[name, description] for each of `names` that exists. Description is None if it has none.
+        """
+        names = sorted(set(names))
+        batches = [names[i:i + CONFIG_BULK_DESCRIBE_BATCH_SIZE]
+                   for i in range(0, len(names), CONFIG_BULK_DESCRIBE_BATCH_SIZE)]
+        if not batches:
+            return {}
+
+        descriptions = {}
+        with Utils.thread_pool(self._max_workers, len(batches)) as pool:
+            for described in pool.map(self.__describe_batch, batches):
+                descriptions.update(described)
+
+        log.info(f"Described {len(descriptions)} of {len(names)} parameters in {len(batches)} batches.")
+        return descriptions
+
+    def __describe_batch(self, names: List[str]) -> Dict[str, Optional[str]]:
+        paginator = self._client.get().get_paginator('describe_parameters')
+        pages = paginator.paginate(ParameterFilters=[{'Key': 'Name', 'Option': 'Equals', 'Values': names}])
+        return {param['Name']: param.get('Description') for page in pages for param in page.get('Parameters', [])}
@@ -28,9 +28,14 @@ from figcli.svcs.audit import AuditService
 from figcli.svcs.auth.session_manager import SessionManager
 from botocore.client import Config
 
+from figcli.svcs.cache.config_cache_scanner import ConfigCacheScanner
+from figcli.svcs.cache.lazy_client import LazyClient
+from figcli.svcs.cache.replication_scanner import ReplicationScanner
+from figcli.svcs.cache.storage import SqliteStorage
 from figcli.svcs.cache_manager import CacheManager
 from figcli.svcs.config import ConfigService
 from figcli.svcs.kms import KmsService
+from figcli.svcs.parameter_describer import ParameterDescriber
 from figcli.svcs.one_time_secret import OTSService
 from figcli.svcs.usage_tracking import UsageTrackingService
 from figcli.ui.exceptions import InvalidFiggyConfigurationException
@@ -144,7 +149,10 @@ class ServiceRegistry:
         Returns a hydrated ConfigSvc
         """
         return ConfigService(self.__config(env, refresh), self.__ssm(env, refresh), self.__repl(env, refresh),
-                             self.__cache_mgr(env), self.kms_svc(env, refresh), env.role.run_env)
+                             self.__cache_mgr(env), self.kms_svc(env, refresh), env.role.run_env,
+                             cache_scanner=self.__config_cache_scanner(env, refresh),
+                             repl_scanner=self.__replication_scanner(env, refresh),
+                             describer=self.__parameter_describer(env, refresh))
 
     @refreshable_cache('kms-svc')
     def kms_svc(self, env: GlobalEnvironment, refresh: bool = False) -> KmsService:
@@ -203,7 +211,7 @@ class ServiceRegistry:
 
     @refreshable_cache('cache-mgr')
     def __cache_mgr(self, env: GlobalEnvironment, refresh: bool = False):
-        return CacheManager(f'{env.cache_key()}')
+        return CacheManager(f'{env.cache_key()}', storage=SqliteStorage.for_cache(f'{env.cache_key()}'))
 
     @refreshable_cache('env-session')
     def __env_session(self, env: GlobalEnvironment, refresh: bool = False) -> boto3.session.Session:
@@ -239,6 +247,43 @@ class ServiceRegistry:
         """
         return ConfigDao(self.__env_session(env, refresh).resource('dynamodb'))
 
+    @refreshable_cache('config-cache-scanner')
+    @lock_boto_client_creation
+    def __config_cache_scanner(self, env: GlobalEnvironment, refresh: bool) -> ConfigCacheScanner:
+        """
+        Returns a ConfigCacheScanner for the selected environment. Its client is created on the first scan.
+        """
+        session = self.__env_session(env, refresh)
+        return ConfigCacheScanner(
+            LazyClient(lambda: self.__dynamo_client(session, max_pool_connections=DYNAMO_DB_MAX_POOL_SIZE)))
+
+    @refreshable_cache('replication-scanner')
+    @lock_boto_client_creation
+    def __replication_scanner(self, env: GlobalEnvironment, refresh: bool) -> ReplicationScanner:
+        """
+        Returns a ReplicationScanner for the selected environment. Its client is created on the first scan.
+        """
+        session = self.__env_session(env, refresh)
+        return ReplicationScanner(LazyClient(lambda: self.__dynamo_client(session)))
+
+    @refreshable_cache('parameter-describer')
+    @lock_boto_client_creation
+    def __parameter_describer(self, env: GlobalEnvironment, refresh: bool) -> ParameterDescriber:
+        """
+        Returns a ParameterDescriber for the selected environment. Its client is created on first use.
+        """
+        session = self.__env_session(env, refresh)
+        return ParameterDescriber(LazyClient(lambda: self.__ssm_client(session)))
+
+    @lock_boto_client_creation
+    def __ssm_client(self, session: boto3.session.Session):
+        return session.client('ssm')
+
+    @lock_boto_client_creation
+    def __dynamo_client(self, session: boto3.session.Session, max_pool_connections: Optional[int] = None):
+        config = Config(max_pool_connections=max_pool_connections) if max_pool_connections else None
+        return session.client('dynamodb', config=config)
+
     @refreshable_cache('audit-dao')
     @lock_boto_client_creation
     def __audit(self, env: GlobalEnvironment, refresh: bool) -> AuditDao:
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set
+
+from botocore.exceptions import ClientError
+from figgy.data.dao.replication import ReplicationDao
+from figgy.data.dao.ssm import SsmDao
+from figgy.models.replication_config import ReplicationConfig
+
+from figcli.config.tuning import CONFIG_BULK_GET_BATCH_SIZE, SYNC_MAX_THREADS
+
+log = logging.getLogger(__name__)
+
+
+class SyncSnapshot:
+    """
+    A point-in-time copy of the remote state `sync` compares a figgy.json against, so the whole comparison is made
+    locally instead of with a remote lookup per name.
+
+    For each loaded namespace the snapshot holds every ParameterStore name under it and every replication config
+    with a destination in it. Names outside of the loaded namespaces, like replication sources, are checked for
+    existence in GetParameters batches. All reads run across at most `max_workers` threads.
+
+    Writes made by `sync` are recorded back into the snapshot, so later steps see them without re-reading.
+    """
+
+    def __init__(self, ssm: SsmDao, repl: ReplicationDao, max_workers: int = SYNC_MAX_THREADS):
+        self._ssm = ssm
+        self._repl = repl
+        self._max_workers = max(max_workers, 1)
+        self.namespaces: List[str] = []
+        self._names: Set[str] = set()
+        self._checked: Set[str] = set()
+        self._denied: Set[str] = set()
+        self._configs: Dict[str, ReplicationConfig] = {}
+
+    def load(self, namespaces: Iterable[str], names: Iterable[str] = ()) -> "SyncSnapshot":
+        """
+        Reads `namespaces` and checks whether each of `names` exists. Namespaces & names already in the snapshot are
+        not read again.
+        """
+        namespaces = sorted(set(ns for ns in namespaces if ns and ns not in self.namespaces))
+        self.namespaces.extend(namespaces)
+        names = sorted(set(name for name in names if not self.covers(name) and name not in self._checked))
+        batches = [names[i:i + CONFIG_BULK_GET_BATCH_SIZE] for i in range(0, len(names), CONFIG_BULK_GET_BATCH_SIZE)]
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            name_futures = [pool.submit(self._ssm.get_all_parameters, [ns]) for ns in namespaces]
+            config_futures = [pool.submit(self._repl.get_all_configs, ns) for ns in namespaces]
+            batch_futures = [pool.submit(self.__check_batch, batch) for batch in batches]
+
+            for future in name_futures:
+                self._names.update(param['Name'] for param in future.result())
+
+            for future in config_futures:
+                self._configs.update({cfg.destination: cfg for cfg in future.result() or []})
+
+            for future in batch_futures:
+                future.result()
+
+        log.info(f"Snapshot loaded {len(namespaces)} namespaces & checked {len(names)} other names.")
+        return self
+
+    def recheck(self, names: Iterable[str]) -> None:
+        """
+        Checks again whether each of `names` exists, e.g. after it was just added.
+        """
+        names = list(names)
+        self._checked.difference_update(names)
+        for name in names:
+            self.__check_batch([name])
+
+    def __check_batch(self, names: List[str]) -> None:
+        try:
+            found = set(param['Name'] for param in self._ssm.get_parameter_values(names, decrypt=False))
+        except ClientError as e:
+            if "AccessDeniedException" != e.response['Error']['Code']:
+                raise
+
+            if len(names) == 1:
+                self._denied.add(names[0])
+                self._names.discard(names[0])
+                self._checked.add(names[0])
+                return
+
+            # A single parameter we may not read fails the whole batch, so fall back to checking each one.
+            for name in names:
+                self.__check_batch([name])
+            return
+
+        self._checked.update(names)
+        self._denied.difference_update(names)
+        self._names.difference_update(set(names) - found)
+        self._names.update(found)
+
+    @property
+    def checked_names(self) -> List[str]:
+        """
+        Names outside of the loaded namespaces whose existence has been checked.
+        """
+        return sorted(self._checked)
+
+    def digest(self) -> str:
+        """
+        Hash of everything read into the snapshot that a plan depends on. Two snapshots loaded with the same
+        namespaces & names have the same digest unless the remote state changed in between. The user that last wrote a
+        replication config is left out, no plan depends on it.
+        """
+        state = {
+            'namespaces': sorted(self.namespaces),
+            'names': sorted(self._names),
+            'checked': sorted(self._checked),
+            'denied': sorted(self._denied),
+            'configs': [[dest, cfg.source, cfg.namespace, getattr(cfg.type, 'value', cfg.type)]
+                        for dest, cfg in sorted(self._configs.items())],
+        }
+
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def covers(self, name: str) -> bool:
+        return any(name.startswith(ns) for ns in self.namespaces)
+
+    def exists(self, name: str) -> bool:
+        if not self.covers(name) and name not in self._checked:
+            self.__check_batch([name])
+
+        return name in self._names
+
+    def is_denied(self, name: str) -> bool:
+        return name in self._denied
+
+    def names_under(self, namespace: str) -> Set[str]:
+        return set(name for name in self._names if name.startswith(namespace))
+
+    def configs_under(self, namespace: str) -> List[ReplicationConfig]:
+        return [cfg for dest, cfg in sorted(self._configs.items()) if cfg.namespace == namespace]
+
+    def replication_config(self, destination: str) -> Optional[ReplicationConfig]:
+        return self._configs.get(destination)
+
+    def put_config(self, config: ReplicationConfig) -> None:
+        self._configs[config.destination] = config
@@ -0,0 +1,104 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from figcli.svcs.cache.janitor import CacheJanitor
+from figcli.svcs.cache.name_store import NameStore
+from figcli.svcs.cache.storage import SqliteStorage, STORE_KEY, LAST_WRITE_KEY, LAST_REFRESH_KEY
+from figcli.utils.utils import Utils
+
+HOUR = 60 * 60 * 1000
+
+
+class TestCacheJanitor(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.other_dir = os.path.join(self.dir, 'other')
+        os.makedirs(self.other_dir)
+        patcher = mock.patch('figcli.svcs.cache.janitor.CACHE_OTHER_DIR', self.other_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = Utils.millis_since_epoch()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def janitor(self, **kwargs) -> CacheJanitor:
+        limits = {'max_bytes': 1024 * 1024 * 1024, 'max_entries': 1000, 'max_age': 24 * HOUR, **kwargs}
+        return CacheJanitor(cache_dir=self.dir, **limits)
+
+    def database(self, name: str, accessed: dict, written_at: int = None) -> SqliteStorage:
+        """
+        Creates a cache database with one entry per key of `accessed`, each last accessed at its value.
+        """
+        db = SqliteStorage(os.path.join(self.other_dir, f'{name}-cache.db'))
+        for cache_key in accessed:
+            written = written_at or self.now
+            db.write(cache_key, {STORE_KEY: [cache_key], LAST_WRITE_KEY: written, LAST_REFRESH_KEY: written})
+
+        with sqlite3.connect(db.path) as conn:
+            conn.executemany(f'UPDATE {SqliteStorage._TABLE} SET last_access = ? WHERE cache_key = ?',
+                             [(last_access, cache_key) for cache_key, last_access in accessed.items()])
+        return db
+
+    def name_store(self, name: str, accessed_at: int) -> NameStore:
+        store = NameStore(os.path.join(self.other_dir, f'{name}.names'))
+        store.write(['/app/svc/a', '/app/svc/b'])
+        os.utime(store.path, (accessed_at / 1000, accessed_at / 1000))
+        return store
+
+    def test_within_budget_evicts_nothing(self):
+        db = self.database('config', {'a': self.now, 'b': self.now})
+
+        report = self.janitor().run()
+
+        self.assertEqual(0, report.evicted)
+        self.assertEqual(0, report.expired)
+        self.assertEqual({'a', 'b'}, set(db.keys()))
+        self.assertEqual(2, report.after.entries)
+
+    def test_expired_entries_are_removed(self):
+        self.database('old', {'stale': self.now}, written_at=self.now - 48 * HOUR)
+        fresh = self.database('new', {'fresh': self.now})
+
+        report = self.janitor().run()
+
+        self.assertEqual(1, report.expired)
+        self.assertEqual(['fresh'], fresh.keys())
+        self.assertEqual(1, report.after.entries)
+
+    def test_least_recently_accessed_are_evicted_first(self):
+        accessed = {'oldest': self.now - 3 * HOUR, 'newest': self.now, 'older': self.now - 2 * HOUR}
+        db = self.database('config', accessed, written_at=self.now - 4 * HOUR)
+        store = self.name_store('config-cache-names', self.now - HOUR)
+
+        report = self.janitor(max_entries=2).run()
+
+        self.assertEqual(2, report.evicted)
+        self.assertEqual(['newest'], db.keys())
+        self.assertTrue(os.path.exists(store.path))
+
+    def test_name_stores_are_evicted_by_last_access(self):
+        self.database('config', {'recent': self.now})
+        store = self.name_store('config-cache-names', self.now - 3 * HOUR)
+
+        self.janitor(max_entries=1).run()
+
+        self.assertFalse(os.path.exists(store.path))
+
+    def test_other_files_count_towards_budget_but_are_kept(self):
+        defaults = os.path.join(self.other_dir, 'defaults.json')
+        with open(defaults, 'wb') as file:
+            file.write(b'x' * 64 * 1024)
+        db = self.database('config', {'a': self.now - HOUR, 'b': self.now}, written_at=self.now - 2 * HOUR)
+
+        report = self.janitor(max_bytes=64 * 1024).run()
+
+        self.assertEqual(2, report.evicted)
+        self.assertEqual([], db.keys())
+        self.assertTrue(os.path.exists(defaults))
+        self.assertGreaterEqual(report.before.bytes, 64 * 1024)
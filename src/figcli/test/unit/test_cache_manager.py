@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from figcli.svcs.cache import storage
+from figcli.svcs.cache_manager import CacheManager, wipe_bad_cache
+from figcli.svcs.vault import FiggyVault
+
+
+class CorruptCacheTarget:
+    """
+    Decorated with wipe_bad_cache, counts calls and fails with a corrupt cache as many times as it is told to.
+    """
+
+    def __init__(self, failures: int = 0):
+        self._storage = mock.Mock()
+        self.failures = failures
+        self.calls = 0
+
+    @wipe_bad_cache
+    def run(self):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise json.JSONDecodeError('corrupt', '', 0)
+
+        return 'result'
+
+
+class TestCacheManager(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'test-cache.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def cache(self, vault: FiggyVault = None) -> CacheManager:
+        return CacheManager('test', file_override=self.path, vault=vault)
+
+    def test_transaction_writes_once(self):
+        self.cache().write('names', {'/app/svc/a', '/app/svc/b'})
+
+        with mock.patch.object(storage, 'atomic_write', wraps=storage.atomic_write) as write:
+            with self.cache().transaction() as txn:
+                txn.append('names', {'/app/svc/c'})
+                txn.delete('names', {'/app/svc/a'})
+                txn.write('kms', {'app': 'key-id'})
+
+        self.assertEqual(1, write.call_count)
+        self.assertEqual({'/app/svc/b', '/app/svc/c'}, set(self.cache().get_val('names')))
+        self.assertEqual({'app': 'key-id'}, self.cache().get_val('kms'))
+
+    def test_failed_transaction_writes_nothing(self):
+        self.cache().write('names', {'/app/svc/a'})
+
+        with self.assertRaises(RuntimeError):
+            with self.cache().transaction() as txn:
+                txn.append('names', {'/app/svc/b'})
+                raise RuntimeError('failed mid-transaction')
+
+        self.assertEqual(['/app/svc/a'], self.cache().get_val('names'))
+
+    def test_transaction_recreates_corrupt_cache(self):
+        vault = FiggyVault(keychain_enabled=False)
+        with open(self.path, 'w') as file:
+            file.write('{"truncated')
+
+        with self.cache(vault).transaction() as txn:
+            txn.write('names', {'/app/svc/a'})
+
+        self.assertEqual(['/app/svc/a'], self.cache(vault).get_val('names'))
+
+    def test_append_keeps_last_refresh(self):
+        cache = self.cache()
+        cache.write('names', {'/app/svc/a'})
+        last_refresh = cache.last_refresh('names')
+
+        with mock.patch('figcli.utils.utils.Utils.millis_since_epoch', return_value=last_refresh + 1000):
+            cache.append('names', {'/app/svc/b'})
+
+        self.assertEqual(last_refresh, cache.last_refresh('names'))
+        self.assertEqual(last_refresh + 1000, cache.get('names')[0])
+
+    def test_wipe_bad_cache_runs_once(self):
+        target = CorruptCacheTarget()
+
+        self.assertEqual('result', target.run())
+        self.assertEqual(1, target.calls)
+        target._storage.wipe.assert_not_called()
+
+    def test_wipe_bad_cache_retries_after_wiping(self):
+        target = CorruptCacheTarget(failures=1)
+
+        self.assertEqual('result', target.run())
+        self.assertEqual(2, target.calls)
+        target._storage.wipe.assert_called_once()
@@ -0,0 +1,234 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import jsonpickle
+
+from figcli.svcs.cache.storage import CacheStorage, JsonFileStorage, SqliteStorage, STORE_KEY, LAST_WRITE_KEY, \
+    LAST_REFRESH_KEY, atomic_write
+from figcli.svcs.vault import FiggyVault
+
+
+def entry(value, last_write: int = 2, last_refresh: int = 1):
+    return {STORE_KEY: value, LAST_WRITE_KEY: last_write, LAST_REFRESH_KEY: last_refresh}
+
+
+class StorageContract:
+    """
+    Behaviour every CacheStorage backend shares. Mixed into one TestCase per backend.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def storage(self) -> CacheStorage:
+        raise NotImplementedError
+
+    def test_read_missing_key(self):
+        self.assertIsNone(self.storage().read('missing'))
+
+    def test_write_and_read(self):
+        self.storage().write('names', entry(['/app/svc/a', '/app/svc/b']))
+        self.storage().write('kms', entry({'app': 'key-id'}, last_write=5, last_refresh=4))
+
+        storage = self.storage()
+        self.assertEqual(entry(['/app/svc/a', '/app/svc/b']), storage.read('names'))
+        self.assertEqual(entry({'app': 'key-id'}, last_write=5, last_refresh=4), storage.read('kms'))
+        self.assertEqual({'names', 'kms'}, set(storage.keys()))
+
+    def test_write_replaces_entry(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        self.storage().write('names', entry(['/app/svc/b'], last_write=3))
+
+        self.assertEqual(entry(['/app/svc/b'], last_write=3), self.storage().read('names'))
+
+    def test_remove_only_touches_its_key(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        self.storage().write('kms', entry({'app': 'key-id'}))
+        self.storage().remove('names')
+        self.storage().remove('missing')
+
+        self.assertIsNone(self.storage().read('names'))
+        self.assertEqual(['kms'], self.storage().keys())
+
+    def test_wipe(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        self.storage().wipe()
+
+        self.assertEqual([], self.storage().keys())
+
+    def test_session_commits_together(self):
+        with self.storage().session() as session:
+            session.write('names', entry(['/app/svc/a']))
+            session.write('kms', entry({'app': 'key-id'}))
+            session.remove('names')
+
+        self.assertEqual(['kms'], self.storage().keys())
+
+    def test_failed_session_is_rolled_back(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+
+        with self.assertRaises(RuntimeError):
+            with self.storage().session() as session:
+                session.write('names', entry(['/app/svc/b']))
+                session.write('kms', entry({'app': 'key-id'}))
+                raise RuntimeError('failed mid-session')
+
+        self.assertEqual(entry(['/app/svc/a']), self.storage().read('names'))
+        self.assertEqual(['names'], self.storage().keys())
+
+
+class TestJsonFileStorage(StorageContract, unittest.TestCase):
+
+    def storage(self) -> JsonFileStorage:
+        return JsonFileStorage(os.path.join(self.dir, 'test-cache.json'))
+
+    def test_unchanged_file_is_read_once(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        storage = self.storage()
+
+        with mock.patch('figcli.svcs.cache.storage.open', create=True, wraps=open) as opened:
+            for _ in range(3):
+                self.assertEqual(entry(['/app/svc/a']), storage.read('names'))
+            self.assertEqual(['names'], storage.keys())
+
+        self.assertEqual(1, opened.call_count)
+
+    def test_reads_see_other_writers(self):
+        reader = self.storage()
+        reader.write('names', entry(['/app/svc/a']))
+        self.assertEqual(entry(['/app/svc/a']), reader.read('names'))
+
+        self.storage().write('names', entry(['/app/svc/b']))
+        self.assertEqual(entry(['/app/svc/b']), reader.read('names'))
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        path = os.path.join(self.dir, 'file')
+        atomic_write(path, b'first')
+        atomic_write(path, b'second')
+
+        with open(path, 'rb') as file:
+            self.assertEqual(b'second', file.read())
+        self.assertEqual(['file'], os.listdir(self.dir))
+
+
+class TestEncryptedJsonFileStorage(StorageContract, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.dir, 'test-cache.json')
+        self.vault = FiggyVault(keychain_enabled=False)
+
+    def storage(self) -> JsonFileStorage:
+        return JsonFileStorage(self.path, vault=self.vault)
+
+    def stored_entries(self):
+        with open(self.path, 'rb') as file:
+            return json.loads(file.read().decode('utf-8'))['entries']
+
+    def test_entries_are_encrypted_individually(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        self.storage().write('kms', entry({'app': 'key-id'}))
+        before = self.stored_entries()
+        self.storage().write('kms', entry({'app': 'other-key-id'}))
+
+        after = self.stored_entries()
+        self.assertEqual(before['names'], after['names'])
+        self.assertNotEqual(before['kms'], after['kms'])
+        self.assertNotIn('/app/svc/a', json.dumps(after))
+
+    def test_unchanged_entry_is_decrypted_once(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        storage = self.storage()
+
+        with mock.patch.object(self.vault, 'decrypt', wraps=self.vault.decrypt) as decrypt:
+            for _ in range(3):
+                self.assertEqual(entry(['/app/svc/a']), storage.read('names'))
+
+        self.assertEqual(1, decrypt.call_count)
+
+    def test_legacy_encrypted_file_is_converted(self):
+        legacy = {'names': entry(['/app/svc/a']), 'kms': entry({'app': 'key-id'})}
+        with open(self.path, 'wb') as file:
+            file.write(self.vault.encrypt(jsonpickle.dumps(legacy)))
+
+        self.assertEqual(entry(['/app/svc/a']), self.storage().read('names'))
+        self.storage().write('names', entry(['/app/svc/b']))
+
+        self.assertEqual({'names', 'kms'}, set(self.stored_entries()))
+        self.assertEqual(entry({'app': 'key-id'}), self.storage().read('kms'))
+
+
+class TestSqliteStorage(StorageContract, unittest.TestCase):
+
+    def storage(self) -> SqliteStorage:
+        return SqliteStorage(os.path.join(self.dir, 'test-cache.db'))
+
+    def last_access(self, cache_key: str) -> int:
+        with sqlite3.connect(os.path.join(self.dir, 'test-cache.db')) as conn:
+            return conn.execute(f'SELECT last_access FROM {SqliteStorage._TABLE} WHERE cache_key = ?',
+                                (cache_key,)).fetchone()[0]
+
+    def forget_access(self) -> None:
+        with sqlite3.connect(os.path.join(self.dir, 'test-cache.db')) as conn:
+            conn.execute(f'UPDATE {SqliteStorage._TABLE} SET last_access = 0')
+
+    def test_reads_defer_access_times(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        self.forget_access()
+
+        storage = self.storage()
+        with mock.patch('atexit.register'):
+            storage.read('names')
+        self.assertEqual(0, self.last_access('names'))
+
+        storage.flush_access()
+        self.assertGreater(self.last_access('names'), 0)
+
+    def test_access_times_are_written_by_the_next_session(self):
+        self.storage().write('names', entry(['/app/svc/a']))
+        self.forget_access()
+
+        storage = self.storage()
+        with mock.patch('atexit.register'):
+            storage.read('names')
+        with storage.session() as session:
+            session.write('kms', entry({'app': 'key-id'}))
+
+        self.assertGreater(self.last_access('names'), 0)
+
+    def test_for_cache_removes_legacy_json_file(self):
+        for file_name in ['config-cache.json', 'config-cache.json.lock', 'usage-cache.json']:
+            with open(os.path.join(self.dir, file_name), 'w') as file:
+                file.write('{}')
+
+        with mock.patch('figcli.svcs.cache.storage.CACHE_OTHER_DIR', self.dir):
+            storage = SqliteStorage.for_cache('config')
+            SqliteStorage.for_cache('config')
+
+        self.assertEqual(os.path.join(self.dir, 'config-cache.db'), storage.path)
+        self.assertEqual(['usage-cache.json'], os.listdir(self.dir))
+
+    def test_corrupt_database_is_recreated(self):
+        with open(os.path.join(self.dir, 'test-cache.db'), 'wb') as file:
+            file.write(b'not a sqlite database' * 100)
+
+        storage = self.storage()
+        self.assertIsNone(storage.read('names'))
+        storage.write('names', entry(['/app/svc/a']))
+        self.assertEqual(entry(['/app/svc/a']), self.storage().read('names'))
+
+    def test_expire(self):
+        storage = self.storage()
+        storage.write('old', entry(['/app/svc/a'], last_write=10))
+        storage.write('new', entry(['/app/svc/b'], last_write=30))
+
+        self.assertEqual(1, storage.expire(written_before=20))
+        self.assertEqual(['new'], storage.keys())
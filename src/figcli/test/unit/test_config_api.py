@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from flask import Flask
+
+from figcli.models.name_set_delta import NameSetDelta
+from figcli.ui.api.config import ConfigController
+
+
+class FakeConfigService:
+    def __init__(self):
+        self.requested = []
+        self.names, self.version = {'/app/svc/a', '/app/svc/b', '/shared/x'}, 'token-1'
+
+    def get_figs(self, names):
+        self.requested.append(names)
+        return iter([])
+
+    def get_parameter_names_with_version(self):
+        return self.names, self.version
+
+    def get_parameter_names_since(self, version):
+        return NameSetDelta(version='token-2', added=['/app/svc/c', '/shared/y'], deleted=[])
+
+
+class TestGetConfigNames(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.cfg = FakeConfigService()
+        self.controller = object.__new__(ConfigController)
+        self.controller._cfg = lambda refresh=False: self.cfg
+
+    def get(self, query: str = '', etag: str = None):
+        headers = {'If-None-Match': f'"{etag}"'} if etag else {}
+        with self.app.test_request_context(f'/names{query}', headers=headers):
+            return self.controller.get_config_names()
+
+    def test_names_and_etag_share_a_version(self):
+        response = self.get('?filter=svc')
+        data = json.loads(response.get_data())['data']
+
+        self.assertEqual({'names': ['/app/svc/a', '/app/svc/b'], 'version': 'token-1'}, data)
+        self.assertTrue(response.get_etag()[0].startswith('token-1-'))
+        self.assertEqual(304, self.get('?filter=svc', etag=response.get_etag()[0]).status_code)
+
+    def test_delta_is_tagged_with_its_own_version(self):
+        response = self.get('?since=token-1&filter=svc')
+        data = json.loads(response.get_data())['data']
+
+        self.assertEqual(['/app/svc/c'], data['added'])
+        self.assertTrue(response.get_etag()[0].startswith('token-2-'))
+
+
+class TestGetFigs(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.cfg = FakeConfigService()
+        self.controller = object.__new__(ConfigController)
+        self.controller._cfg = lambda refresh=False: self.cfg
+
+    def post(self, **kwargs):
+        with self.app.test_request_context('/figs', method='POST', **kwargs):
+            return self.controller.get_figs()
+
+    def test_bad_bodies_are_rejected(self):
+        bodies = {
+            'missing': {},
+            'not json': {'data': 'names=/app/svc/a', 'content_type': 'text/plain'},
+            'not an object': {'json': ['/app/svc/a']},
+            'names not a list': {'json': {'names': '/app/svc/a'}},
+            'names not strings': {'json': {'names': [1, 2]}},
+        }
+        for body, kwargs in bodies.items():
+            with self.subTest(body=body):
+                self.assertEqual(400, self.post(**kwargs).status_code)
+
+        self.assertEqual([], self.cfg.requested)
+
+    def test_names_are_looked_up(self):
+        self.assertEqual(200, self.post(json={'names': ['/app/svc/a']}).status_code)
+        self.assertEqual([['/app/svc/a']], self.cfg.requested)
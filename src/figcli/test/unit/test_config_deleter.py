@@ -0,0 +1,63 @@
+import unittest
+from types import SimpleNamespace
+from typing import List
+
+from figcli.svcs.config_deleter import ConfigDeleter
+
+
+def repl_config(destination: str, source: str, namespace: str):
+    return SimpleNamespace(destination=destination, source=source, namespace=namespace, user='alice')
+
+
+class FakeConfigService:
+    def __init__(self, sources: List[str], destinations: List[str]):
+        self.sources, self.destinations = set(sources), set(destinations)
+
+    def classify_replication(self, names):
+        names = set(names)
+        return names & self.sources, names & self.destinations
+
+
+class FakeRepl:
+    def __init__(self, configs: List):
+        self.configs = configs
+        self.calls = []
+
+    def get_cfgs_by_src(self, name):
+        self.calls.append(('get_cfgs_by_src', name))
+        return [cfg for cfg in self.configs if cfg.source == name]
+
+    def get_config_repl(self, name):
+        self.calls.append(('get_config_repl', name))
+        return next((cfg for cfg in self.configs if cfg.destination == name), None)
+
+    def get_all_configs(self, namespace):
+        self.calls.append(('get_all_configs', namespace))
+        return [cfg for cfg in self.configs if cfg.namespace == namespace]
+
+
+class TestConfigDeleterPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.repl = FakeRepl([repl_config('/app/svc/replicated/x', '/shared/x', '/app/svc/'),
+                              repl_config('/app/svc/replicated/y', '/shared/y', '/app/svc/'),
+                              repl_config('/legacy/dest', '/shared/z', '/legacy/')])
+
+    def test_plan_only_looks_up_indexed_names(self):
+        cfg_svc = FakeConfigService(sources=['/shared/x'], destinations=['/app/svc/replicated/x', '/legacy/dest'])
+        names = ['/shared/x', '/app/svc/replicated/x', '/legacy/dest', '/app/svc/a', '/app/svc/b']
+        plan = ConfigDeleter(None, self.repl, cfg_svc).plan(names)
+
+        self.assertEqual(['/shared/x'], list(plan.sources))
+        self.assertEqual({'/app/svc/replicated/x', '/legacy/dest'}, set(plan.destinations))
+        self.assertEqual(['/app/svc/a', '/app/svc/b'], plan.plain)
+        self.assertEqual([('get_cfgs_by_src', '/shared/x'), ('get_config_repl', '/legacy/dest'),
+                          ('get_all_configs', '/app/svc/')], self.repl.calls)
+
+    def test_stale_index_entries_are_plain(self):
+        cfg_svc = FakeConfigService(sources=['/app/svc/a'], destinations=['/app/svc/b'])
+        plan = ConfigDeleter(None, self.repl, cfg_svc).plan(['/app/svc/a', '/app/svc/b'])
+
+        self.assertEqual({}, plan.sources)
+        self.assertEqual({}, plan.destinations)
+        self.assertEqual(['/app/svc/a', '/app/svc/b'], plan.plain)
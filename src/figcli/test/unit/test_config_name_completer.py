@@ -0,0 +1,33 @@
+import unittest
+from itertools import islice
+from unittest import mock
+
+from prompt_toolkit.document import Document
+
+from figcli.io.config_name_completer import ConfigNameCompleter
+
+NAMES = ['/app/svc/key', '/app/svc/other-key', '/app/keys/a', '/shared/key-x', '/shared/monkey', '/key/root']
+
+
+class TestConfigNameCompleter(unittest.TestCase):
+
+    def setUp(self):
+        self.completer = ConfigNameCompleter(NAMES, max_completions=3)
+
+    def test_matches_are_ranked(self):
+        self.assertEqual(['/app/keys/a', '/app/svc/key', '/key/root', '/shared/key-x',
+                          '/app/svc/other-key', '/shared/monkey'], list(self.completer.matches('key')))
+        self.assertEqual(['/shared/key-x', '/shared/monkey'], list(self.completer.matches('/shared/')))
+
+    def test_absolute_text_matches_segment_starts(self):
+        self.assertEqual(['/key/root', '/app/keys/a', '/app/svc/key', '/shared/key-x'],
+                         list(self.completer.matches('/key')))
+
+    def test_completions_stop_at_the_cap(self):
+        completions = list(self.completer.get_completions(Document('key'), None))
+        self.assertEqual(['/app/keys/a', '/app/svc/key', '/key/root'], [c.text for c in completions])
+
+        with mock.patch.object(self.completer._index, 'iter_search', wraps=self.completer._index.iter_search) as search:
+            list(islice(self.completer.matches('key'), 3))
+
+        self.assertEqual([mock.call('/key')], search.call_args_list)
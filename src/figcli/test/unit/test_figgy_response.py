@@ -0,0 +1,17 @@
+import json
+import unittest
+
+from figcli.ui.models.config_node_table import ConfigNodeTable
+from figcli.ui.models.figgy_response import FiggyResponse
+
+
+class TestFiggyResponse(unittest.TestCase):
+
+    def test_encode_data_matches_json(self):
+        table = ConfigNodeTable.build(['/app/foo/bar', '/app/foo/baz', '/shared/qux'])
+        encoded = FiggyResponse.encode_data(table.to_json())
+
+        self.assertEqual(json.loads(FiggyResponse(data=table.to_dict()).json()), json.loads(encoded))
+
+    def test_encode_data_keeps_data_as_is(self):
+        self.assertEqual(b'{"data":[1,2],"status_code":null,"error":null}', FiggyResponse.encode_data(b'[1,2]'))
@@ -0,0 +1,16 @@
+import importlib
+import unittest
+
+
+class TestImports(unittest.TestCase):
+    """
+    Every `figgy` command builds its command through the CommandFactory, so a module that fails to import breaks
+    the whole CLI at startup.
+    """
+
+    def test_command_factory_imports(self):
+        importlib.import_module('figcli.commands.command_factory')
+
+    def test_list_command_imports(self):
+        module = importlib.import_module('figcli.commands.config.list')
+        self.assertTrue(issubclass(module.List, module.ConfigCommand))
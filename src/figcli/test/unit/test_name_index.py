@@ -0,0 +1,63 @@
+import unittest
+
+from figcli.svcs.cache.name_index import NameIndex
+
+NAMES = ['/app/svc/a', '/app/svc/b', '/app/svc/nested/c', '/app/other/d', '/shared/x', '/shared/yz']
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = NameIndex(NAMES)
+
+    def test_contains(self):
+        self.assertEqual(len(NAMES), len(self.index))
+        self.assertIn('/app/svc/a', self.index)
+        self.assertNotIn('/app/svc', self.index)
+
+    def test_prefix(self):
+        self.assertEqual(['/app/svc/a', '/app/svc/b', '/app/svc/nested/c'], self.index.prefix('/app/svc/'))
+        self.assertEqual([], self.index.prefix('/missing'))
+
+    def test_children(self):
+        self.assertEqual(['/app/svc/a', '/app/svc/b'], self.index.children('/app/svc'))
+        self.assertEqual([], self.index.children('/app'))
+
+    def test_child_nodes(self):
+        self.assertEqual({'/app/svc/a': False, '/app/svc/b': False, '/app/svc/nested': True},
+                         self.index.child_nodes('/app/svc'))
+        self.assertEqual({'/app/other': True, '/app/svc': True}, self.index.child_nodes('/app/'))
+
+    def test_has_descendants(self):
+        self.assertTrue(self.index.has_descendants('/app/svc'))
+        self.assertFalse(self.index.has_descendants('/app/svc/a'))
+
+    def test_root_namespaces(self):
+        self.assertEqual(['/app', '/shared'], self.index.root_namespaces())
+
+    def test_search(self):
+        for query in ['svc', 'yz', '/app/svc/n', 'x', 'pp/ot', '']:
+            with self.subTest(query=query):
+                self.assertEqual(sorted(name for name in NAMES if query in name), self.index.search(query))
+
+    def test_iter_search_sparse_and_dense(self):
+        names = [f'/app/svc{i % 10}/key{i}' for i in range(200)] + ['/shared/rare-key']
+        index = NameIndex(names)
+        for query in ['rare', 'svc', 'svc3/key13', 'key1']:
+            with self.subTest(query=query):
+                self.assertEqual(sorted(name for name in names if query in name), list(index.iter_search(query)))
+
+    def test_update(self):
+        self.index.prepare_search()
+        self.index.update(added=['/app/svc/zz', '/app/svc/a'], deleted=['/shared/yz', '/missing'])
+
+        self.assertEqual(sorted(set(NAMES) - {'/shared/yz'} | {'/app/svc/zz'}), self.index.names)
+        self.assertEqual(['/app/svc/zz'], self.index.search('zz'))
+        self.assertEqual([], self.index.search('yz'))
+
+    def test_reset(self):
+        self.index.prepare_search()
+        self.index.reset(['/new/name'])
+
+        self.assertEqual(['/new/name'], self.index.names)
+        self.assertEqual(['/new/name'], self.index.search('name'))
@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from figcli.svcs.cache.name_store import NameStore
+
+NAMES = ['/app/svc/a', '/app/svc/b', '/app/svc/nested/c', '/app/other/d', '/shared/x', '/shared/yz']
+
+
+class TestNameStore(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'names.store')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_empty_store(self):
+        self.assertEqual((0, set()), NameStore(self.path).get())
+        self.assertEqual(0, NameStore(self.path).last_refresh())
+
+    def test_write_and_read(self):
+        NameStore(self.path).write(NAMES)
+        last_write, names = NameStore(self.path).get()
+
+        self.assertEqual(set(NAMES), names)
+        self.assertGreater(last_write, 0)
+        self.assertEqual(last_write, NameStore(self.path).last_refresh())
+
+    def test_apply_deltas(self):
+        store = NameStore(self.path)
+        store.write(NAMES)
+        store.apply({'/app/svc/new'}, {'/shared/x'})
+        store.apply({'/shared/x'}, {'/app/svc/a', '/app/svc/new'})
+
+        expected = set(NAMES) - {'/app/svc/a'}
+        self.assertEqual(expected, store.get()[1])
+        self.assertEqual(expected, NameStore(self.path).get()[1])
+
+    def test_apply_without_advancing_keeps_last_write(self):
+        store = NameStore(self.path)
+        store.write(NAMES)
+        last_write = store.get()[0]
+        store.apply({'/app/svc/new'}, set(), advance=False)
+
+        self.assertEqual((last_write, set(NAMES) | {'/app/svc/new'}), NameStore(self.path).get())
+
+    def test_apply_to_empty_store(self):
+        NameStore(self.path).apply({'/app/svc/new'}, set(), advance=False)
+        self.assertEqual(set(), NameStore(self.path).get()[1])
+
+        NameStore(self.path).apply({'/app/svc/new'}, set())
+        self.assertEqual({'/app/svc/new'}, NameStore(self.path).get()[1])
+
+    def test_deltas_are_compacted(self):
+        store = NameStore(self.path)
+        store.write(NAMES)
+        for i in range(NameStore._MAX_DELTAS + 2):
+            store.apply({f'/app/svc/n{i}'}, set())
+
+        expected = set(NAMES) | {f'/app/svc/n{i}' for i in range(NameStore._MAX_DELTAS + 2)}
+        self.assertEqual(expected, NameStore(self.path).get()[1])
+
+        store.compact()
+        self.assertEqual(expected, NameStore(self.path).get()[1])
+
+    def test_corrupt_store_reads_as_empty(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'not a name store')
+
+        self.assertEqual((0, set()), NameStore(self.path).get())
+
+    def test_wipe(self):
+        store = NameStore(self.path)
+        store.write(NAMES)
+        store.wipe()
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual((0, set()), store.get())
+
+    def test_touch_advances_last_write(self):
+        store = NameStore(self.path)
+        store.write(NAMES)
+        store.apply({'/app/svc/new'}, set())
+        last_write, names = store.get()
+        time.sleep(0.002)
+        store.touch()
+
+        touched_at, touched_names = NameStore(self.path).get()
+        self.assertGreater(touched_at, last_write)
+        self.assertEqual(names, touched_names)
+        self.assertEqual((touched_at, names), store.get())
+
+    def test_touch_leaves_empty_store_empty(self):
+        NameStore(self.path).touch()
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from typing import List
+
+from figgy.models.run_env import RunEnv
+
+from figcli.commands.config.sync import Sync
+from figcli.models.sync_plan import SyncAction, SyncOperation, SyncPlan
+from figcli.test.unit.test_sync_snapshot import FakeRepl, FakeSsm, repl_config
+
+
+class FakeReplWriter(FakeRepl):
+    """
+    FakeRepl that also records the replication configs `sync` stores.
+    """
+
+    def __init__(self, configs: List = ()):
+        super().__init__(configs)
+        self.stored = []
+
+    def put_config_repl(self, config) -> None:
+        self.stored.append(config)
+
+
+class FakeConfigService:
+    def __init__(self):
+        self.recorded = []
+
+    def record_replication_configs(self, configs) -> None:
+        self.recorded.extend(configs)
+
+
+class TestSyncPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.plan_path = os.path.join(self.dir, 'plan.json')
+        self.ssm = FakeSsm(['/app/svc/a', '/shared/x'])
+        self.repl = FakeReplWriter([repl_config('/app/svc/replicated/y', '/shared/y', '/app/svc/')])
+        self.cfg_svc = FakeConfigService()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def sync(self, plan_path: str = None, apply_path: str = None) -> Sync:
+        context = SimpleNamespace(run_env=RunEnv(env='dev'), role=None, resource='config',
+                                  ci_config_path=os.path.join(self.dir, 'figgy.json'), replication_only=False,
+                                  plan_path=plan_path, apply_path=apply_path)
+        return Sync(self.ssm, None, self.repl, False, context, None, None, self.cfg_svc)
+
+    def write_plan(self) -> SyncPlan:
+        sync = self.sync(plan_path=self.plan_path)
+        sync._snapshot.load(['/app/svc/'], ['/shared/x'])
+        sync._planned.append(SyncOperation(action=SyncAction.PUT_REPLICATION, name='/app/svc/replicated/x',
+                                           source='/shared/x', namespace='/app/svc/', replication_type='app'))
+        sync.write_plan()
+        return SyncPlan.parse_file(self.plan_path)
+
+    def test_plan_round_trip(self):
+        plan = SyncPlan(env='dev', namespaces=['/app/svc/'], names=['/shared/x'], snapshot_hash='abc',
+                        operations=[SyncOperation(action=SyncAction.ADD_FIG, name='/app/svc/a'),
+                                    SyncOperation(action=SyncAction.PUT_REPLICATION, name='/app/svc/replicated/x',
+                                                  source='/shared/x', namespace='/app/svc/',
+                                                  replication_type='app')])
+
+        self.assertEqual(plan, SyncPlan.parse_raw(plan.json(indent=2)))
+
+    def test_write_plan_records_snapshot(self):
+        plan = self.write_plan()
+
+        self.assertEqual('dev', plan.env)
+        self.assertEqual(['/app/svc/'], plan.namespaces)
+        self.assertEqual(['/shared/x'], plan.names)
+        self.assertEqual(['/app/svc/replicated/x'], [op.name for op in plan.operations])
+        self.assertEqual(64, len(plan.snapshot_hash))
+
+    def test_apply_unchanged_plan(self):
+        self.write_plan()
+        self.sync(apply_path=self.plan_path).run_apply()
+
+        self.assertEqual([('/app/svc/replicated/x', '/shared/x')],
+                         [(cfg.destination, cfg.source) for cfg in self.repl.stored])
+        self.assertEqual(self.repl.stored, self.cfg_svc.recorded)
+
+    def test_apply_refuses_plan_after_remote_change(self):
+        self.write_plan()
+        self.ssm.names.add('/app/svc/added-since')
+
+        with self.assertRaises(SystemExit):
+            self.sync(apply_path=self.plan_path).run_apply()
+
+        self.assertEqual([], self.repl.stored)
+
+    def test_apply_refuses_plan_for_other_env(self):
+        plan = self.write_plan()
+        plan.env = 'prod'
+        with open(self.plan_path, 'w') as file:
+            file.write(plan.json())
+
+        with self.assertRaises(SystemExit):
+            self.sync(apply_path=self.plan_path).run_apply()
+
+        self.assertEqual([], self.repl.stored)
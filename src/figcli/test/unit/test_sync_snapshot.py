@@ -0,0 +1,130 @@
+import unittest
+from types import SimpleNamespace
+from typing import Dict, List
+
+from botocore.exceptions import ClientError
+
+from figcli.svcs.sync_snapshot import SyncSnapshot
+
+
+def repl_config(destination: str, source: str, namespace: str, type: str = 'app', user: str = 'alice'):
+    return SimpleNamespace(destination=destination, source=source, namespace=namespace, type=type, user=user)
+
+
+class FakeSsm:
+    """
+    Stands in for SsmDao, backed by a set of parameter names.
+    """
+
+    def __init__(self, names: List[str], denied: List[str] = ()):
+        self.names = set(names)
+        self.denied = set(denied)
+        self.described: List[str] = []
+        self.batches: List[List[str]] = []
+
+    def get_all_parameters(self, paths: List[str]) -> List[Dict]:
+        self.described.extend(paths)
+        return [{'Name': name} for name in sorted(self.names) if any(name.startswith(path) for path in paths)]
+
+    def get_parameter_values(self, names: List[str], decrypt: bool = True) -> List[Dict]:
+        self.batches.append(list(names))
+        if self.denied.intersection(names):
+            raise ClientError({'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}}, 'GetParameters')
+
+        return [{'Name': name} for name in names if name in self.names]
+
+
+class FakeRepl:
+    """
+    Stands in for ReplicationDao, backed by a list of replication configs.
+    """
+
+    def __init__(self, configs: List = ()):
+        self.configs = list(configs)
+        self.loaded: List[str] = []
+
+    def get_all_configs(self, namespace: str) -> List:
+        self.loaded.append(namespace)
+        return [cfg for cfg in self.configs if cfg.namespace == namespace]
+
+
+class TestSyncSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.ssm = FakeSsm(['/app/svc/a', '/app/svc/b', '/app/other/c', '/shared/x', '/shared/y'])
+        self.repl = FakeRepl([repl_config('/app/svc/replicated/x', '/shared/x', '/app/svc/'),
+                              repl_config('/app/other/replicated/y', '/shared/y', '/app/other/')])
+
+    def snapshot(self, ssm: FakeSsm = None, repl: FakeRepl = None) -> SyncSnapshot:
+        return SyncSnapshot(ssm or self.ssm, repl or self.repl, max_workers=2)
+
+    def test_load_reads_namespaces_and_checks_other_names(self):
+        snapshot = self.snapshot().load(['/app/svc/'], ['/shared/x', '/shared/missing', '/app/svc/a'])
+
+        self.assertEqual({'/app/svc/a', '/app/svc/b'}, snapshot.names_under('/app/svc/'))
+        self.assertEqual(['/shared/missing', '/shared/x'], snapshot.checked_names)
+        self.assertTrue(snapshot.exists('/shared/x'))
+        self.assertFalse(snapshot.exists('/shared/missing'))
+        self.assertEqual(['/app/svc/replicated/x'], [cfg.destination for cfg in snapshot.configs_under('/app/svc/')])
+        self.assertIsNone(snapshot.replication_config('/app/other/replicated/y'))
+
+    def test_load_skips_what_is_already_loaded(self):
+        snapshot = self.snapshot().load(['/app/svc/'], ['/shared/x'])
+        snapshot.load(['/app/svc/', '/app/other/'], ['/shared/x', '/app/svc/a'])
+
+        self.assertEqual(['/app/svc/', '/app/other/'], self.ssm.described)
+        self.assertEqual(['/app/svc/', '/app/other/'], self.repl.loaded)
+        self.assertEqual([['/shared/x']], self.ssm.batches)
+
+    def test_denied_names_are_checked_one_at_a_time(self):
+        ssm = FakeSsm(['/shared/x', '/shared/secret'], denied=['/shared/secret'])
+        snapshot = self.snapshot(ssm=ssm).load([], ['/shared/x', '/shared/secret'])
+
+        self.assertTrue(snapshot.exists('/shared/x'))
+        self.assertFalse(snapshot.exists('/shared/secret'))
+        self.assertTrue(snapshot.is_denied('/shared/secret'))
+
+    def test_exists_checks_unknown_names_lazily(self):
+        snapshot = self.snapshot().load(['/app/svc/'])
+
+        self.assertTrue(snapshot.exists('/shared/y'))
+        self.assertTrue(snapshot.exists('/shared/y'))
+        self.assertEqual([['/shared/y']], self.ssm.batches)
+
+    def test_digest_is_stable_for_unchanged_state(self):
+        first = self.snapshot().load(['/app/svc/'], ['/shared/x'])
+        second = self.snapshot().load(['/app/svc/'], ['/shared/x'])
+
+        self.assertEqual(first.digest(), second.digest())
+
+    def test_digest_changes_with_names(self):
+        before = self.snapshot().load(['/app/svc/'], ['/shared/x']).digest()
+        self.ssm.names.add('/app/svc/new')
+
+        self.assertNotEqual(before, self.snapshot().load(['/app/svc/'], ['/shared/x']).digest())
+
+    def test_digest_changes_with_replication_configs(self):
+        before = self.snapshot().load(['/app/svc/']).digest()
+
+        changes = {
+            'source': repl_config('/app/svc/replicated/x', '/shared/y', '/app/svc/'),
+            'type': repl_config('/app/svc/replicated/x', '/shared/x', '/app/svc/', type='merge'),
+        }
+        for change, config in changes.items():
+            with self.subTest(change=change):
+                repl = FakeRepl([config])
+                self.assertNotEqual(before, self.snapshot(repl=repl).load(['/app/svc/']).digest())
+
+    def test_digest_ignores_config_user(self):
+        before = self.snapshot().load(['/app/svc/']).digest()
+        repl = FakeRepl([repl_config('/app/svc/replicated/x', '/shared/x', '/app/svc/', user='bob')])
+
+        self.assertEqual(before, self.snapshot(repl=repl).load(['/app/svc/']).digest())
+
+    def test_put_config_is_visible_without_reloading(self):
+        snapshot = self.snapshot().load(['/app/svc/'])
+        config = repl_config('/app/svc/replicated/y', '/shared/y', '/app/svc/')
+        snapshot.put_config(config)
+
+        self.assertIs(config, snapshot.replication_config('/app/svc/replicated/y'))
+        self.assertEqual(['/app/svc/'], self.repl.loaded)
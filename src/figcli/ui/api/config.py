@@ -1,15 +1,19 @@
+import hashlib
 import logging
 from abc import ABC
 from typing import Dict, Union, List
 
 from figgy.models.fig import Fig
 from figgy.models.replication_config import ReplicationConfig
-from flask import request
+from flask import request, Response
 
 from figcli.commands.command_context import CommandContext
+from figcli.models.fig_lookup import FigLookup
 from figcli.svcs.service_registry import ServiceRegistry
 from figcli.ui.controller import Controller
+from figcli.ui.exceptions import BadRequestParameters
 from figcli.ui.models.config_orchard import ConfigOrchard
+from figcli.ui.models.config_tree_node import ConfigTreeNode
 from figcli.ui.models.figgy_response import FiggyResponse
 from figcli.ui.route import Route
 
@@ -25,8 +29,10 @@ class ConfigController(Controller, ABC):
         self._routes.append(Route('', self.get_config, ["GET"]))
         self._routes.append(Route('', self.save_fig, ["POST"]))
         self._routes.append(Route('', self.delete_fig, ["DELETE"]))
+        self._routes.append(Route('/figs', self.get_figs, ["POST"]))
         self._routes.append(Route('/names', self.get_config_names, ["GET"]))
         self._routes.append(Route('/tree', self.get_browse_tree, ["GET"]))
+        self._routes.append(Route('/tree/children', self.get_browse_tree_children, ["GET"]))
         self._routes.append(Route('/isEncrypted', self.is_encrypted, ["GET"]))
         self._routes.append(Route('/isReplDest', self.is_repl_dest, ["GET"]))
         self._routes.append(Route('/isReplSource', self.is_repl_source, ["GET"]))
@@ -38,17 +44,55 @@ class ConfigController(Controller, ABC):
         self._routes.append(Route('/decrypt', self.decrypt, ["POST"]))
 
     @Controller.build_response
-    def get_config_names(self, refresh: bool = False) -> dict[str, list[str]]:
+    def get_config_names(self, refresh: bool = False) -> Response:
+        """
+        Returns all names & the version of the name set they came from. If `since` is set to a version a client
+        already holds, only the names added & deleted since then are returned, or `full_resync` if that's no longer
+        possible.
+        """
         req_filter = self.get_param('filter', required=False)
-        if req_filter:
-            return {'names': list(self._cfg(refresh).get_parameter_names_by_filter(req_filter))}
-        else:
-            return {'names': list(self._cfg(refresh).get_parameter_names())}
+        since = self.get_param('since', required=False)
+        cfg = self._cfg(refresh)
+        variant = hashlib.sha1(f'{req_filter}|{since}'.encode('utf-8')).hexdigest()[:8]
+
+        if since:
+            delta = cfg.get_parameter_names_since(since)
+            if req_filter:
+                delta.added = [name for name in delta.added if req_filter in name]
+                delta.deleted = [name for name in delta.deleted if req_filter in name]
+
+            return Controller.conditional(f'{delta.version}-{variant}', lambda: delta)
+
+        # The ETag and `version` must describe exactly the names returned, so both come from one atomic read.
+        all_names, version = cfg.get_parameter_names_with_version()
+
+        def names():
+            if req_filter:
+                return {'names': sorted(name for name in all_names if req_filter in name), 'version': version}
+            else:
+                return {'names': list(all_names), 'version': version}
+
+        return Controller.conditional(f'{version}-{variant}', names)
 
     @Controller.build_response
-    def get_browse_tree(self, refresh: bool = False) -> ConfigOrchard:
-        tree = self._cfg_view(refresh).get_config_orchard()
-        return tree
+    def get_browse_tree(self, refresh: bool = False) -> Response:
+        tree_format = self.get_param('format', required=False)
+        view = self._cfg_view(refresh)
+        etag = f'{view.names_version()}-{"compact" if tree_format == "compact" else "orchard"}'
+
+        def tree() -> Union[ConfigOrchard, Response]:
+            if tree_format == 'compact':
+                table = view.get_config_node_table()
+                return Response(FiggyResponse.encode_data(table.to_json()), content_type=Controller.JSON_CONTENT_TYPE)
+
+            return view.get_config_orchard()
+
+        return Controller.conditional(etag, tree)
+
+    @Controller.build_response
+    def get_browse_tree_children(self, refresh: bool = False) -> List[ConfigTreeNode]:
+        prefix = self.get_param('prefix', required=False)
+        return self._cfg_view(refresh).get_config_tree_children(prefix)
 
     @Controller.build_response
     def get_config(self, refresh: bool = False) -> Union[Fig, FiggyResponse]:
@@ -68,6 +112,19 @@ class ConfigController(Controller, ABC):
         else:
             return fig
 
+    @Controller.build_response
+    def get_figs(self, refresh: bool = False) -> List[FigLookup]:
+        """
+        Looks up many figs at once from a payload of {"names": [...]}. Each result reports whether its fig was found,
+        missing, or could not be read or decrypted.
+        """
+        payload = request.get_json(silent=True)
+        names = payload.get('names') if isinstance(payload, dict) else None
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            raise BadRequestParameters(f'Expected a JSON body of {{"names": [...]}}, got: {payload}', ['names'])
+
+        return list(self._cfg(refresh).get_figs(names))
+
     @Controller.build_response
     def is_encrypted(self, refresh: bool = False):
         name = self.get_param('name')
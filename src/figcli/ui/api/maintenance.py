@@ -5,6 +5,7 @@ from typing import List
 from figgy.models.audit_log import AuditLog
 
 from figcli.commands.command_context import CommandContext
+from figcli.svcs.observability.cache_stats import CacheStats, CacheKeyStats
 from figcli.svcs.service_registry import ServiceRegistry
 from figcli.ui.controller import Controller
 from figcli.ui.models.paginated_response import PaginatedResponse
@@ -19,6 +20,7 @@ class MaintenanceController(Controller, ABC):
     def __init__(self, prefix: str, context: CommandContext, svc_registry: ServiceRegistry):
         super().__init__(prefix, context, svc_registry)
         self._routes.append(Route('/unrotated-secrets', self.get_unrotated_secrets, ["GET"]))
+        self._routes.append(Route('/cache-stats', self.get_cache_stats, ["GET"]))
 
     @Utils.trace
     @Controller.client_cache(seconds=5)
@@ -39,3 +41,13 @@ class MaintenanceController(Controller, ABC):
         total = len(matching_logs)
 
         return PaginatedResponse(data=sorted_page, total=total, page_size=size, page_number=page)
+
+    @Controller.build_response
+    def get_cache_stats(self, refresh: bool = False) -> List[CacheKeyStats]:
+        reset: bool = self.get_param('reset', default='false', required=False) == 'true'
+        stats = CacheStats.snapshot()
+
+        if reset:
+            CacheStats.reset()
+
+        return stats
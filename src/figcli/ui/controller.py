@@ -2,7 +2,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import List, Any
+from typing import List, Any, Callable
 
 import botocore
 from botocore.exceptions import ClientError
@@ -131,10 +131,28 @@ class Controller:
         if isinstance(result, FiggyResponse):
             return Response(result.json(), content_type=Controller.JSON_CONTENT_TYPE)
 
+        # Already encoded, e.g. payloads too large to serialize efficiently through pydantic
+        if isinstance(result, Response):
+            return result
+
         response = Response(FiggyResponse(data=result).json(), content_type=Controller.JSON_CONTENT_TYPE)
         # log.info(f"RETURNING RESPONSE: {response.data}")
         return response
 
+    @staticmethod
+    def conditional(etag: str, build: Callable[[], Any]) -> Response:
+        """
+        Supports conditional GETs. Returns 304 Not Modified if the client already holds the `etag` version of this
+        resource, otherwise builds the response and tags it with `etag`.
+        """
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Controller.handle_result(build())
+
+        response.set_etag(etag)
+        return response
+
     @staticmethod
     def build_response(method):
         """Builds a FiggyResponse from the current return type"""
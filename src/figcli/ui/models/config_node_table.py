@@ -0,0 +1,89 @@
+import json
+from typing import Iterable, Dict, List
+
+
+class ConfigNodeTable:
+    """
+    Compact encoding of the browse tree, an alternative to serializing a ConfigOrchard.
+
+    Rather than one object per node repeating its full, node & dir names, every node is a pair of integers in two
+    parallel arrays, and each distinct path segment is stored only once:
+
+        {
+            "format": "node-table-v1",
+            "segments": ["app", "foo", "bar"],  # Interned path segments
+            "parents": [-1, 0, 1],               # Index of each node's parent node, -1 for roots
+            "names": [0, 1, 2]                   # Index into `segments` of each node's name
+        }
+
+    Nodes are listed depth first and siblings are ordered like ConfigOrchard children (leaves first, then by
+    name), so a parent always precedes its children. A node's full name is '/' followed by its ancestors' names and
+    its own name joined by '/'. A node is a leaf if no other node references it as a parent.
+    """
+
+    FORMAT = 'node-table-v1'
+
+    def __init__(self, segments: List[str], parents: List[int], names: List[int]):
+        self.segments = segments
+        self.parents = parents
+        self.names = names
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    @staticmethod
+    def build(config_names: Iterable[str]) -> "ConfigNodeTable":
+        # full name -> full names of its children. The empty string is the parent of all roots.
+        tree: Dict[str, List[str]] = {'': []}
+
+        for name in config_names:
+            if not name.startswith('/') or name in tree:
+                continue
+
+            child, parent = name, name[:name.rfind('/')]
+            tree[child] = []
+            while True:
+                siblings = tree.get(parent)
+                if siblings is not None:
+                    siblings.append(child)
+                    break
+
+                tree[parent] = [child]
+                child, parent = parent, parent[:parent.rfind('/')]
+
+        segments, parents, names = [], [], []
+        segment_ids: Dict[str, int] = {}
+
+        def ordered(children: List[str]) -> List[str]:
+            return sorted(children, key=lambda c: (len(tree[c]) > 0, c[c.rfind('/') + 1:]))
+
+        # Depth first, with each stack entry being (parent node index, full name)
+        stack = [(-1, child) for child in reversed(ordered(tree['']))]
+        while stack:
+            parent_id, full_name = stack.pop()
+            segment = full_name[full_name.rfind('/') + 1:]
+            segment_id = segment_ids.get(segment)
+            if segment_id is None:
+                segment_id = segment_ids[segment] = len(segments)
+                segments.append(segment)
+
+            node_id = len(parents)
+            parents.append(parent_id)
+            names.append(segment_id)
+
+            children = tree[full_name]
+            if children:
+                stack.extend((node_id, child) for child in reversed(ordered(children)))
+
+        return ConfigNodeTable(segments, parents, names)
+
+    def to_dict(self) -> Dict:
+        return {
+            "format": self.FORMAT,
+            "segments": self.segments,
+            "parents": self.parents,
+            "names": self.names
+        }
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_dict(), separators=(',', ':')).encode('utf-8')
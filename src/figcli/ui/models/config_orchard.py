@@ -1,4 +1,4 @@
-from typing import List, Set
+from typing import List, Iterable, Dict
 
 from pydantic import BaseModel
 
@@ -12,35 +12,37 @@ class ConfigOrchard(BaseModel):
         self.trees.append(tree)
 
     @staticmethod
-    def build_orchard(config_names: Set[str]):
+    def build_orchard(config_names: Iterable[str]) -> "ConfigOrchard":
+        """
+        Builds the orchard in a single pass over the names. Each node is looked up by its full path, so every
+        directory is created once no matter how many names share it, and each node's children are only sorted once
+        the whole orchard is built.
+        """
         orchard: ConfigOrchard = ConfigOrchard()
-        root_nodes = set(["/" + x.split('/')[1] for x in config_names])
-        missing_dirs = set()
+        nodes: Dict[str, ConfigTreeData] = {}
 
-        # add all directories from the provided names as new names
-        for cfg_name in config_names:
+        for cfg_name in sorted(config_names):
             cfg_list = cfg_name.split("/")
-            for i in range(0, len(cfg_list)):
-                new_dir = "/".join(cfg_list[0:i])
-                missing_dirs.add(new_dir)
-
-        config_names = config_names | missing_dirs
-        for node in root_nodes:
-            data_node = ConfigTreeData(full_name=node)
-            orchard.trees.append(data_node)
-            children = set([x for x in config_names if x.startswith(data_node.full_name)])
-            orchard.add_children(data_node, children)
+            parent = None
+
+            # Walk /app, /app/foo, /app/foo/bar, ... creating any node that doesn't exist yet.
+            for i in range(2, len(cfg_list) + 1):
+                full_name = "/".join(cfg_list[0:i])
+                node = nodes.get(full_name)
+                if node is None:
+                    node = ConfigTreeData.of(full_name)
+                    nodes[full_name] = node
+                    if parent is None:
+                        orchard.add_tree(node)
+                    else:
+                        parent.add_child(node)
+
+                parent = node
+
+        for node in nodes.values():
+            if len(node.children) > 1:
+                node.children = sorted(node.children)
 
         orchard.trees = sorted(orchard.trees)
 
         return orchard
-
-    def add_children(self, node: ConfigTreeData, children: Set[str]):
-        for child in children:
-            parent_dir = "/".join(child.split("/")[:-1])
-            if parent_dir == node.full_name:
-                new_child = ConfigTreeData(full_name=child)
-                node.add_child(new_child)
-                new_children = set([x for x in children if x.startswith(new_child.full_name)])
-                self.add_children(new_child, new_children)
-                node.children = sorted(node.children)
@@ -16,6 +16,16 @@ class ConfigTreeData(BaseModel):
         self.dir_name = "/".join(full_name.split("/")[:-1]) + "/"
         self.children: List["ConfigTreeData"] = []
 
+    @classmethod
+    def of(cls, full_name: str) -> "ConfigTreeData":
+        """
+        Same as ConfigTreeData(full_name=full_name), minus validation. Used when building large trees from names we
+        already know are valid.
+        """
+        node_name = full_name[full_name.rfind("/") + 1:]
+        dir_name = full_name[:full_name.rfind("/") + 1] if "/" in full_name else "/"
+        return cls.construct(full_name=full_name, node_name=node_name, dir_name=dir_name, children=[])
+
     def add_child(self, child: "ConfigTreeData"):
         self.children.append(child)
 
@@ -0,0 +1,27 @@
+from typing import List, Dict
+
+from pydantic import BaseModel
+
+
+class ConfigTreeNode(BaseModel):
+    """
+    A single browse tree node without its children, used by the UI to load the tree one level at a time.
+    """
+    full_name: str
+    node_name: str
+    dir_name: str
+    has_children: bool = False
+
+    @staticmethod
+    def from_children(children: Dict[str, bool]) -> List["ConfigTreeNode"]:
+        """
+        :param children: Dict of full name -> whether the node has children, e.g. from NameIndex.child_nodes
+        :return: Nodes ordered like ConfigOrchard trees, leaves first, then by name.
+        """
+        nodes = [
+            ConfigTreeNode(full_name=name, node_name=name[name.rfind("/") + 1:],
+                           dir_name=name[:name.rfind("/") + 1], has_children=has_children)
+            for name, has_children in children.items()
+        ]
+
+        return sorted(nodes, key=lambda node: (node.has_children, node.node_name))
@@ -1,3 +1,4 @@
+import json
 from typing import Optional, Dict, Any, List
 
 from pydantic import BaseModel, validator
@@ -23,6 +24,17 @@ class FiggyResponse(BaseModel):
     def from_dict(item: Dict) -> "FiggyResponse":
         return FiggyResponse(data=item)
 
+    @staticmethod
+    def encode_data(data_json: bytes) -> bytes:
+        """
+        Same document as FiggyResponse(data=<data>).json() for `data` that is already encoded as json, so large
+        payloads don't need to be decoded again just to be wrapped.
+        """
+        fields = FiggyResponse(data=None).dict()
+        return b'{' + b','.join(json.dumps(field).encode('utf-8') + b':' +
+                                (data_json if field == 'data' else json.dumps(value).encode('utf-8'))
+                                for field, value in fields.items()) + b'}'
+
     @staticmethod
     def no_decrypt_access() -> "FiggyResponse":
         return FiggyResponse(error=FiggyError(**Error.KMS_DENIED))
@@ -11,6 +11,7 @@ import urllib3
 
 from collections import OrderedDict
 from json.decoder import JSONDecodeError
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from sys import exit
 from typing import Dict, List, Union, Optional, Any
@@ -75,6 +76,14 @@ class Utils:
     def millis_since_epoch():
         return int(time.time() * 1000)
 
+    @staticmethod
+    def thread_pool(max_threads: int, tasks: int) -> ThreadPool:
+        """
+        A ThreadPool with at most `max_threads` threads, and never more threads than `tasks`. Fan-out that may run from
+        within flask requests uses this rather than ThreadPoolExecutor, which has compatibility issues there.
+        """
+        return ThreadPool(processes=max(min(max_threads, tasks), 1))
+
     @staticmethod
     def get_os():
         return platform.system()
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import cachetools.func
@@ -6,14 +7,16 @@ from typing import List
 from cachetools import TTLCache, cached
 from figgy.data.dao.ssm import SsmDao
 from figgy.models.run_env import RunEnv
-from prompt_toolkit.completion import WordCompleter
 
 from figcli.config import *
+from figcli.io.config_name_completer import ConfigNameCompleter
 from figcli.models.kms_key import KmsKey
 from figcli.models.role import Role
 from figcli.svcs.cache_manager import CacheManager
 from figcli.svcs.config import ConfigService
+from figcli.ui.models.config_node_table import ConfigNodeTable
 from figcli.ui.models.config_orchard import ConfigOrchard
+from figcli.ui.models.config_tree_node import ConfigTreeNode
 from figcli.utils.utils import Utils
 
 log = logging.getLogger(__name__)
@@ -33,7 +36,6 @@ class RBACLimitedConfigView:
         self.rbac_role_ns_path = f'{figgy_ns}/rbac/{self._role.role}/namespaces'
         self.rbac_role_kms_path = f'{figgy_ns}/rbac/{self._role.role}/keys'
         self.rbac_profile_kms_keys_path = f'{figgy_ns}/rbac/profile/keys'
-        self._config_completer = None
         self._profile = profile
 
     @cachetools.func.ttl_cache(maxsize=5, ttl=500)
@@ -110,11 +112,15 @@ class RBACLimitedConfigView:
         es, key_id = self._cache_mgr.get_or_refresh(cache_key, self._ssm.get_parameter, key_path)
         return key_id
 
+    def __derived_key(self, view: str) -> str:
+        # Views derived from the name set depend on the namespaces this role may access, too.
+        return f'{self._role.role}-{view}-{",".join(self.get_authorized_namespaces())}'
+
     @Utils.trace
-    def get_config_names(self, prefix: str = None, one_level: bool = False) -> List[str]:
-        all_names = sorted(self._config_svc.get_parameter_names())
+    def get_config_names(self, prefix: str = None, one_level: bool = False,
+                         max_staleness: int = ConfigService.MEMORY_CACHE_REFRESH_INTERVAL) -> List[str]:
+        index = self._config_svc.get_name_index(max_staleness)
         authed_nses = self.get_authorized_namespaces()
-        new_names = [] if authed_nses or prefix else all_names
 
         if prefix:
             is_child = False
@@ -127,35 +133,67 @@ class RBACLimitedConfigView:
 
             authed_nses = [prefix]
 
-        for ns in authed_nses:
-            filtered_names = [name for name in all_names if name.startswith(ns)]
-            new_names = new_names + filtered_names
-
         if one_level:
-            if prefix:
-                new_names = [name for name in new_names if len(name.split('/')) == len(prefix.split('/')) + 1]
-            else:
-                new_names = authed_nses
+            return index.children(prefix) if prefix else authed_nses
+
+        def authorized_names() -> List[str]:
+            if not authed_nses:
+                return list(index.names)
 
-        return new_names
+            new_names = []
+            for ns in authed_nses:
+                new_names = new_names + index.prefix(ns)
+
+            return new_names
+
+        if prefix:
+            return authorized_names()
+
+        # The full list of authorized names is shared by most callers, only rebuild it when the name set changes.
+        return self._config_svc.get_or_derive(self.__derived_key('names'), authorized_names, max_staleness)
 
     @Utils.trace
-    def get_config_completer(self):
+    def get_config_completer(self) -> ConfigNameCompleter:
         """
         This is used to be a slow operation since it involves pulling all parameter names from Parameter Store.
         It's best to be lazy loaded only if the dependent command requires it. It's still best to be lazy loaded,
         but it is much faster now that we have implemented caching of existing parameter names in DynamoDb and
         locally.
         """
-        # Not the most efficient, but plenty fast since we know the # of authed_nses is gonna be ~<=5
-        # Tested at 30k params and it takes ~25ms
-        if not self._config_completer:
-            self._config_completer = WordCompleter(self.get_config_names(), sentence=True, match_middle=True)
+        def completer() -> ConfigNameCompleter:
+            return ConfigNameCompleter(self.get_config_names(max_staleness=ConfigService.INTERACTIVE_STALENESS))
 
-        # print(f"Cache Count: {len(all_names)}")
-        return self._config_completer
+        return self._config_svc.get_or_derive(self.__derived_key('completer'), completer,
+                                              ConfigService.INTERACTIVE_STALENESS)
 
     @Utils.trace
     def get_config_orchard(self) -> ConfigOrchard:
-        all_children = set(self.get_config_names())
-        return ConfigOrchard.build_orchard(all_children)
+        return self._config_svc.get_or_derive(self.__derived_key('orchard'),
+                                              lambda: ConfigOrchard.build_orchard(self.get_config_names()))
+
+    @Utils.trace
+    def get_config_node_table(self) -> ConfigNodeTable:
+        return self._config_svc.get_or_derive(self.__derived_key('node-table'),
+                                              lambda: ConfigNodeTable.build(self.get_config_names()))
+
+    def names_version(self) -> str:
+        """
+        :return: Version of the names visible through this view, changes whenever they may have changed.
+        """
+        namespaces = hashlib.sha1(self.__derived_key('').encode('utf-8')).hexdigest()[:8]
+        return f'{self._config_svc.names_version()}-{namespaces}'
+
+    @Utils.trace
+    def get_config_tree_children(self, prefix: str = None) -> List[ConfigTreeNode]:
+        """
+        :param prefix: Full name of the node to expand. Returns root nodes if unset.
+        :return: Nodes one level below `prefix` that are in, or lead to, an authorized namespace.
+        """
+        children = self._config_svc.get_name_index().child_nodes(prefix or '')
+        authed_nses = self.get_authorized_namespaces()
+
+        if authed_nses:
+            children = {child: has_children for child, has_children in children.items()
+                        if any(child.startswith(ns) or ns.startswith(f'{child}/') for ns in authed_nses)}
+
+        return ConfigTreeNode.from_children(children)